@@ -14,12 +14,38 @@ down_revision = '8754907c019f'
 branch_labels = None
 depends_on = None
 
+BACKFILL_BATCH_SIZE = 10000
+
+def _add_realized_profit(table):
+    """Add realized_profit with a 0.0 default, backfill any NULLs in batches, then make it NOT NULL"""
+    # A constant server default is a metadata-only change on PostgreSQL 11+, and it means
+    # rows inserted while the backfill runs get 0.0 instead of NULL
+    op.add_column(table, sa.Column('realized_profit', sa.Float(), nullable=True, server_default='0.0'))
+
+    # Each batch commits on its own so no single transaction locks the whole table
+    conn = op.get_bind()
+    with op.get_context().autocommit_block():
+        while True:
+            result = conn.execute(sa.text(
+                f"UPDATE {table} SET realized_profit = 0.0 "
+                f"WHERE id IN (SELECT id FROM {table} WHERE realized_profit IS NULL LIMIT :batch)"
+            ), {'batch': BACKFILL_BATCH_SIZE})
+            if result.rowcount == 0:
+                break
+
+    # Catch rows that were written with an explicit NULL after their batch. Writes are blocked
+    # from here until SET NOT NULL commits in the same transaction, so none can slip in between
+    conn.execute(sa.text(f"LOCK TABLE {table} IN SHARE ROW EXCLUSIVE MODE"))
+    conn.execute(sa.text(f"UPDATE {table} SET realized_profit = 0.0 WHERE realized_profit IS NULL"))
+    op.alter_column(table, 'realized_profit', existing_type=sa.Float(),
+                    nullable=False, existing_server_default='0.0')
+
 def upgrade():
     # Add realized_profit column to portfolios table
-    op.add_column('portfolios', sa.Column('realized_profit', sa.Float(), nullable=False, server_default='0.0'))
+    _add_realized_profit('portfolios')
 
     # Add realized_profit column to swap_transactions table
-    op.add_column('swap_transactions', sa.Column('realized_profit', sa.Float(), nullable=False, server_default='0.0'))
+    _add_realized_profit('swap_transactions')
 
     # Add missing columns to swap_transactions if they don't exist
     try:
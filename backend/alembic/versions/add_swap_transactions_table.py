@@ -35,7 +35,17 @@ def upgrade():
         sa.UniqueConstraint('transaction_id')
     )
 
+    # Indexes for swap history per user and pair reconciliation; the table is empty so no CONCURRENTLY
+    op.create_index('ix_swap_user_ts', 'swap_transactions', ['user_id', sa.text('timestamp DESC')])
+    op.create_index('ix_swap_from_to', 'swap_transactions', ['from_symbol', 'to_symbol'])
+    op.create_index('ix_swap_status', 'swap_transactions', ['status'],
+                    postgresql_where=sa.text("status != 'COMPLETED'"))
+
 
 def downgrade():
+    op.drop_index('ix_swap_status', table_name='swap_transactions')
+    op.drop_index('ix_swap_from_to', table_name='swap_transactions')
+    op.drop_index('ix_swap_user_ts', table_name='swap_transactions')
+
     # Drop the swap_transactions table
     op.drop_table('swap_transactions')
@@ -0,0 +1,32 @@
+"""Add indexes for newest-first trade listings
+
+Revision ID: add_trades_listing_index
+Revises: a1b2c3d4e5f6
+Create Date: 2024-06-01 10:00:00.000000
+
+"""
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = 'add_trades_listing_index'
+down_revision = 'a1b2c3d4e5f6'
+branch_labels = None
+depends_on = None
+
+def upgrade():
+    # Serve the unfiltered and symbol-filtered listings (ORDER BY created_at DESC, id DESC)
+    # as index range scans instead of a sort; a status filter is applied on top of either
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trades_created_id "
+            "ON trades(created_at DESC, id DESC)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trades_symbol_created "
+            "ON trades(symbol, created_at DESC, id DESC)"
+        )
+
+def downgrade():
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_trades_symbol_created")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_trades_created_id")
@@ -44,20 +44,31 @@ def upgrade():
         sa.ForeignKeyConstraint(['portfolio_id'], ['portfolios.id'], ondelete='SET NULL')
     )
 
-    # Create indexes
-    op.create_index('ix_portfolios_user_id', 'portfolios', ['user_id'])
-    op.create_index('ix_portfolios_symbol', 'portfolios', ['symbol'])
-    op.create_index('ix_transactions_user_id', 'transactions', ['user_id'])
-    op.create_index('ix_transactions_symbol', 'transactions', ['symbol'])
-    op.create_index('ix_transactions_portfolio_id', 'transactions', ['portfolio_id'])
+    # Create indexes without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_portfolios_user_id ON portfolios(user_id)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_portfolios_symbol ON portfolios(symbol)")
+        # Composite covering indexes for "user's transactions, newest first" (optionally per symbol)
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_user_ts "
+            "ON transactions(user_id, timestamp DESC) INCLUDE (price, quantity, total)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_user_symbol_ts "
+            "ON transactions(user_id, symbol, timestamp DESC) INCLUDE (price, quantity, total)"
+        )
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_symbol ON transactions(symbol)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_transactions_portfolio_id ON transactions(portfolio_id)")
 
 def downgrade():
     # Drop indexes
-    op.drop_index('ix_transactions_portfolio_id')
-    op.drop_index('ix_transactions_symbol')
-    op.drop_index('ix_transactions_user_id')
-    op.drop_index('ix_portfolios_symbol')
-    op.drop_index('ix_portfolios_user_id')
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_portfolio_id")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_symbol")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_user_symbol_ts")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_transactions_user_ts")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_portfolios_symbol")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_portfolios_user_id")
 
     # Drop tables
     op.drop_table('transactions')
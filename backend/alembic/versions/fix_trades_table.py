@@ -14,36 +14,18 @@ down_revision = 'create_portfolio_tables'
 branch_labels = None
 depends_on = None
 
-def upgrade():
-    # Drop existing trades table and its dependencies
-    op.execute('DROP TYPE IF EXISTS tradestatus CASCADE')
-    op.execute('DROP TYPE IF EXISTS tradetype CASCADE')
-    op.execute('DROP TYPE IF EXISTS positiontype CASCADE')
-    op.drop_table('trades')
-
-    # Create positions table first
-    op.create_table(
-        'positions',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('symbol', sa.String(), nullable=False),
-        sa.Column('strategy', sa.String(), nullable=False),
-        sa.Column('total_quantity', sa.Float(), server_default='0', nullable=False),
-        sa.Column('average_entry_price', sa.Float(), nullable=True),
-        sa.Column('realized_pnl', sa.Float(), server_default='0', nullable=False),
-        sa.Column('unrealized_pnl', sa.Float(), server_default='0', nullable=False),
-        sa.Column('status', sa.String(), nullable=False),
-        sa.Column('open_time', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
-        sa.Column('close_time', sa.DateTime(), nullable=True),
-        sa.PrimaryKeyConstraint('id'),
-        sa.CheckConstraint("status IN ('OPEN', 'CLOSED','IN_PROGRESS')", name='positions_status_check')
-    )
+# Columns of the trades table as it existed before this revision
+LEGACY_TRADE_COLUMNS = {'id', 'coin', 'position', 'type', 'status', 'quantity', 'entry_price', 'created_at'}
 
-    # Create indexes for positions
-    op.create_index(op.f('ix_positions_symbol'), 'positions', ['symbol'], unique=False)
-    op.create_index(op.f('ix_positions_strategy'), 'positions', ['strategy'], unique=False)
-    op.create_index(op.f('ix_positions_status'), 'positions', ['status'], unique=False)
+def _trade_columns():
+    """Column names of the live trades table, or None when it does not exist"""
+    inspector = sa.inspect(op.get_bind())
+    if not inspector.has_table('trades'):
+        return None
+    return {column['name'] for column in inspector.get_columns('trades')}
 
-    # Create trades table
+def _create_trades():
+    """Create trades in the new layout on databases that never had the legacy table"""
     op.create_table(
         'trades',
         sa.Column('id', sa.Integer(), nullable=False),
@@ -65,42 +47,231 @@ def upgrade():
         sa.Column('unrealized_pnl', sa.Float(), nullable=True),
         sa.Column('status', sa.String(), nullable=False),
         sa.Column('position_id', sa.Integer(), nullable=True),
-        sa.ForeignKeyConstraint(['position_id'], ['positions.id'], ondelete='SET NULL'),
+        sa.ForeignKeyConstraint(['position_id'], ['positions.id'], name='trades_position_id_fkey', ondelete='SET NULL'),
         sa.PrimaryKeyConstraint('id'),
         sa.CheckConstraint("side IN ('BUY', 'SELL')", name='trades_side_check'),
         sa.CheckConstraint("status IN ('PENDING', 'OPEN', 'CLOSED', 'CANCELLED')", name='trades_status_check'),
         sa.CheckConstraint("order_type IN ('MARKET', 'LIMIT', 'STOP')", name='trades_order_type_check')
     )
 
-    # Create indexes for trades
-    op.create_index(op.f('ix_trades_symbol'), 'trades', ['symbol'], unique=False)
-    op.create_index(op.f('ix_trades_status'), 'trades', ['status'], unique=False)
-    op.create_index(op.f('ix_trades_strategy'), 'trades', ['strategy'], unique=False)
+def _trades_layout():
+    """Classify the live trades table as 'missing', 'current' or 'legacy', raising if it can't be migrated"""
+    columns = _trade_columns()
+    if columns is None:
+        return 'missing'
+    if 'symbol' in columns and 'coin' not in columns:
+        return 'current'
+    if not LEGACY_TRADE_COLUMNS <= columns:
+        raise RuntimeError(
+            f"trades has an unrecognised layout {sorted(columns)}; "
+            "expected the legacy coin/position/type columns or the new symbol/side/order_type ones"
+        )
+
+    missing_symbol = op.get_bind().execute(sa.text("SELECT count(*) FROM trades WHERE coin IS NULL")).scalar()
+    if missing_symbol:
+        raise RuntimeError(
+            f"{missing_symbol} trades rows have no coin and cannot become NOT NULL symbol; "
+            "set their coin (or remove them deliberately) before running this migration"
+        )
+    return 'legacy'
+
+def _rebuild_legacy_trades():
+    """Convert the legacy coin/position/type trades table in place, keeping every row"""
+    bind = op.get_bind()
+
+    # Backfill values required by the new NOT NULL columns
+    op.execute("UPDATE trades SET status = 'CLOSED' WHERE status IS NULL")
+    op.execute("UPDATE trades SET type = 'MARKET' WHERE type IS NULL")
+    op.execute("UPDATE trades SET quantity = 0 WHERE quantity IS NULL")
+    op.execute("UPDATE trades SET entry_price = 0 WHERE entry_price IS NULL")
+    op.execute("UPDATE trades SET created_at = now() WHERE created_at IS NULL")
+
+    columns = _trade_columns()
+    indexes = {index['name'] for index in sa.inspect(bind).get_indexes('trades')}
+
+    # Rebuild trades as copy-to-new-table + rename so existing rows are kept
+    with op.batch_alter_table('trades', recreate='always') as batch_op:
+        for name in ('ix_trades_id', 'ix_trades_coin'):
+            if name in indexes:
+                batch_op.drop_index(name)
+
+        batch_op.alter_column('coin', new_column_name='symbol',
+                              existing_type=sa.String(), nullable=False)
+        batch_op.alter_column('position', new_column_name='side',
+                              existing_type=sa.Enum('LONG', 'SHORT', name='positiontype'),
+                              type_=sa.String(), server_default=None, nullable=False)
+        batch_op.alter_column('type', new_column_name='order_type',
+                              existing_type=sa.Enum('MARKET', 'LIMIT', name='tradetype'),
+                              type_=sa.String(), server_default='STOP', nullable=False)
+        batch_op.alter_column('status',
+                              existing_type=sa.Enum('OPEN', 'CLOSED', name='tradestatus'),
+                              type_=sa.String(), nullable=False)
+        batch_op.alter_column('quantity', existing_type=sa.Float(), nullable=False)
+        batch_op.alter_column('entry_price', existing_type=sa.Float(), nullable=False)
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(timezone=True),
+                              type_=sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'),
+                              nullable=False)
+        if 'updated_at' in columns:
+            batch_op.alter_column('updated_at', existing_type=sa.DateTime(timezone=True),
+                                  type_=sa.DateTime())
+        else:
+            batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        if 'profit_pct' in columns:
+            batch_op.drop_column('profit_pct')
+
+        new_columns = [
+            sa.Column('exit_price', sa.Float(), nullable=True),
+            sa.Column('take_profit', sa.Float(), nullable=True),
+            sa.Column('stop_loss', sa.Float(), nullable=True),
+            sa.Column('strategy', sa.String(), server_default='STRADDLE', nullable=False),
+            sa.Column('entered_at', sa.DateTime(), nullable=True),
+            sa.Column('closed_at', sa.DateTime(), nullable=True),
+            sa.Column('pnl', sa.Float(), nullable=True),
+            sa.Column('realized_pnl', sa.Float(), nullable=True),
+            sa.Column('unrealized_pnl', sa.Float(), nullable=True),
+            sa.Column('position_id', sa.Integer(), nullable=True),
+        ]
+        for column in new_columns:
+            if column.name not in columns:
+                batch_op.add_column(column)
+        batch_op.create_foreign_key('trades_position_id_fkey', 'positions',
+                                    ['position_id'], ['id'], ondelete='SET NULL')
+
+    # Map the old LONG/SHORT position onto the new side column
+    op.execute("UPDATE trades SET side = CASE side WHEN 'SHORT' THEN 'SELL' ELSE 'BUY' END")
+    op.create_check_constraint('trades_side_check', 'trades', "side IN ('BUY', 'SELL')")
+    op.create_check_constraint('trades_status_check', 'trades',
+                               "status IN ('PENDING', 'OPEN', 'CLOSED', 'CANCELLED')")
+    op.create_check_constraint('trades_order_type_check', 'trades',
+                               "order_type IN ('MARKET', 'LIMIT', 'STOP')")
+
+    # The old enum types are no longer referenced by any column
+    op.execute('DROP TYPE IF EXISTS tradestatus')
+    op.execute('DROP TYPE IF EXISTS tradetype')
+    op.execute('DROP TYPE IF EXISTS positiontype')
+
+def upgrade():
+    # Check trades before any DDL: the autocommit blocks below commit, so a later
+    # failure would leave positions behind without stamping this revision
+    layout = _trades_layout()
+
+    # Create positions table first (it survives a failed earlier run, see above)
+    if not sa.inspect(op.get_bind()).has_table('positions'):
+        op.create_table(
+            'positions',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('symbol', sa.String(), nullable=False),
+            sa.Column('strategy', sa.String(), nullable=False),
+            sa.Column('total_quantity', sa.Float(), server_default='0', nullable=False),
+            sa.Column('average_entry_price', sa.Float(), nullable=True),
+            sa.Column('realized_pnl', sa.Float(), server_default='0', nullable=False),
+            sa.Column('unrealized_pnl', sa.Float(), server_default='0', nullable=False),
+            sa.Column('status', sa.String(), nullable=False),
+            sa.Column('open_time', sa.DateTime(), server_default=sa.text('CURRENT_TIMESTAMP'), nullable=False),
+            sa.Column('close_time', sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.CheckConstraint("status IN ('OPEN', 'CLOSED','IN_PROGRESS')", name='positions_status_check')
+        )
+
+    # Create indexes for positions without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_positions_symbol ON positions(symbol)")
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_positions_strategy ON positions(strategy)")
+        # Partial composite for "open positions in symbol X"; most rows end up CLOSED
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_positions_symbol_status "
+            "ON positions(symbol, status) WHERE status != 'CLOSED'"
+        )
+
+    if layout == 'missing':
+        _create_trades()
+    elif layout == 'legacy':
+        _rebuild_legacy_trades()
+    # 'current': already on the new layout (e.g. created from the models); only the indexes below are needed
+
+    # Create indexes for trades without blocking writes
+    with op.get_context().autocommit_block():
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trades_symbol ON trades(symbol)")
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trades_symbol_status "
+            "ON trades(symbol, status) WHERE status IN ('OPEN', 'PENDING')"
+        )
+        op.execute("CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_trades_strategy ON trades(strategy)")
 
 def downgrade():
-    # Drop trades table first (due to foreign key constraint)
-    op.drop_table('trades')
+    columns = _trade_columns()
+    if columns is None or 'symbol' not in columns:
+        raise RuntimeError(
+            f"trades is not in the layout this revision produces ({sorted(columns or [])}); refusing to downgrade"
+        )
 
-    # Drop positions table
-    op.drop_table('positions')
+    # Drop trades indexes; the check constraints may be missing if trades was already on the new layout
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_trades_strategy")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_trades_symbol_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_trades_symbol")
 
-    # Recreate original trades table
-    op.create_table(
-        'trades',
-        sa.Column('id', sa.Integer(), nullable=False),
-        sa.Column('coin', sa.String(), nullable=True),
-        sa.Column('entry_price', sa.Float(), nullable=True),
-        sa.Column('exit_price', sa.Float(), nullable=True),
-        sa.Column('profit_pct', sa.Float(), nullable=True),
-        sa.Column('quantity', sa.Float(), nullable=True),
-        sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
-        sa.Column('updated_at', sa.DateTime(timezone=True), nullable=True),
-        sa.Column('status', sa.Enum('OPEN', 'CLOSED', name='tradestatus'), nullable=True),
-        sa.Column('type', sa.Enum('MARKET', 'LIMIT', name='tradetype'), nullable=True),
-        sa.Column('position', sa.Enum('LONG', 'SHORT', name='positiontype'), server_default='LONG', nullable=False),
-        sa.PrimaryKeyConstraint('id')
-    )
+    op.execute("ALTER TABLE trades DROP CONSTRAINT IF EXISTS trades_order_type_check")
+    op.execute("ALTER TABLE trades DROP CONSTRAINT IF EXISTS trades_status_check")
+    op.execute("ALTER TABLE trades DROP CONSTRAINT IF EXISTS trades_side_check")
+    op.execute("ALTER TABLE trades DROP CONSTRAINT IF EXISTS trades_position_id_fkey")
+
+    # Map values back onto the original enums
+    op.execute("UPDATE trades SET side = CASE side WHEN 'SELL' THEN 'SHORT' ELSE 'LONG' END")
+    op.execute("UPDATE trades SET order_type = 'MARKET' WHERE order_type NOT IN ('MARKET', 'LIMIT')")
+    op.execute("UPDATE trades SET status = 'OPEN' WHERE status NOT IN ('OPEN', 'CLOSED')")
+
+    bind = op.get_bind()
+    sa.Enum('OPEN', 'CLOSED', name='tradestatus').create(bind, checkfirst=True)
+    sa.Enum('MARKET', 'LIMIT', name='tradetype').create(bind, checkfirst=True)
+    sa.Enum('LONG', 'SHORT', name='positiontype').create(bind, checkfirst=True)
+
+    # Rebuild the original trades table, keeping existing rows
+    with op.batch_alter_table('trades', recreate='always') as batch_op:
+        batch_op.drop_column('position_id')
+        batch_op.drop_column('unrealized_pnl')
+        batch_op.drop_column('realized_pnl')
+        batch_op.drop_column('pnl')
+        batch_op.drop_column('closed_at')
+        batch_op.drop_column('entered_at')
+        batch_op.drop_column('strategy')
+        batch_op.drop_column('stop_loss')
+        batch_op.drop_column('take_profit')
+        batch_op.add_column(sa.Column('profit_pct', sa.Float(), nullable=True))
+
+        batch_op.alter_column('symbol', new_column_name='coin',
+                              existing_type=sa.String(), nullable=True)
+        batch_op.alter_column('side', new_column_name='position', existing_type=sa.String())
+        batch_op.alter_column('order_type', new_column_name='type', existing_type=sa.String(),
+                              server_default=None, nullable=True)
+        batch_op.alter_column('status', existing_type=sa.String(), nullable=True)
+        batch_op.alter_column('quantity', existing_type=sa.Float(), nullable=True)
+        batch_op.alter_column('entry_price', existing_type=sa.Float(), nullable=True)
+        batch_op.alter_column('created_at', existing_type=sa.DateTime(),
+                              type_=sa.DateTime(timezone=True), server_default=sa.text('now()'),
+                              nullable=True)
+        batch_op.alter_column('updated_at', existing_type=sa.DateTime(),
+                              type_=sa.DateTime(timezone=True))
+
+    # The batch copy does not cast varchar to enum, so convert in place
+    op.alter_column('trades', 'position', existing_type=sa.String(),
+                    type_=sa.Enum('LONG', 'SHORT', name='positiontype'),
+                    postgresql_using='position::positiontype')
+    op.alter_column('trades', 'position', server_default='LONG', nullable=False)
+    op.alter_column('trades', 'type', existing_type=sa.String(),
+                    type_=sa.Enum('MARKET', 'LIMIT', name='tradetype'),
+                    postgresql_using='type::tradetype')
+    op.alter_column('trades', 'status', existing_type=sa.String(),
+                    type_=sa.Enum('OPEN', 'CLOSED', name='tradestatus'),
+                    postgresql_using='status::tradestatus')
 
     # Recreate original indexes
     op.create_index('ix_trades_id', 'trades', ['id'], unique=False)
     op.create_index('ix_trades_coin', 'trades', ['coin'], unique=False)
+
+    # Drop positions table
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_positions_symbol_status")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_positions_strategy")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_positions_symbol")
+    op.drop_table('positions')
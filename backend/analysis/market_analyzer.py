@@ -1,19 +1,61 @@
+import asyncio
 import logging
-from typing import Dict, List, Optional
+import os
+import time
+import weakref
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional
 from app.services.crypto_service import CryptoService
 import numpy as np
 import pandas as pd
 from datetime import datetime, timedelta
-import ccxt
+import ccxt.async_support as ccxt_async
+import pyarrow as pa
+import pyarrow.parquet as pq
+from app.core.kernels import NUMBA_AVAILABLE, rsi_nb
 
 logger = logging.getLogger(__name__)
 
+# RSI signal indexed by (rsi >= 30) + (rsi > 70)
+RSI_SIGNALS = ("oversold", "neutral", "overbought")
+
+# Column order of exchange OHLCV candles
+OHLCV_COLUMNS = ('ts', 'open', 'high', 'low', 'close', 'volume')
+OHLCV_LIMIT = 100  # Number of candles kept per (symbol, timeframe)
+SUPPORTED_PAIRS_TTL = 60  # seconds
+
+class Indicators(NamedTuple):
+    sma20: float
+    sma50: float
+    rsi: float
+    bb_middle: float
+    bb_upper: float
+    bb_lower: float
+
+class Signals(NamedTuple):
+    trend: str
+    rsi_signal: str
+    bb_signal: str
+
+class SupportResistance(NamedTuple):
+    support_levels: List[float]
+    resistance_levels: List[float]
+
+class Volatility(NamedTuple):
+    current_volatility: float
+    historical_volatility: float
+
 class MarketAnalyzer:
+    # Active pairs shared by every analyzer in the process: (fetched_at, pairs, pair_set)
+    _supported_pairs_cache: Optional[tuple] = None
+
     def __init__(self, crypto_service: CryptoService):
         self.crypto_service = crypto_service
-        self.exchange = ccxt.binance()
+        self.exchange = ccxt_async.binance()
         self.timeframes = ['5m', '10m', '15m']
-        self._update_supported_pairs()
+        self._timeframes_set = frozenset(self.timeframes)
+        self._timeframes_csv = ', '.join(self.timeframes)
         self.volatility_threshold = 0.02  # 2% threshold for volatility
         self.time_windows = {
             "5m": 12,    # 1 hour divided into 5-minute intervals
@@ -21,289 +63,473 @@ class MarketAnalyzer:
             "15m": 4     # 1 hour divided into 15-minute intervals
         }
 
-    def _update_supported_pairs(self):
+        # Short-lived in-process caches for exchange data
+        self.ohlcv_ttl = {
+            "5m": 300,   # Cache candles for one bar interval
+            "10m": 600,
+            "15m": 900
+        }
+        self.ticker_ttl = 3  # seconds
+        self._ohlcv_cache: Dict[tuple, tuple] = {}
+        self._ticker_cache: Dict[str, tuple] = {}
+        # Held only while a fetch is in flight, so idle keys don't accumulate
+        self._cache_locks: "weakref.WeakValueDictionary[tuple, asyncio.Lock]" = weakref.WeakValueDictionary()
+
+        # Durable candle cache so restarts only fetch the bars they missed
+        self._cache_dir = Path("./.ohlcv_cache")
+
+        # Worker processes for CPU-bound multi-symbol analysis, created on first use
+        self._pool: Optional[ProcessPoolExecutor] = None
+
+        if NUMBA_AVAILABLE:
+            self._warm_up_kernels()
+
+    def _warm_up_kernels(self):
+        """Trigger JIT compilation so the first live request doesn't pay for it"""
+        rsi_nb(np.zeros(15), 14)
+
+    async def close(self):
+        """Close the exchange connection and worker pool"""
+        await self.exchange.close()
+        if self._pool is not None:
+            self._pool.shutdown(wait=False)
+            self._pool = None
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        """Get the process pool used by analyze_all"""
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._pool
+
+    def _get_cache_lock(self, key: tuple) -> asyncio.Lock:
+        """Get the lock guarding a cache key so concurrent misses fetch only once"""
+        lock = self._cache_locks.get(key)
+        if lock is None:
+            lock = self._cache_locks[key] = asyncio.Lock()
+        return lock
+
+    async def get_supported_pairs(self) -> List[str]:
+        """Active trading pairs, loaded on first use and refreshed after SUPPORTED_PAIRS_TTL"""
+        cached = MarketAnalyzer._supported_pairs_cache
+        if cached is None or time.monotonic() - cached[0] > SUPPORTED_PAIRS_TTL:
+            await self._update_supported_pairs()
+            cached = MarketAnalyzer._supported_pairs_cache
+        return cached[1]
+
+    async def _update_supported_pairs(self) -> List[str]:
         """Update supported pairs from database"""
-        self.supported_pairs = self.crypto_service.get_all_active_pairs()
+        pairs = await self.crypto_service.get_all_active_pairs()
+        MarketAnalyzer._supported_pairs_cache = (time.monotonic(), pairs, frozenset(pairs))
+        return pairs
+
+    async def _ensure_supported_pair(self, symbol: str):
+        """Raise ValueError unless symbol is an active pair, checked against the cached set"""
+        await self.get_supported_pairs()
+        if symbol not in MarketAnalyzer._supported_pairs_cache[2]:
+            raise ValueError(f"Invalid trading pair: {symbol}")
 
     async def get_market_analysis(self, symbol: str, timeframe: str) -> Dict:
         """Get market analysis for a symbol"""
         try:
             # Validate inputs
-            if not self.crypto_service.validate_trading_pair(symbol):
-                raise ValueError(f"Invalid trading pair: {symbol}")
-            if timeframe not in self.timeframes:
-                raise ValueError(f"Invalid timeframe: {timeframe}")
-
-            # Get historical data
-            historical_data = await self._get_historical_data(symbol, timeframe)
-
-            # Calculate current price
-            current_price = float(self.exchange.fetch_ticker(symbol.replace('/', ''))['last'])
-
-            # Calculate indicators
-            indicators = self._calculate_indicators(historical_data)
-
-            # Generate signals
-            signals = self._generate_signals(indicators)
-
-            # Calculate support and resistance
-            support_resistance = self._calculate_support_resistance(historical_data)
-
-            # Calculate volatility
-            volatility = self._calculate_volatility(historical_data)
-
-            # Generate recommendation
-            recommendation = self._generate_recommendation(
-                current_price,
-                indicators,
-                signals,
-                support_resistance,
-                volatility
+            await self._ensure_supported_pair(symbol)
+            if timeframe not in self._timeframes_set:
+                raise ValueError(f"Invalid timeframe: {timeframe} (supported: {self._timeframes_csv})")
+
+            # Get historical data and current price concurrently
+            historical_data, current_price = await asyncio.gather(
+                self._get_historical_data(symbol, timeframe),
+                self._get_current_price(symbol)
             )
 
-            return {
-                'symbol': symbol,
-                'timeframe': timeframe,
-                'current_price': current_price,
-                'indicators': indicators,
-                'signals': signals,
-                'support_resistance': support_resistance,
-                'volatility': volatility,
-                'recommendation': recommendation
-            }
+            return self._analyze_data(symbol, timeframe, current_price, historical_data)
 
-        except Exception as e:
-            logger.error(f"Error in market analysis for {symbol}: {str(e)}")
+        except Exception:
+            logger.exception("market analysis failed symbol=%s tf=%s", symbol, timeframe)
             raise
 
-    async def _get_historical_data(self, symbol: str, timeframe: str) -> pd.DataFrame:
-        """Get historical price data"""
+    async def get_market_analysis_multi(self, symbol: str, timeframes: Optional[List[str]] = None) -> Dict[str, Dict]:
+        """Get market analysis for a symbol across several timeframes in one call"""
+        timeframes = timeframes or self.timeframes
         try:
-            # Convert timeframe to valid exchange timeframe
-            exchange_timeframe = self._convert_timeframe(timeframe)
-
-            # Fetch OHLCV data
-            ohlcv = self.exchange.fetch_ohlcv(
-                symbol.replace('/', ''),
-                timeframe=exchange_timeframe,
-                limit=100  # Last 100 candles
-            )
-
-            # Convert to DataFrame
-            df = pd.DataFrame(
-                ohlcv,
-                columns=['timestamp', 'open', 'high', 'low', 'close', 'volume']
+            # Validate inputs
+            await self._ensure_supported_pair(symbol)
+            for timeframe in timeframes:
+                if timeframe not in self._timeframes_set:
+                    raise ValueError(f"Invalid timeframe: {timeframe} (supported: {self._timeframes_csv})")
+
+            # Fetch every timeframe and a single shared ticker concurrently
+            historical_data, current_price = await asyncio.gather(
+                asyncio.gather(*[self._get_historical_data(symbol, tf) for tf in timeframes]),
+                self._get_current_price(symbol)
             )
-            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-            df.set_index('timestamp', inplace=True)
 
-            return df
+            return {
+                timeframe: self._analyze_data(symbol, timeframe, current_price, data)
+                for timeframe, data in zip(timeframes, historical_data)
+            }
 
-        except Exception as e:
-            logger.error(f"Error fetching historical data for {symbol}: {str(e)}")
+        except Exception:
+            logger.exception("multi-timeframe market analysis failed symbol=%s tfs=%s", symbol, timeframes)
             raise
 
-    def _convert_timeframe(self, timeframe: str) -> str:
-        """Convert internal timeframe to exchange timeframe"""
-        return timeframe  # For Binance, our timeframes are already compatible
+    async def analyze_all(self, symbols: Optional[List[str]] = None, timeframe: str = '5m') -> Dict[str, Dict]:
+        """Analyze many symbols at once, computing indicators on all CPU cores"""
+        symbols = await self.get_supported_pairs() if symbols is None else symbols
+        if timeframe not in self._timeframes_set:
+            raise ValueError(f"Invalid timeframe: {timeframe} (supported: {self._timeframes_csv})")
 
-    def _calculate_indicators(self, df: pd.DataFrame) -> Dict:
-        """Calculate technical indicators"""
         try:
-            close_prices = df['close'].values
-
-            # Calculate SMA
-            sma20 = self._calculate_sma(close_prices, 20)
-            sma50 = self._calculate_sma(close_prices, 50)
-
-            # Calculate RSI
-            rsi = self._calculate_rsi(close_prices)
+            # Exchange I/O stays on the event loop
+            historical_data, current_prices = await asyncio.gather(
+                asyncio.gather(*[self._get_historical_data(symbol, timeframe) for symbol in symbols]),
+                asyncio.gather(*[self._get_current_price(symbol) for symbol in symbols])
+            )
 
-            # Calculate Bollinger Bands
-            bb_middle, bb_upper, bb_lower = self._calculate_bollinger_bands(close_prices)
+            # Indicator math fans out to worker processes
+            loop = asyncio.get_running_loop()
+            pool = self._get_pool()
+            results = await asyncio.gather(*[
+                loop.run_in_executor(pool, analyze_arrays, data['close'], data['high'], data['low'])
+                for data in historical_data
+            ])
 
             return {
-                'sma20': float(sma20[-1]),
-                'sma50': float(sma50[-1]),
-                'rsi': float(rsi[-1]),
-                'bb_middle': float(bb_middle[-1]),
-                'bb_upper': float(bb_upper[-1]),
-                'bb_lower': float(bb_lower[-1])
+                symbol: self._build_analysis(symbol, timeframe, current_price, result)
+                for symbol, current_price, result in zip(symbols, current_prices, results)
             }
 
-        except Exception as e:
-            logger.error(f"Error calculating indicators: {str(e)}")
+        except Exception:
+            logger.exception("multi-symbol market analysis failed symbols=%d tf=%s", len(symbols), timeframe)
             raise
 
-    def _calculate_sma(self, data: np.ndarray, period: int) -> np.ndarray:
-        """Calculate Simple Moving Average"""
-        return pd.Series(data).rolling(window=period).mean().values
-
-    def _calculate_rsi(self, prices: np.ndarray, period: int = 14) -> np.ndarray:
-        """Calculate Relative Strength Index"""
-        deltas = np.diff(prices)
-        seed = deltas[:period+1]
-        up = seed[seed >= 0].sum()/period
-        down = -seed[seed < 0].sum()/period
-        rs = up/down
-        rsi = np.zeros_like(prices)
-        rsi[:period] = 100. - 100./(1. + rs)
-
-        for i in range(period, len(prices)):
-            delta = deltas[i - 1]
-            if delta > 0:
-                upval = delta
-                downval = 0.
-            else:
-                upval = 0.
-                downval = -delta
-
-            up = (up * (period - 1) + upval) / period
-            down = (down * (period - 1) + downval) / period
-            rs = up/down
-            rsi[i] = 100. - 100./(1. + rs)
-
-        return rsi
-
-    def _calculate_bollinger_bands(self, prices: np.ndarray, period: int = 20, num_std: float = 2.0) -> tuple:
-        """Calculate Bollinger Bands"""
-        middle_band = self._calculate_sma(prices, period)
-        std = pd.Series(prices).rolling(window=period).std().values
-        upper_band = middle_band + (std * num_std)
-        lower_band = middle_band - (std * num_std)
-        return middle_band, upper_band, lower_band
-
-    def _calculate_volatility(self, df: pd.DataFrame) -> Dict:
-        """Calculate volatility metrics"""
-        try:
-            # Calculate daily returns
-            returns = df['close'].pct_change()
+    def _analyze_data(self, symbol: str, timeframe: str, current_price: float, historical_data: Dict[str, np.ndarray]) -> Dict:
+        """Run the indicator pipeline over fetched candles"""
+        result = analyze_arrays(historical_data['close'], historical_data['high'], historical_data['low'])
+        return self._build_analysis(symbol, timeframe, current_price, result)
+
+    def _build_analysis(self, symbol: str, timeframe: str, current_price: float, result: Dict) -> Dict:
+        """Combine indicator results with the current price into the analysis payload"""
+        indicators = result['indicators']
+        signals = result['signals']
+        support_resistance = result['support_resistance']
+        volatility = result['volatility']
+
+        # Generate recommendation
+        recommendation = self._generate_recommendation(
+            current_price,
+            indicators,
+            signals,
+            support_resistance,
+            volatility
+        )
+
+        return {
+            'symbol': symbol,
+            'timeframe': timeframe,
+            'current_price': current_price,
+            'indicators': indicators._asdict(),
+            'signals': signals._asdict(),
+            'support_resistance': support_resistance._asdict(),
+            'volatility': volatility._asdict(),
+            'recommendation': recommendation
+        }
 
-            # Current volatility (last 20 periods)
-            current_volatility = returns.tail(20).std()
+    async def _get_current_price(self, symbol: str) -> float:
+        """Get the last traded price, cached for a few seconds"""
+        key = ('ticker', symbol)
+        async with self._get_cache_lock(key):
+            cached = self._ticker_cache.get(symbol)
+            if cached and time.monotonic() - cached[0] < self.ticker_ttl:
+                return cached[1]
+
+            ticker = await self.exchange.fetch_ticker(symbol.replace('/', ''))
+            current_price = float(ticker['last'])
+            self._ticker_cache[symbol] = (time.monotonic(), current_price)
+            return current_price
+
+    async def _get_historical_data(self, symbol: str, timeframe: str) -> Dict[str, np.ndarray]:
+        """Get historical price data, cached for one bar interval"""
+        key = (symbol, timeframe)
+        ttl = self.ohlcv_ttl.get(timeframe, 60)
+        async with self._get_cache_lock(key):
+            cached = self._ohlcv_cache.get(key)
+            if cached and time.monotonic() - cached[0] < ttl:
+                return cached[1]
+
+            # Start from the last known candles (memory first, then disk)
+            stored = cached[1] if cached else await asyncio.to_thread(self._load_ohlcv_cache, symbol, timeframe)
+            data = await self._fetch_ohlcv(symbol, timeframe, stored)
+
+            self._ohlcv_cache[key] = (time.monotonic(), data)
+            await asyncio.to_thread(self._save_ohlcv_cache, symbol, timeframe, data)
+            return data
+
+    async def _fetch_ohlcv(
+        self,
+        symbol: str,
+        timeframe: str,
+        stored: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Fetch candles, only requesting bars newer than the stored ones when possible"""
+        # Convert timeframe to valid exchange timeframe
+        exchange_timeframe = self._convert_timeframe(timeframe)
+
+        since = None
+        if stored is not None and stored['ts'].shape[0]:
+            last_ts = int(stored['ts'][-1])
+            bar_ms = self.exchange.parse_timeframe(exchange_timeframe) * 1000
+            # Refetch from the last stored bar, it may still have been forming
+            if self.exchange.milliseconds() - last_ts < OHLCV_LIMIT * bar_ms:
+                since = last_ts
+
+        # Fetch OHLCV data
+        ohlcv = await self.exchange.fetch_ohlcv(
+            symbol.replace('/', ''),
+            timeframe=exchange_timeframe,
+            since=since,
+            limit=OHLCV_LIMIT
+        )
+
+        # Split candles into one array per column
+        arr = np.asarray(ohlcv, dtype=np.float64).reshape(-1, len(OHLCV_COLUMNS))
+        data = {name: arr[:, i] for i, name in enumerate(OHLCV_COLUMNS)}
+
+        if since is not None:
+            # Replace the overlapping bars and keep the most recent window
+            keep = stored['ts'] < since
+            data = {
+                name: np.concatenate((stored[name][keep], data[name]))[-OHLCV_LIMIT:]
+                for name in OHLCV_COLUMNS
+            }
 
-            # Historical volatility (all available periods)
-            historical_volatility = returns.std()
+        return data
 
-            return {
-                'current_volatility': float(current_volatility),
-                'historical_volatility': float(historical_volatility)
-            }
+    def _ohlcv_cache_path(self, symbol: str, timeframe: str) -> Path:
+        """Get the parquet file holding cached candles for a symbol/timeframe"""
+        return self._cache_dir / f"{symbol.replace('/', '')}_{timeframe}.parquet"
 
+    def _load_ohlcv_cache(self, symbol: str, timeframe: str) -> Optional[Dict[str, np.ndarray]]:
+        """Load cached candles from disk (blocking, run it off the event loop)"""
+        path = self._ohlcv_cache_path(symbol, timeframe)
+        if not path.exists():
+            return None
+        try:
+            table = pq.read_table(path, columns=list(OHLCV_COLUMNS))
+            return {name: table.column(name).to_numpy() for name in OHLCV_COLUMNS}
         except Exception as e:
-            logger.error(f"Error calculating volatility: {str(e)}")
-            raise
-
-    def _calculate_support_resistance(self, df: pd.DataFrame) -> Dict:
-        """Calculate support and resistance levels"""
+            logger.warning(f"Ignoring unreadable OHLCV cache {path}: {str(e)}")
+            return None
+
+    def _save_ohlcv_cache(self, symbol: str, timeframe: str, data: Dict[str, np.ndarray]):
+        """Persist candles to disk in columnar form (blocking, run it off the event loop)"""
+        path = self._ohlcv_cache_path(symbol, timeframe)
+        # Write next to the target and swap it in, so readers never see a partial file
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
         try:
-            # Use recent price action (last 50 periods)
-            recent_high = df['high'].tail(50).max()
-            recent_low = df['low'].tail(50).min()
-
-            # Calculate potential support levels
-            support_levels = [
-                recent_low,
-                recent_low * 0.99,  # 1% below recent low
-                recent_low * 0.98   # 2% below recent low
-            ]
-
-            # Calculate potential resistance levels
-            resistance_levels = [
-                recent_high,
-                recent_high * 1.01,  # 1% above recent high
-                recent_high * 1.02   # 2% above recent high
-            ]
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            table = pa.Table.from_arrays(
+                [pa.array(data[name]) for name in OHLCV_COLUMNS],
+                names=list(OHLCV_COLUMNS)
+            )
+            pq.write_table(table, tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write OHLCV cache for {symbol} {timeframe}: {str(e)}")
+            tmp_path.unlink(missing_ok=True)
 
-            return {
-                'support_levels': [float(level) for level in support_levels],
-                'resistance_levels': [float(level) for level in resistance_levels]
-            }
+    def _convert_timeframe(self, timeframe: str) -> str:
+        """Convert internal timeframe to exchange timeframe"""
+        return timeframe  # For Binance, our timeframes are already compatible
 
-        except Exception as e:
-            logger.error(f"Error calculating support/resistance: {str(e)}")
-            raise
+    @staticmethod
+    def _calculate_indicators(data: Dict[str, np.ndarray]) -> Indicators:
+        """Calculate technical indicators"""
+        close_prices = data['close']
+
+        # Calculate SMA (only the latest value is used)
+        sma20 = MarketAnalyzer._calculate_sma_last(close_prices, 20)
+        sma50 = MarketAnalyzer._calculate_sma_last(close_prices, 50)
+
+        # Calculate RSI (recursive, needs the full series)
+        rsi = MarketAnalyzer._calculate_rsi(close_prices)
+
+        # Calculate Bollinger Bands (only the latest value is used)
+        bb_middle, bb_upper, bb_lower = MarketAnalyzer._calculate_bb_last(close_prices)
+
+        return Indicators(
+            sma20=sma20,
+            sma50=sma50,
+            rsi=float(rsi[-1]),
+            bb_middle=bb_middle,
+            bb_upper=bb_upper,
+            bb_lower=bb_lower
+        )
+
+    @staticmethod
+    def _calculate_sma_last(prices: np.ndarray, period: int) -> float:
+        """Calculate the latest Simple Moving Average value from the trailing window"""
+        n = prices.shape[0]
+        if n < period:
+            return float('nan')
+        return float(prices[n - period:].sum()) / period
+
+    @staticmethod
+    def _calculate_bb_last(prices: np.ndarray, period: int = 20, num_std: float = 2.0) -> tuple:
+        """Calculate the latest Bollinger Bands values from the trailing window"""
+        n = prices.shape[0]
+        if n < period:
+            nan = float('nan')
+            return nan, nan, nan
+        tail = prices[n - period:]
+        middle = float(tail.sum()) / period
+        std = float(tail.std(ddof=1))
+        return middle, middle + num_std * std, middle - num_std * std
+
+    @staticmethod
+    def _calculate_rsi(prices: np.ndarray, period: int = 14) -> np.ndarray:
+        """Calculate Relative Strength Index (Wilder's smoothing)"""
+        if NUMBA_AVAILABLE:
+            return rsi_nb(np.asarray(prices, dtype=np.float64), period)
+
+        deltas = np.diff(prices, prepend=prices[0])
+        up = pd.Series(np.where(deltas > 0, deltas, 0.0))
+        down = pd.Series(np.where(deltas < 0, -deltas, 0.0))
+
+        # Wilder's smoothing is an EWMA with alpha = 1/period
+        up_ewm = up.ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+        down_ewm = down.ewm(alpha=1.0 / period, adjust=False).mean().to_numpy()
+
+        return 100.0 - 100.0 / (1.0 + up_ewm / np.where(down_ewm == 0, 1e-12, down_ewm))
+
+    @staticmethod
+    def _calculate_volatility(data: Dict[str, np.ndarray]) -> Volatility:
+        """Calculate volatility metrics"""
+        # Calculate period returns
+        close = data['close']
+        returns = np.diff(close) / close[:-1]
 
-    def _generate_signals(self, indicators: Dict) -> Dict:
-        """Generate trading signals based on indicators"""
-        try:
-            # Determine trend based on SMAs
-            trend = "bullish" if indicators['sma20'] > indicators['sma50'] else "bearish"
+        # Current volatility (last 20 periods)
+        current_volatility = returns[-20:].std(ddof=1)
 
-            # RSI signals
-            rsi_signal = "oversold" if indicators['rsi'] < 30 else "overbought" if indicators['rsi'] > 70 else "neutral"
+        # Historical volatility (all available periods)
+        historical_volatility = returns.std(ddof=1)
 
-            # Bollinger Bands signals
-            bb_signal = "lower_band" if indicators['bb_lower'] > indicators['bb_middle'] else "upper_band" if indicators['bb_upper'] < indicators['bb_middle'] else "middle_band"
+        return Volatility(
+            current_volatility=float(current_volatility),
+            historical_volatility=float(historical_volatility)
+        )
 
-            return {
-                'trend': trend,
-                'rsi_signal': rsi_signal,
-                'bb_signal': bb_signal
-            }
+    @staticmethod
+    def _calculate_support_resistance(data: Dict[str, np.ndarray]) -> SupportResistance:
+        """Calculate support and resistance levels"""
+        # Use recent price action (last 50 periods)
+        recent_high = float(data['high'][-50:].max())
+        recent_low = float(data['low'][-50:].min())
+
+        # Calculate potential support levels
+        support_levels = [
+            recent_low,
+            recent_low * 0.99,  # 1% below recent low
+            recent_low * 0.98   # 2% below recent low
+        ]
+
+        # Calculate potential resistance levels
+        resistance_levels = [
+            recent_high,
+            recent_high * 1.01,  # 1% above recent high
+            recent_high * 1.02   # 2% above recent high
+        ]
+
+        return SupportResistance(
+            support_levels=[float(level) for level in support_levels],
+            resistance_levels=[float(level) for level in resistance_levels]
+        )
+
+    @staticmethod
+    def _generate_signals(indicators: Indicators) -> Signals:
+        """Generate trading signals based on indicators"""
+        rsi = indicators.rsi
+        bb_middle = indicators.bb_middle
 
-        except Exception as e:
-            logger.error(f"Error generating signals: {str(e)}")
-            raise
+        return Signals(
+            # Determine trend based on SMAs
+            trend="bullish" if indicators.sma20 > indicators.sma50 else "bearish",
+            # RSI signals: < 30 oversold, 30-70 neutral, > 70 overbought (undefined RSI is neutral)
+            rsi_signal="neutral" if np.isnan(rsi) else RSI_SIGNALS[(rsi >= 30) + (rsi > 70)],
+            # Bollinger Bands signals
+            bb_signal=(
+                "lower_band" if indicators.bb_lower > bb_middle
+                else "upper_band" if indicators.bb_upper < bb_middle
+                else "middle_band"
+            )
+        )
 
     def _generate_recommendation(
         self,
         current_price: float,
-        indicators: Dict,
-        signals: Dict,
-        support_resistance: Dict,
-        volatility: Dict
+        indicators: Indicators,
+        signals: Signals,
+        support_resistance: SupportResistance,
+        volatility: Volatility
     ) -> Dict:
         """Generate trading recommendation"""
-        try:
-            action = "hold"
-            confidence = 0.5
-            reason = "Market conditions are neutral"
-            stop_loss = None
-            target_price = None
-
-            # Check for oversold conditions (potential buy)
-            if (signals['rsi_signal'] == "oversold" and
-                current_price <= indicators['bb_lower']):
-                action = "buy"
-                confidence = 0.8
-                reason = "RSI oversold + price at BB lower band"
-                stop_loss = current_price * 0.98  # 2% below entry
-                target_price = current_price * 1.05  # 5% profit target
-
-            # Check for overbought conditions (potential sell)
-            elif (signals['rsi_signal'] == "overbought" and
-                  current_price >= indicators['bb_upper']):
-                action = "sell"
-                confidence = 0.8
-                reason = "RSI overbought + price at BB upper band"
-                stop_loss = current_price * 1.02  # 2% above entry
-                target_price = current_price * 0.95  # 5% profit target
-
-            # Consider trend
-            if signals['trend'] == "bullish":
-                if action == "buy":
-                    confidence += 0.1
-                elif action == "sell":
-                    confidence -= 0.1
-            else:  # bearish trend
-                if action == "sell":
-                    confidence += 0.1
-                elif action == "buy":
-                    confidence -= 0.1
-
-            # Adjust for volatility
-            if volatility['current_volatility'] > volatility['historical_volatility']:
-                confidence *= 0.9  # Reduce confidence in high volatility
+        action = "hold"
+        confidence = 0.5
+        reason = "Market conditions are neutral"
+        stop_loss = None
+        target_price = None
+
+        # Check for oversold conditions (potential buy)
+        if (signals.rsi_signal == "oversold" and
+            current_price <= indicators.bb_lower):
+            action = "buy"
+            confidence = 0.8
+            reason = "RSI oversold + price at BB lower band"
+            stop_loss = current_price * 0.98  # 2% below entry
+            target_price = current_price * 1.05  # 5% profit target
+
+        # Check for overbought conditions (potential sell)
+        elif (signals.rsi_signal == "overbought" and
+              current_price >= indicators.bb_upper):
+            action = "sell"
+            confidence = 0.8
+            reason = "RSI overbought + price at BB upper band"
+            stop_loss = current_price * 1.02  # 2% above entry
+            target_price = current_price * 0.95  # 5% profit target
+
+        # Consider trend
+        if signals.trend == "bullish":
+            if action == "buy":
+                confidence += 0.1
+            elif action == "sell":
+                confidence -= 0.1
+        else:  # bearish trend
+            if action == "sell":
+                confidence += 0.1
+            elif action == "buy":
+                confidence -= 0.1
+
+        # Adjust for volatility
+        if volatility.current_volatility > volatility.historical_volatility:
+            confidence *= 0.9  # Reduce confidence in high volatility
+
+        return {
+            'action': action,
+            'confidence': min(confidence, 1.0),  # Cap at 1.0
+            'reason': reason,
+            'stop_loss': float(stop_loss) if stop_loss else None,
+            'target_price': float(target_price) if target_price else None
+        }
 
-            return {
-                'action': action,
-                'confidence': min(confidence, 1.0),  # Cap at 1.0
-                'reason': reason,
-                'stop_loss': float(stop_loss) if stop_loss else None,
-                'target_price': float(target_price) if target_price else None
-            }
 
-        except Exception as e:
-            logger.error(f"Error generating recommendation: {str(e)}")
-            raise
+def analyze_arrays(close: np.ndarray, high: np.ndarray, low: np.ndarray) -> Dict:
+    """Run the CPU-bound indicator pipeline on raw arrays (picklable for worker processes)"""
+    data = {'close': close, 'high': high, 'low': low}
+    indicators = MarketAnalyzer._calculate_indicators(data)
+    return {
+        'indicators': indicators,
+        'signals': MarketAnalyzer._generate_signals(indicators),
+        'support_resistance': MarketAnalyzer._calculate_support_resistance(data),
+        'volatility': MarketAnalyzer._calculate_volatility(data)
+    }
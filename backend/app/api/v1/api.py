@@ -1,97 +1,32 @@
-from fastapi import APIRouter
-from app.api.v1.endpoints import (
-    trade_routes,
-    analysis_routes,
-    portfolio_routes,
-    telegram_routes,
-    crypto_routes,
-    straddle_routes,
-    swap_transaction_routes,
-    portfolio_summary_routes,
-    profit_routes,
-    graph_routes,
-    swap_routes,
-    live_routes
-)
-
-api_router = APIRouter()
-
-# Include all routers with their prefixes and tags
-api_router.include_router(
-    trade_routes.router,
-    prefix="/trades",
-    tags=["trades"]
-)
-
-api_router.include_router(
-    analysis_routes.router,
-    prefix="/analysis",
-    tags=["analysis"]
-)
-
-api_router.include_router(
-    portfolio_routes.router,
-    prefix="/portfolio",
-    tags=["portfolio"]
-)
-
-api_router.include_router(
-    telegram_routes.router,
-    prefix="/telegram",
-    tags=["telegram"]
-)
-
-# Include straddle endpoints
-api_router.include_router(
-    straddle_routes.router,
-    prefix="/straddle",
-    tags=["straddle"]
-)
+from importlib import import_module
 
-# Include crypto table endpoints
-api_router.include_router(
-    crypto_routes.router,
-    prefix="/crypto",
-    tags=["crypto"]
-)
-
-# Include swap transaction endpoints
-api_router.include_router(
-    swap_transaction_routes.router,
-    prefix="/swap-transactions",
-    tags=["swap-transactions"]
-)
-
-# Include swap endpoints (1inch integration)
-api_router.include_router(
-    swap_routes.router,
-    prefix="/swap",
-    tags=["swap"]
-)
-
-# Include portfolio summary endpoints
-api_router.include_router(
-    portfolio_summary_routes.router,
-    prefix="/portfolio-summary",
-    tags=["portfolio-summary"]
-)
-
-# Include profit calculation endpoints
-api_router.include_router(
-    profit_routes.router,
-    prefix="/profit",
-    tags=["profit"]
-)
-
-api_router.include_router(
-    graph_routes.router,
-    prefix="/graph",
-    tags=["graph"]
-)
+from fastapi import APIRouter
 
-# Include live data endpoints
-api_router.include_router(
-    live_routes.router,
-    prefix="/live",
-    tags=["live"]
-)
+ENDPOINTS_PACKAGE = "app.api.v1.endpoints"
+
+# (endpoint module, prefix, tag) in registration order
+ROUTES = [
+    ("trade_routes", "/trades", "trades"),
+    ("analysis_routes", "/analysis", "analysis"),
+    ("portfolio_routes", "/portfolio", "portfolio"),
+    ("telegram_routes", "/telegram", "telegram"),
+    ("straddle_routes", "/straddle", "straddle"),
+    ("crypto_routes", "/crypto", "crypto"),
+    ("swap_transaction_routes", "/swap-transactions", "swap-transactions"),
+    ("swap_routes", "/swap", "swap"),  # 1inch integration
+    ("portfolio_summary_routes", "/portfolio-summary", "portfolio-summary"),
+    ("profit_routes", "/profit", "profit"),
+    ("graph_routes", "/graph", "graph"),
+    ("live_routes", "/live", "live"),
+]
+
+
+def _register(router: APIRouter, routes) -> APIRouter:
+    """Import each endpoint module and include its router with its prefix and tag"""
+    for module_name, prefix, tag in routes:
+        module = import_module(f"{ENDPOINTS_PACKAGE}.{module_name}")
+        router.include_router(module.router, prefix=prefix, tags=[tag])
+    return router
+
+
+api_router = _register(APIRouter(), ROUTES)
@@ -1,13 +1,45 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from app.core.responses import ORJSONResponse
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import Dict, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional
 from app.core.database import get_db
+from app.core.cache import cached
+from app.core.logger import logger
 from app.controllers.analysis_controller import analysis_controller
 from app.services.helper.binance_helper import binance_helper
+from app.services.straddle_service import straddle_service
 from datetime import datetime
+import asyncio
+import numpy as np
 
-router = APIRouter()
+# Analysis payloads are large numeric dicts; encode them with orjson
+router = APIRouter(default_response_class=ORJSONResponse)
+
+PRICE_HISTORY_TTL = 10  # seconds clients share one upstream price history fetch
+UPSTREAM_TIMEOUT = 10  # seconds allowed per Binance call
+UPSTREAM_ATTEMPTS = 2
+
+async def _call_upstream(func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """Await an upstream call with a timeout, retrying on timeout"""
+    for attempt in range(1, UPSTREAM_ATTEMPTS + 1):
+        try:
+            return await asyncio.wait_for(func(*args, **kwargs), timeout=UPSTREAM_TIMEOUT)
+        except asyncio.TimeoutError:
+            if attempt == UPSTREAM_ATTEMPTS:
+                raise
+            logger.warning(f"{func.__name__} timed out after {UPSTREAM_TIMEOUT}s, retrying ({attempt}/{UPSTREAM_ATTEMPTS})")
+
+@cached(ttl=PRICE_HISTORY_TTL, key="px:{symbol}:{intervals}")
+async def _get_close_prices(symbol: str, intervals: int = 50) -> List[float]:
+    """Get historical 15m close prices, cached briefly so request bursts share one upstream fetch"""
+    return await binance_helper.get_close_prices(symbol, intervals=intervals)
+
+def _price_range(prices: np.ndarray, current_price: float) -> Dict:
+    """Min, max and spread (as % of current price) of a price window"""
+    low = float(prices.min())
+    high = float(prices.max())
+    return {"min": low, "max": high, "spread": round((high - low) / current_price * 100, 2)}
 
 @router.get("/market/{symbol}", response_model=Dict)
 async def get_market_analysis(symbol: str):
@@ -34,8 +66,8 @@ async def get_portfolio_analysis(
 @router.get("/trade-check/{symbol}", response_model=Dict)
 async def check_trade_viability(
     symbol: str,
-    quantity: float = Query(..., description="Trade quantity"),
-    price: float = Query(..., description="Trade price"),
+    quantity: float = Query(..., gt=0, description="Trade quantity"),
+    price: float = Query(..., gt=0, description="Trade price"),
     db: AsyncSession = Depends(get_db)
 ):
     """Check if a trade is viable based on risk management and market conditions"""
@@ -51,43 +83,38 @@ async def check_trade_viability(
 
 @router.get("/market/prices/{symbol}", response_model=Dict)
 async def get_market_prices(symbol: str):
-    """Get historical close prices for a symbol (last 50 5m candles)"""
+    """Get historical close prices for a symbol (last 50 15m candles)"""
     try:
-        price_history_result = await binance_helper.get_dynamic_price_history(symbol, interval="5m", intervals=50)
-        close_prices = [entry["close"] for entry in price_history_result["data"]["history"]]
+        close_prices = await _get_close_prices(symbol, intervals=50)
         return {"symbol": symbol, "close_prices": close_prices}
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/straddle/dynamic-levels/{symbol}", response_model=Dict)
-async def get_dynamic_straddle_levels(symbol: str, db: AsyncSession = Depends(get_db)):
+async def get_dynamic_straddle_levels(symbol: str):
     """Get enhanced dynamic straddle entry levels based on market volatility"""
     try:
-        from app.services.straddle_service import StraddleService, StraddleStrategy
+        # The strategy only holds settings-derived thresholds, so the shared instance is safe to reuse
+        strategy = straddle_service.strategy
 
-        # Initialize services
-        straddle_service = StraddleService(db)
-        strategy = StraddleStrategy()
-
-        # Get current price
-        current_price_data = await binance_helper.get_current_price(symbol)
+        # Fetch the current price and historical close prices concurrently
+        current_price_data, close_prices = await asyncio.gather(
+            _call_upstream(binance_helper.get_price, symbol),
+            _call_upstream(_get_close_prices, symbol, intervals=50)
+        )
         current_price = current_price_data["price"]
-
-        # Fetch historical close prices for volatility calculation
-        price_history_result = await binance_helper.get_dynamic_price_history(symbol, interval="5m", intervals=50)
-        close_prices = [entry["close"] for entry in price_history_result["data"]["history"]]
+        prices = np.asarray(close_prices, dtype=np.float64)
 
         # Calculate volatilities for different timeframes
         # Short-term: last 10 prices (50 minutes)
-        short_term_prices = close_prices[-10:] if len(close_prices) >= 10 else close_prices
+        short_term_prices = prices[-10:]
         # Medium-term: last 20 prices (100 minutes)
-        medium_term_prices = close_prices[-20:] if len(close_prices) >= 20 else close_prices
+        medium_term_prices = prices[-20:]
         # Long-term: all available prices
-        long_term_prices = close_prices
+        long_term_prices = prices
 
-        short_vol = strategy.calculate_volatility(short_term_prices)
-        medium_vol = strategy.calculate_volatility(medium_term_prices)
-        long_vol = strategy.calculate_volatility(long_term_prices)
+        # One log-return pass shared by every timeframe
+        short_vol, medium_vol, long_vol = strategy.calculate_volatilities(prices, (10, 20, None))
 
         # Calculate dynamic entry levels
         entry_levels = strategy.calculate_entry_levels_dynamic(
@@ -106,29 +133,17 @@ async def get_dynamic_straddle_levels(symbol: str, db: AsyncSession = Depends(ge
                 "short_term": {
                     "periods": len(short_term_prices),
                     "volatility": round(short_vol * 100, 4),
-                    "price_range": {
-                        "min": min(short_term_prices),
-                        "max": max(short_term_prices),
-                        "spread": round((max(short_term_prices) - min(short_term_prices)) / current_price * 100, 2)
-                    }
+                    "price_range": _price_range(short_term_prices, current_price)
                 },
                 "medium_term": {
                     "periods": len(medium_term_prices),
                     "volatility": round(medium_vol * 100, 4),
-                    "price_range": {
-                        "min": min(medium_term_prices),
-                        "max": max(medium_term_prices),
-                        "spread": round((max(medium_term_prices) - min(medium_term_prices)) / current_price * 100, 2)
-                    }
+                    "price_range": _price_range(medium_term_prices, current_price)
                 },
                 "long_term": {
                     "periods": len(long_term_prices),
                     "volatility": round(long_vol * 100, 4),
-                    "price_range": {
-                        "min": min(long_term_prices),
-                        "max": max(long_term_prices),
-                        "spread": round((max(long_term_prices) - min(long_term_prices)) / current_price * 100, 2)
-                    }
+                    "price_range": _price_range(long_term_prices, current_price)
                 }
             },
             "entry_levels": entry_levels,
@@ -1,9 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.crud.curd_crypto import create_crypto_table, table_exists, sanitize_table_name, insert_crypto_data, insert_crypto_data_live
+from app.crud.curd_crypto import create_crypto_table, table_exists, sanitize_table_name, insert_crypto_data, insert_crypto_data_live_many
 from app.core.database import get_db
 from typing import List, Optional, Dict, Any, Union
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field
 from datetime import datetime
 
 router = APIRouter()
@@ -27,11 +27,7 @@ class CryptoDataInsertRequest(BaseModel):
     year: Optional[int] = Field(None, ge=2000, le=2100, description="Year (e.g., 2025)")
     current_price: float = Field(..., gt=0, description="Current price of the cryptocurrency")
     name: Optional[str] = None
-    timestamp: Optional[datetime] = None
-
-    @validator('timestamp', pre=True, always=True)
-    def set_timestamp(cls, v):
-        return v or datetime.now()
+    timestamp: Optional[datetime] = Field(default_factory=datetime.now)
 
 class DataInsertResponse(BaseModel):
     symbol: str
@@ -143,21 +139,19 @@ async def insert_data(
         # Normalize symbol
         symbol = request.symbol.strip().upper()
 
-        # Set default month/year if not provided
-        month = request.month
-        year = request.year
+        # One clock read shared by every default below
+        now = datetime.now()
 
-        if month is None or year is None:
-            now = datetime.now()
-            month = month or now.month
-            year = year or now.year
+        # Set default month/year if not provided
+        month = request.month or now.month
+        year = request.year or now.year
 
         # Prepare data dictionary
         data = {
             "current_price": request.current_price,
             "name": request.name or symbol,
-            "timestamp": request.timestamp,
-            "created_at": datetime.now()
+            "timestamp": request.timestamp or now,
+            "created_at": now
         }
 
         # Get table name for response
@@ -176,27 +170,6 @@ async def insert_data(
                 message=f"Data for {symbol} inserted successfully into {table_name}"
             )
         else:
-            # Check if table exists, if not create it first
-            table_exists_result = await table_exists(db, table_name)
-
-            if not table_exists_result:
-                # Table doesn't exist, try to create it
-                create_result = await create_crypto_table(db, symbol, month, year)
-
-                if create_result:
-                    # Try to insert data again
-                    retry_success = await insert_crypto_data(db, symbol, data, month, year)
-
-                    if retry_success:
-                        return DataInsertResponse(
-                            symbol=symbol,
-                            table_name=table_name,
-                            month=month,
-                            year=year,
-                            success=True,
-                            message=f"Table {table_name} created and data inserted successfully"
-                        )
-
             # If we get here, insertion failed
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -209,19 +182,29 @@ async def insert_data(
         )
 
 @router.get("/live/insert")
-async def insert_live_data(
-    db: AsyncSession = Depends(get_db)
-):
+async def insert_live_data(db: AsyncSession = Depends(get_db)):
     """
     Insert Live cryptocurrency data into the corresponding table
     """
     try:
         #static array of symbols
         symbols = ["BTC/USDT", "ETH/USDT","GUN/USDT"]
-        for symbol in symbols:
-            result = await insert_crypto_data_live(db, symbol);
-            print(result)
-        return(f"Data inserted for {len(symbols)} symbols")
+
+        # Fetch every ticker concurrently, then insert all rows in one transaction
+        outcomes = await insert_crypto_data_live_many(db, symbols)
+
+        results = {}
+        for symbol, outcome in outcomes.items():
+            if isinstance(outcome, Exception):
+                results[symbol] = {"success": False, "error": str(outcome)}
+            else:
+                results[symbol] = {"success": True, "current_price": outcome["current_price"]}
+
+        inserted = sum(1 for result in results.values() if result["success"])
+        return {
+            "message": f"Data inserted for {inserted} of {len(symbols)} symbols",
+            "results": results
+        }
     except Exception as e:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
@@ -1,14 +1,40 @@
-from fastapi import APIRouter, Depends, Query
-from fastapi.responses import HTMLResponse
+from fastapi import APIRouter, Depends, Query, Request
+from fastapi.responses import HTMLResponse, Response
 from sqlalchemy.ext.asyncio import AsyncSession
+from app.core.cache import cached
 from app.core.database import get_db
-from app.services.graph_service import get_price_and_swaps_for_chart, generate_price_swap_plot
+from app.services.graph_service import (
+    get_price_and_swaps_for_chart, generate_price_swap_plot, get_chart_fingerprint, get_time_range_for_duration
+)
+from datetime import datetime
 from typing import Optional
+import hashlib
 
 router = APIRouter()
 
+CHART_TTL = 60  # seconds a rendered chart stays in Redis
+CHART_WINDOW_BUCKET = 60  # seconds; relative windows start on this boundary so the ETag holds between steps
+
+def _chart_etag(*parts) -> str:
+    """Quoted ETag from the values that determine a chart"""
+    return '"' + hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest() + '"'
+
+def _window_start(duration: Optional[str]) -> Optional[datetime]:
+    """Start of the chart window for a relative duration, floored to CHART_WINDOW_BUCKET"""
+    if not duration:
+        return None
+    start_time, _ = get_time_range_for_duration(duration)
+    return datetime.fromtimestamp(start_time.timestamp() // CHART_WINDOW_BUCKET * CHART_WINDOW_BUCKET)
+
+@cached(ttl=CHART_TTL, key="chart:{etag}")
+async def _render_chart(etag: str, db: AsyncSession, symbol: str, month: Optional[int], year: Optional[int], start_time: Optional[datetime]) -> str:
+    """Render the chart HTML, shared across requests with the same ETag"""
+    result = await get_price_and_swaps_for_chart(db, symbol=symbol, month=month, year=year, start_time=start_time)
+    return generate_price_swap_plot(result)
+
 @router.get('/chart', response_class=HTMLResponse)
 async def chart(
+    request: Request,
     symbol: str = Query(..., description='Crypto symbol, e.g. BTC/USDT'),
     month: Optional[int] = Query(None, description='Month (1-12)'),
     year: Optional[int] = Query(None, description='Year (e.g. 2024)'),
@@ -17,7 +43,22 @@ async def chart(
 ):
     """
     Returns an interactive HTML chart of price and swap events for the given symbol and duration.
+    Responds 304 Not Modified while the window, the latest price row and the charted swaps are unchanged.
     """
-    result = await get_price_and_swaps_for_chart(db, symbol=symbol, month=month, year=year, duration=duration)
-    html_chart = generate_price_swap_plot(result)
-    return html_chart
+    # The window is resolved here, not in the service, so the rendered rows match the ETag
+    start_time = _window_start(duration)
+    fingerprint = await get_chart_fingerprint(db, symbol=symbol, month=month, year=year, start_time=start_time)
+    if fingerprint is None or fingerprint[0] is None:
+        result = await get_price_and_swaps_for_chart(db, symbol=symbol, month=month, year=year, start_time=start_time)
+        return generate_price_swap_plot(result)
+
+    last_timestamp, swap_digest = fingerprint
+    etag = _chart_etag(
+        symbol, month, year, start_time.isoformat() if start_time else None, last_timestamp.isoformat(), swap_digest
+    )
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip() for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers={"ETag": etag})
+
+    html_chart = await _render_chart(etag, db, symbol, month, year, start_time)
+    return HTMLResponse(content=html_chart, headers={"ETag": etag})
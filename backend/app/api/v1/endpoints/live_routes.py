@@ -1,11 +1,34 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from app.core.responses import ORJSONResponse
 from typing import List, Dict, Any, Optional
 from app.services.live_service import live_service
 from app.core.logger import logger
 from datetime import datetime
+from functools import lru_cache
+import numpy as np
 
 router = APIRouter()
 
+QUOTE_CURRENCIES = ("USDT", "USDC", "BUSD")
+
+@lru_cache(maxsize=4096)
+def _normalize_symbol(symbol: str) -> str:
+    """Upper-case a requested symbol and default its quote currency to USDT"""
+    symbol = symbol.strip().upper()
+    return symbol if symbol.endswith(QUOTE_CURRENCIES) else f"{symbol}USDT"
+
+def _top_k_desc(values: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the k largest values, largest first; equal values keep their original order"""
+    if k <= 0 or k >= values.size:
+        return np.argsort(-values, kind="stable")[:k]
+
+    # Partition in O(n) to find the k-th largest value, then order only the k selected indices
+    kth = -np.partition(-values, k - 1)[k - 1]
+    above = np.flatnonzero(values > kth)
+    ties = np.flatnonzero(values == kth)[:k - above.size]
+    selected = np.concatenate((above, ties))
+    return selected[np.lexsort((selected, -values[selected]))]
+
 @router.get("/tokens", response_model=List[Dict[str, Any]])
 async def get_live_tokens(
     symbols: Optional[str] = Query(None, description="Comma-separated list of token symbols (e.g., 'BTCUSDT,ETHUSDT')")
@@ -25,12 +48,7 @@ async def get_live_tokens(
         # Parse symbols if provided
         symbol_list = None
         if symbols:
-            symbol_list = [s.strip().upper() for s in symbols.split(",")]
-            # Ensure symbols end with USDT if they don't have a quote currency
-            symbol_list = [
-                s if s.endswith(("USDT", "USDC", "BUSD")) else f"{s}USDT"
-                for s in symbol_list
-            ]
+            symbol_list = [_normalize_symbol(s) for s in symbols.split(",")]
 
         tokens = await live_service.get_live_tokens(symbol_list)
 
@@ -39,7 +57,8 @@ async def get_live_tokens(
             return []
 
         logger.info(f"Successfully fetched {len(tokens)} tokens")
-        return tokens
+        # Token dicts are already JSON-ready; returning a response skips response-model validation
+        return ORJSONResponse(content=tokens)
 
     except Exception as e:
         logger.error(f"Error fetching live tokens: {str(e)}")
@@ -65,12 +84,7 @@ async def get_live_signals(
         # Parse symbols if provided
         symbol_list = None
         if symbols:
-            symbol_list = [s.strip().upper() for s in symbols.split(",")]
-            # Ensure symbols end with USDT if they don't have a quote currency
-            symbol_list = [
-                s if s.endswith(("USDT", "USDC", "BUSD")) else f"{s}USDT"
-                for s in symbol_list
-            ]
+            symbol_list = [_normalize_symbol(s) for s in symbols.split(",")]
             # Limit the number of symbols for performance
             symbol_list = symbol_list[:limit]
 
@@ -80,7 +94,7 @@ async def get_live_signals(
         signals = signals[:limit]
 
         logger.info(f"Generated {len(signals)} trading signals")
-        return signals
+        return ORJSONResponse(content=signals)
 
     except Exception as e:
         logger.error(f"Error generating live signals: {str(e)}")
@@ -125,19 +139,18 @@ async def get_market_overview():
     """
     try:
         # Fetch both tokens and signals concurrently
-        import asyncio
-
-        tokens_task = live_service.get_live_tokens()
-        signals_task = live_service.get_live_signals()
-
-        tokens, signals = await asyncio.gather(tokens_task, signals_task)
+        snapshot = await live_service.get_market_snapshot()
+        tokens, signals = snapshot["tokens"], snapshot["signals"]
+        now_ms = int(datetime.now().timestamp() * 1000)
 
-        # Calculate market summary
-        total_volume = sum(token.get("volume", 0) for token in tokens)
-        avg_change = sum(token.get("change24h", 0) for token in tokens) / len(tokens) if tokens else 0
+        # Calculate market summary from one pass over the tokens
+        volumes = np.fromiter((token.get("volume", 0) for token in tokens), dtype=np.float64, count=len(tokens))
+        changes = np.fromiter((token.get("change24h", 0) for token in tokens), dtype=np.float64, count=len(tokens))
+        total_volume = float(volumes.sum())
+        avg_change = float(changes.mean()) if changes.size else 0
 
         # Count positive and negative performers
-        positive_count = sum(1 for token in tokens if token.get("change24h", 0) > 0)
+        positive_count = int(np.count_nonzero(changes > 0))
         negative_count = len(tokens) - positive_count
 
         market_summary = {
@@ -147,16 +160,17 @@ async def get_market_overview():
             "positivePerformers": positive_count,
             "negativePerformers": negative_count,
             "activeSignals": len(signals),
-            "timestamp": int(datetime.now().timestamp() * 1000)
+            "timestamp": now_ms
         }
 
-        return {
+        # Already plain JSON types; skip response-model validation and serialise with orjson directly
+        return ORJSONResponse(content={
             "tokens": tokens[:10],  # Top 10 tokens
             "signals": signals[:5],  # Top 5 signals
             "marketSummary": market_summary,
             "status": "success",
-            "timestamp": int(datetime.now().timestamp() * 1000)
-        }
+            "timestamp": now_ms
+        })
 
     except Exception as e:
         logger.error(f"Error fetching market overview: {str(e)}")
@@ -179,7 +193,7 @@ async def get_popular_tokens(limit: int = Query(10, description="Number of token
         # Sort by volume (highest first)
         tokens.sort(key=lambda x: x.get("volume", 0), reverse=True)
 
-        return tokens[:limit]
+        return ORJSONResponse(content=tokens[:limit])
 
     except Exception as e:
         logger.error(f"Error fetching popular tokens: {str(e)}")
@@ -197,23 +211,21 @@ async def get_trending_tokens(limit: int = Query(5, description="Number of trend
         if not tokens:
             return []
 
-        # Sort by absolute price change percentage (most volatile first)
-        tokens.sort(key=lambda x: abs(x.get("change24h", 0)), reverse=True)
+        # Rank by absolute price change percentage (most volatile first, ties keep their order)
+        changes = np.abs(np.fromiter((token.get("change24h", 0) for token in tokens), dtype=np.float64, count=len(tokens)))
+        order = _top_k_desc(changes, limit)
 
         # Return top trending tokens
-        trending = tokens[:limit]
-
-        # Add trending score
-        for token in trending:
-            change = abs(token.get("change24h", 0))
-            volatility = token.get("volatility", 0)
-            volume = token.get("volume", 0)
+        trending = [tokens[i] for i in order]
 
-            # Simple trending score calculation
-            trending_score = (change * 0.4) + (volatility * 0.3) + (volume / 1000000 * 0.3)
+        # Add trending score (simple weighted sum, computed for all trending tokens at once)
+        volatility = np.fromiter((token.get("volatility", 0) for token in trending), dtype=np.float64, count=len(trending))
+        volume = np.fromiter((token.get("volume", 0) for token in trending), dtype=np.float64, count=len(trending))
+        trending_scores = (changes[order] * 0.4) + (volatility * 0.3) + (volume / 1000000 * 0.3)
+        for token, trending_score in zip(trending, trending_scores.tolist()):
             token["trendingScore"] = round(trending_score, 2)
 
-        return trending
+        return ORJSONResponse(content=trending)
 
     except Exception as e:
         logger.error(f"Error fetching trending tokens: {str(e)}")
@@ -1,127 +1,154 @@
-from fastapi import APIRouter, Depends, HTTPException, Query
-from typing import Dict, List, Optional, Any
+import hashlib
+from operator import attrgetter
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Dict, List, Literal, Optional, Any
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.core.database import get_db
-from app.crud.crud_user_portfolio_summary import user_portfolio_summary_crud
-from app.core.logger import logger
+from app.core.database import SessionLocal, get_db
+from app.crud.crud_user_portfolio_summary import latest_summary_key, user_portfolio_summary_crud
+from app.core.cache import cache_get, cache_set
+from app.schemas.portfolio_summary import PortfolioHistoryRow, PortfolioSummaryOut
+from app.core.routing import ErrorLoggingRoute
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorLoggingRoute)
 
+LATEST_SUMMARY_TTL = 10  # seconds; create_summary invalidates the key on write
+SUMMARY_MAX_AGE = 5  # seconds clients may reuse a summary before revalidating
 
-@router.get("/latest", response_model=Dict[str, Any])
+
+def _etag(data: bytes) -> str:
+    """Quoted ETag for a response body or the values that determine it"""
+    return '"' + hashlib.blake2b(data, digest_size=8).hexdigest() + '"'
+
+
+def _not_modified(request: Request, etag: str) -> bool:
+    """Whether the client's If-None-Match already holds etag"""
+    if_none_match = request.headers.get("if-none-match", "")
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def _cache_headers(etag: str) -> Dict[str, str]:
+    return {"ETag": etag, "Cache-Control": f"private, max-age={SUMMARY_MAX_AGE}"}
+
+
+@router.get("/latest", response_model=PortfolioSummaryOut)
 async def get_latest_portfolio_summary(
+    request: Request,
     user_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get the latest portfolio summary
+
+    Responds 304 Not Modified when the client's copy is still current.
     """
-    try:
-        summary = await user_portfolio_summary_crud.get_latest_summary(
-            db=db,
-            user_id=user_id
-        )
-
-        if not summary:
-            raise HTTPException(status_code=404, detail="No portfolio summary found")
-
-        # Format response
-        return {
-            "id": summary.id,
-            "timestamp": summary.timestamp,
-            "total_value": summary.total_value,
-            "total_cost_basis": summary.total_cost_basis,
-            "total_profit_loss": summary.total_profit_loss,
-            "total_profit_loss_percentage": summary.total_profit_loss_percentage,
-            "crypto_value": summary.crypto_value,
-            "stable_value": summary.stable_value,
-            "daily_change": summary.daily_change,
-            "weekly_change": summary.weekly_change,
-            "monthly_change": summary.monthly_change,
-            "assets": summary.assets,
-            "trades_today": summary.trades_today,
-            "swaps_today": summary.swaps_today,
-            "market_trend": summary.market_trend,
-            "market_volatility": summary.market_volatility,
-            "is_hedged": summary.is_hedged,
-            "risk_level": summary.risk_level
-        }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting latest portfolio summary: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to get portfolio summary: {str(e)}")
+    cache_key = latest_summary_key(user_id)
+    payload = await cache_get(cache_key)
+    if payload is None:
+        payload = await _latest_summary_payload(db, user_id)
+        # Store the serialized body so hits skip both the query and the encoding
+        await cache_set(cache_key, payload, LATEST_SUMMARY_TTL)
+
+    etag = _etag(payload)
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
+    return Response(content=payload, media_type="application/json", headers=_cache_headers(etag))
+
+
+async def _latest_summary_payload(db: AsyncSession, user_id: Optional[int]) -> bytes:
+    """Serialized latest summary, raising 404 when there is none"""
+    summary = await user_portfolio_summary_crud.get_latest_summary(
+        db=db,
+        user_id=user_id
+    )
+
+    if not summary:
+        raise HTTPException(status_code=404, detail="No portfolio summary found")
 
+    # Serialized straight from the ORM row by pydantic's serializer
+    return PortfolioSummaryOut.model_validate(summary).model_dump_json().encode()
 
-@router.get("/history", response_model=List[Dict[str, Any]])
+
+@router.get("/history", response_model=List[PortfolioHistoryRow])
 async def get_portfolio_history(
     days: int = Query(7, ge=1, le=30),
-    interval: str = Query("daily", regex="^(daily|hourly)$"),
-    user_id: Optional[int] = None,
-    db: AsyncSession = Depends(get_db)
+    interval: Literal["daily", "hourly"] = Query("daily"),
+    user_id: Optional[int] = None
 ):
     """
     Get historical portfolio summaries for the specified time period
+
+    Rows are streamed as a JSON array while they are read from the database.
     """
+    # The session is owned by the stream: a Depends(get_db) session would be
+    # closed before StreamingResponse sends the body
+    db = SessionLocal()
+    rows = user_portfolio_summary_crud.stream_historical_summaries(
+        db,
+        user_id=user_id,
+        days=days,
+        interval=interval
+    )
     try:
-        summaries = await user_portfolio_summary_crud.get_historical_summaries(
-            db=db,
-            user_id=user_id,
-            days=days,
-            interval=interval
-        )
-
-        if not summaries:
-            raise HTTPException(status_code=404, detail="No portfolio history found")
-
-        # Format response
-        result = []
-        for summary in summaries:
-            result.append({
-                "id": summary.id,
-                "timestamp": summary.timestamp,
-                "total_value": summary.total_value,
-                "total_profit_loss": summary.total_profit_loss,
-                "total_profit_loss_percentage": summary.total_profit_loss_percentage,
-                "crypto_value": summary.crypto_value,
-                "stable_value": summary.stable_value,
-                "daily_change": summary.daily_change,
-                "market_trend": summary.market_trend,
-                "risk_level": summary.risk_level
-            })
-
-        return result
-    except HTTPException:
+        first = await rows.__anext__()
+    except StopAsyncIteration:
+        await db.close()
+        raise HTTPException(status_code=404, detail="No portfolio history found")
+    except Exception:
+        await rows.aclose()
+        await db.close()
         raise
-    except Exception as e:
-        logger.error(f"Error getting portfolio history: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to get portfolio history: {str(e)}")
+
+    async def body():
+        try:
+            yield b"[" + _history_row_json(first)
+            async for row in rows:
+                yield b"," + _history_row_json(row)
+            yield b"]"
+        finally:
+            await rows.aclose()
+            await db.close()
+
+    return StreamingResponse(body(), media_type="application/json")
+
+
+# History row fields, read off each summary in one C-level call
+_HISTORY_FIELDS = tuple(PortfolioHistoryRow.model_fields)
+_history_values = attrgetter(*_HISTORY_FIELDS)
+
+
+def _history_row_json(summary) -> bytes:
+    return orjson.dumps(dict(zip(_HISTORY_FIELDS, _history_values(summary))))
 
 
 @router.get("/assets", response_model=Dict[str, Any])
 async def get_portfolio_assets(
+    request: Request,
     user_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db)
 ):
     """
     Get detailed breakdown of assets in the portfolio from the latest summary
+
+    Responds 304 Not Modified when the client's copy is still current.
     """
-    try:
-        summary = await user_portfolio_summary_crud.get_latest_summary(
-            db=db,
-            user_id=user_id
-        )
+    latest = await user_portfolio_summary_crud.get_latest_assets_json(db=db, user_id=user_id)
 
-        if not summary:
-            raise HTTPException(status_code=404, detail="No portfolio summary found")
+    if not latest:
+        raise HTTPException(status_code=404, detail="No portfolio summary found")
+    summary_id, timestamp, assets_json = latest
 
-        if not summary.assets:
-            return {"assets": {}}
+    # A summary row is never updated in place, so its id and timestamp identify the assets
+    etag = _etag(f"{summary_id}:{timestamp}".encode())
+    if _not_modified(request, etag):
+        return Response(status_code=304, headers=_cache_headers(etag))
 
-        # Return the assets JSON directly
-        return {"assets": summary.assets}
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting portfolio assets: {str(e)}")
-        raise HTTPException(status_code=500, detail=f"Failed to get portfolio assets: {str(e)}")
+    # The stored JSON text is passed through without being parsed and re-encoded
+    if not assets_json or assets_json == "null":
+        assets_json = "{}"
+    return Response(
+        content=b'{"assets":' + assets_json.encode() + b"}",
+        media_type="application/json",
+        headers=_cache_headers(etag)
+    )
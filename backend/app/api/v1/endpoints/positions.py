@@ -71,8 +71,10 @@ async def read_position_trades(
     """
     Get trades for a specific position.
     """
-    position = await crud.position.get(db=db, id=position_id)
-    if not position:
+    # Existence check and trade page in one round trip
+    trades = await crud.trade.get_by_position_with_parent_check(
+        db, position_id=position_id, skip=skip, limit=limit
+    )
+    if trades is None:
         raise HTTPException(status_code=404, detail="Position not found")
-    trades = await crud.trade.get_by_position(db, position_id=position_id, skip=skip, limit=limit)
     return trades
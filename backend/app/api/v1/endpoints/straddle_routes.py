@@ -1,14 +1,38 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Literal
 from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
-from app.services.straddle_service import StraddleService, BreakoutSignal
+from app.services.straddle_service import StraddleService
 from app.models.trade import Trade
 from app.schemas.trade import TradeCreate, TradeResponse, TradingStatusResponse
-from pydantic import BaseModel, Field, validator
-import pandas as pd
+from pydantic import BaseModel, Field, PositiveFloat, PrivateAttr, model_validator
+from app.core.responses import ORJSONResponse
+from app.core.routing import ErrorLoggingRoute
+import numpy as np
 
-router = APIRouter()
+router = APIRouter(route_class=ErrorLoggingRoute)
+
+
+async def get_straddle_service(db: AsyncSession = Depends(get_db)) -> StraddleService:
+    """Straddle service bound to the request's database session.
+
+    Instances are not shared: concurrent requests each need their own session, and
+    construction is only two attribute sets since the strategy is module-level.
+    """
+    return StraddleService(db)
+
+
+_TRADE_RESPONSE_FIELDS = tuple(TradeResponse.model_fields)
+
+
+def _trade_content(trade: Trade) -> Dict[str, Any]:
+    """TradeResponse fields read straight off a stored trade"""
+    return {field: getattr(trade, field) for field in _TRADE_RESPONSE_FIELDS}
+
+
+def _trades_response(trades: List[Trade]) -> ORJSONResponse:
+    """Serialize stored trades without re-validating them against TradeResponse"""
+    return ORJSONResponse(content=[_trade_content(trade) for trade in trades])
 
 class StraddleSetupRequest(BaseModel):
     symbol: str = Field(..., description="Trading pair symbol")
@@ -17,18 +41,31 @@ class StraddleSetupRequest(BaseModel):
 
 class MarketAnalysisRequest(BaseModel):
     symbol: str = Field(..., description="Trading pair symbol")
-    prices: List[float] = Field(..., min_items=10, description="Historical price data")
-    volumes: List[float] = Field(..., min_items=10, description="Historical volume data")
+    # Positivity (NaN included) and length are checked by pydantic-core while parsing
+    prices: List[PositiveFloat] = Field(..., min_length=10, description="Historical price data")
+    volumes: List[PositiveFloat] = Field(..., min_length=10, description="Historical volume data")
+
+    # float64 copies of prices/volumes, built once after validation and handed to the service
+    _price_array: np.ndarray = PrivateAttr()
+    _volume_array: np.ndarray = PrivateAttr()
+
+    @model_validator(mode='after')
+    def build_arrays(self):
+        self._price_array = np.asarray(self.prices, dtype=np.float64)
+        self._volume_array = np.asarray(self.volumes, dtype=np.float64)
+        return self
 
-    @validator('prices', 'volumes')
-    def validate_data_length(cls, v):
-        if not all(x > 0 for x in v):
-            raise ValueError("All values must be greater than 0")
-        return v
+    @property
+    def price_array(self) -> np.ndarray:
+        return self._price_array
+
+    @property
+    def volume_array(self) -> np.ndarray:
+        return self._volume_array
 
 class BreakoutRequest(BaseModel):
     symbol: str = Field(..., description="Trading pair symbol")
-    direction: str = Field(..., description="Breakout direction (UP/DOWN)")
+    direction: Literal["UP", "DOWN"] = Field(..., description="Breakout direction (UP/DOWN)")
     price: float = Field(gt=0, description="Breakout price")
     confidence: float = Field(ge=0, le=1, description="Signal confidence level")
     volume_spike: bool = Field(default=False, description="Volume spike indicator")
@@ -36,12 +73,6 @@ class BreakoutRequest(BaseModel):
     rsi_divergence: bool = Field(default=False, description="RSI divergence indicator")
     macd_crossover: bool = Field(default=False, description="MACD crossover indicator")
 
-    @validator('direction')
-    def validate_direction(cls, v):
-        if v not in ["UP", "DOWN"]:
-            raise ValueError('direction must be either "UP" or "DOWN"')
-        return v
-
 class straddleStartRequest(BaseModel):
     symbol: str = Field(..., description="Trading pair symbol")
     max_trade_limit: float = Field(default=0, description="Maximum trade limit")
@@ -53,7 +84,7 @@ class CloserRequest(BaseModel):
 @router.post("/setup/create", response_model=List[TradeResponse])
 async def create_straddle_setup(
     setup: StraddleSetupRequest,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Create a new straddle setup for a given symbol.
@@ -61,31 +92,25 @@ async def create_straddle_setup(
     Args:
         symbol: Trading pair symbol (e.g. BTC/USDT)
         setup: Setup parameters including current price and quantity
-        db: Database session
+        straddle_service: Straddle service bound to the request's database session
 
     Returns:
         List of created trade orders (long and short positions)
     """
     try:
-        straddle_service = StraddleService(db)
         trades = await straddle_service.create_straddle_trades(
             symbol=setup.symbol,
             current_price=setup.current_price,
             quantity=setup.quantity
         )
-        return trades
+        return _trades_response(trades)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to create straddle setup: {str(e)}"
-        )
 
 @router.post("/analyze", response_model=Dict[str, Any])
 async def analyze_market(
     analysis: MarketAnalysisRequest,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Analyze market conditions for potential breakout.
@@ -93,21 +118,19 @@ async def analyze_market(
     Args:
         symbol: Trading pair symbol
         analysis: Analysis parameters including historical prices and volumes
-        db: Database session
+        straddle_service: Straddle service bound to the request's database session
 
     Returns:
         Market analysis result including breakout signals and market conditions
     """
     try:
-        straddle_service = StraddleService(db)
         symbol = analysis.symbol
-        prices_series = pd.Series(analysis.prices)
-        volumes_series = pd.Series(analysis.volumes)
 
+        # The validator's float64 arrays are wrapped by the service without another copy
         result = await straddle_service.analyze_market_conditions(
             symbol=symbol,
-            prices=prices_series,
-            volume=volumes_series
+            prices=analysis.price_array,
+            volume=analysis.volume_array
         )
 
         if not result["success"]:
@@ -141,16 +164,11 @@ async def analyze_market(
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to analyze market conditions: {str(e)}"
-        )
 
 @router.post("/breakout", response_model=TradeResponse)
 async def handle_breakout_event(
     breakout: BreakoutRequest,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Handle a breakout event for a given symbol.
@@ -158,123 +176,88 @@ async def handle_breakout_event(
     Args:
         symbol: Trading pair symbol
         breakout: Breakout event parameters
-        db: Database session
+        straddle_service: Straddle service bound to the request's database session
 
     Returns:
         Activated trade details
     """
     try:
-        straddle_service = StraddleService(db)
-        breakout_signal = BreakoutSignal(
-            symbol=breakout.symbol,
-            direction=breakout.direction,
-            price=breakout.price,
-            confidence=breakout.confidence,
-            volume_spike=breakout.volume_spike,
-            bb_squeeze = breakout.bb_squeeze,
-            rsi_divergence=breakout.rsi_divergence,
-            macd_crossover=breakout.macd_crossover
-        )
-
+        # The validated request satisfies BreakoutDirection, which is all handle_breakout reads
         result = await straddle_service.handle_breakout(
             symbol=breakout.symbol,
-            breakout_signal=breakout_signal
+            breakout_signal=breakout
         )
 
         if result:
-            return result
+            return ORJSONResponse(content=_trade_content(result))
         raise HTTPException(
             status_code=404,
             detail="No pending trades found for the symbol"
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to handle breakout: {str(e)}"
-        )
 
 @router.post("/close", response_model=List[TradeResponse])
 async def close_straddle_positions(
     closer: CloserRequest,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Close all open straddle positions for a given symbol.
 
     Args:
         symbol: Trading pair symbol
-        db: Database session
+        straddle_service: Straddle service bound to the request's database session
 
     Returns:
         List of closed trade positions
     """
     try:
-        straddle_service = StraddleService(db)
         closed_trades = await straddle_service.close_straddle_trades(closer.symbol)
 
         if closed_trades:
-            return closed_trades
+            return _trades_response(closed_trades)
         raise HTTPException(
             status_code=404,
             detail="No open trades found for the symbol"
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to close straddle positions: {str(e)}"
-        )
 
 @router.post("/auto-buy-sell-straddle-start", response_model=List[TradeResponse])
 async def auto_buy_sell_straddle_start(
     params: straddleStartRequest,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Auto buy or sell straddle based on market conditions
     """
     try:
-        straddle_service = StraddleService(db)
         trades = await straddle_service.auto_buy_sell_straddle_start(params.symbol, params.max_trade_limit,params.trade_amount)
         return trades
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to close straddle positions: {str(e)}"
-        )
 
 @router.post("/auto-buy-sell-straddle-close", response_model=List[TradeResponse])
 async def auto_buy_sell_straddle_close(
     params: CloserRequest,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Auto close straddle position for a given symbol"""
     try:
-        straddle_service = StraddleService(db)
         trades = await straddle_service.auto_buy_sell_straddle_close(params.symbol)
-        return trades
+        return _trades_response(trades)
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to close straddle positions: {str(e)}"
-        )
 
 @router.post("/change-straddle-status", response_model=bool)
 async def change_straddle_status(
     status: bool,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """Change the straddle status"""
     try:
-        straddle_service = StraddleService(db)
         status = await straddle_service.change_straddle_status()
         return status
     except ValueError as e:
@@ -283,7 +266,7 @@ async def change_straddle_status(
 @router.post("/auto-buy-sell-straddle-inprogress", response_model=TradingStatusResponse)
 async def auto_buy_sell_straddle_inprogress(
     params: CloserRequest,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Auto buy or sell straddle based on market conditions
@@ -292,21 +275,15 @@ async def auto_buy_sell_straddle_inprogress(
         Comprehensive trading status including position metrics, trade information, market trends, and swap details
     """
     try:
-        straddle_service = StraddleService(db)
         trading_status = await straddle_service.auto_buy_sell_straddle_inprogress(params.symbol)
         return trading_status
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to process straddle positions: {str(e)}"
-        )
 
 @router.get("/trading-status-example/{symbol}", response_model=TradingStatusResponse)
 async def get_trading_status_example(
     symbol: str,
-    db: AsyncSession = Depends(get_db)
+    straddle_service: StraddleService = Depends(get_straddle_service)
 ):
     """
     Get example of comprehensive trading status information for a symbol
@@ -320,14 +297,8 @@ async def get_trading_status_example(
         Comprehensive trading status including metrics, trend analysis, and trade information
     """
     try:
-        straddle_service = StraddleService(db)
         trading_status = await straddle_service.auto_buy_sell_straddle_inprogress(symbol)
         return trading_status
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Failed to get trading status: {str(e)}"
-        )
 
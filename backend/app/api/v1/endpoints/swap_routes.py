@@ -1,4 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Query
+from app.core.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from typing import Dict, Optional
 from app.core.database import get_db
@@ -7,9 +8,21 @@ from app.services.swap_service import swap_service
 from app.core.config import settings
 from app.core.logger import logger
 from datetime import datetime
+import asyncio
 
 router = APIRouter()
 
+TOKEN_LIST_MAX_AGE = 3600  # seconds clients/CDNs may cache the supported token list
+SAMPLE_QUOTE_AMOUNT = "1000000000000000000"  # 1 USDT in wei, quoted by the connectivity checks
+
+async def _sample_quote() -> Dict:
+    """Quote 1 USDT -> USDC, the simple request used to test the 1inch API"""
+    return await oneinch_service.get_quote(
+        src_token=oneinch_service.get_token_address("USDT"),
+        dst_token=oneinch_service.get_token_address("USDC"),
+        amount=SAMPLE_QUOTE_AMOUNT
+    )
+
 @router.get("/quote", response_model=Dict)
 async def get_swap_quote(
     from_symbol: str = Query(..., description="Source token symbol"),
@@ -140,15 +153,19 @@ async def approve_token(
 async def get_supported_tokens():
     """Get list of supported tokens"""
     try:
-        return {
-            "success": True,
-            "data": {
-                "supported_tokens": oneinch_service.token_addresses,
-                "chain_id": oneinch_service.chain_id,
-                "swap_enabled": settings.SWAP_ENABLED
+        # The token map is serialised once per refresh and embedded as-is
+        return ORJSONResponse(
+            content={
+                "success": True,
+                "data": {
+                    "supported_tokens": oneinch_service.token_addresses_json(),
+                    "chain_id": oneinch_service.chain_id,
+                    "swap_enabled": settings.SWAP_ENABLED
+                },
+                "timestamp": datetime.now().isoformat()
             },
-            "timestamp": datetime.now().isoformat()
-        }
+            headers={"Cache-Control": f"public, max-age={TOKEN_LIST_MAX_AGE}"}
+        )
 
     except Exception as e:
         logger.error(f"Error getting supported tokens: {str(e)}")
@@ -178,13 +195,10 @@ async def get_swap_status():
 @router.post("/test-connection", response_model=Dict)
 async def test_oneinch_connection():
     """Test connection to 1inch API"""
+    # Taken once so success and error responses report the same request time
+    timestamp = datetime.now().isoformat()
     try:
-        # Test with a simple quote request
-        test_quote = await oneinch_service.get_quote(
-            src_token=oneinch_service.get_token_address("USDT"),
-            dst_token=oneinch_service.get_token_address("USDC"),
-            amount="1000000000000000000"  # 1 USDT in wei
-        )
+        test_quote = await _sample_quote()
 
         return {
             "success": True,
@@ -193,7 +207,7 @@ async def test_oneinch_connection():
                 "api_response": test_quote,
                 "chain_id": oneinch_service.chain_id
             },
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
 
     except Exception as e:
@@ -201,7 +215,7 @@ async def test_oneinch_connection():
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
 
 @router.get("/available-tokens", response_model=Dict)
@@ -212,11 +226,13 @@ async def get_available_tokens(db: AsyncSession = Depends(get_db)):
         swap_service.db = db
 
         tokens = await swap_service.get_token()
-        return {
-            "success": True,
-            "data": tokens,
-            "timestamp": datetime.now().isoformat()
-        }
+        return ORJSONResponse(
+            content={
+                "success": True,
+                "data": tokens,
+                "timestamp": datetime.now().isoformat()
+            }
+        )
 
     except Exception as e:
         logger.error(f"Error getting available tokens: {str(e)}")
@@ -256,10 +272,12 @@ async def test_swap_simulation(
 @router.get("/health-check", response_model=Dict)
 async def comprehensive_health_check():
     """Comprehensive health check for 1inch integration"""
+    # Taken once, before the Web3/1inch probes, and reused by the error response
+    timestamp = datetime.now().isoformat()
     try:
         health_status = {
             "overall_status": "OK",
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": timestamp,
             "configuration": {
                 "api_key_configured": bool(oneinch_service.api_key),
                 "wallet_configured": bool(oneinch_service.wallet_address),
@@ -277,24 +295,32 @@ async def comprehensive_health_check():
             "errors": []
         }
 
-        # Test Web3 connection
-        try:
-            if oneinch_service.web3:
-                latest_block = oneinch_service.web3.eth.block_number
+        # Probe Web3 and the 1inch API concurrently; they are independent round trips
+        async def _latest_block():
+            # web3.eth.block_number is a blocking RPC call
+            return await asyncio.to_thread(lambda: oneinch_service.web3.eth.block_number)
+
+        probes = []
+        if oneinch_service.web3:
+            probes.append(_latest_block())
+        # Only test the API if a key is configured
+        if oneinch_service.api_key:
+            probes.append(_sample_quote())
+        results = iter(await asyncio.gather(*probes, return_exceptions=True))
+
+        if oneinch_service.web3:
+            latest_block = next(results)
+            if isinstance(latest_block, Exception):
+                health_status["errors"].append(f"Web3 connection failed: {str(latest_block)}")
+            else:
                 health_status["connectivity"]["web3_connected"] = True
                 health_status["connectivity"]["latest_block"] = latest_block
-        except Exception as e:
-            health_status["errors"].append(f"Web3 connection failed: {str(e)}")
 
-        # Test 1inch API accessibility (only if API key is configured)
         if oneinch_service.api_key:
+            test_quote = next(results)
             try:
-                # Test with a simple quote request
-                test_quote = await oneinch_service.get_quote(
-                    src_token=oneinch_service.get_token_address("USDT"),
-                    dst_token=oneinch_service.get_token_address("USDC"),
-                    amount="1000000000000000000"  # 1 USDT in wei
-                )
+                if isinstance(test_quote, Exception):
+                    raise test_quote
                 health_status["connectivity"]["api_accessible"] = True
                 health_status["connectivity"]["sample_quote"] = {
                     "from": "1 USDT",
@@ -319,55 +345,53 @@ async def comprehensive_health_check():
         return {
             "success": False,
             "error": str(e),
-            "timestamp": datetime.now().isoformat()
+            "timestamp": timestamp
         }
 
 @router.get("/tokens/search")
 async def search_tokens(
     query: str,
-    limit: int = 10,
-    db: AsyncSession = Depends(get_db)
+    limit: int = 10
 ):
     """Search for tokens by name or symbol"""
     try:
-        oneinch_service.db = db
         results = oneinch_service.search_tokens(query, limit)
-        return {
-            "success": True,
-            "query": query,
-            "results": results,
-            "total_found": len(results)
-        }
+        return ORJSONResponse(
+            content={
+                "success": True,
+                "query": query,
+                "results": results,
+                "total_found": len(results)
+            }
+        )
     except Exception as e:
         logger.error(f"Error searching tokens: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/tokens/popular")
 async def get_popular_tokens(
-    limit: int = 20,
-    db: AsyncSession = Depends(get_db)
+    limit: int = 20
 ):
     """Get list of popular tokens"""
     try:
-        oneinch_service.db = db
         popular_tokens = oneinch_service.get_popular_tokens(limit)
-        return {
-            "success": True,
-            "popular_tokens": popular_tokens,
-            "total": len(popular_tokens)
-        }
+        return ORJSONResponse(
+            content={
+                "success": True,
+                "popular_tokens": popular_tokens,
+                "total": len(popular_tokens)
+            }
+        )
     except Exception as e:
         logger.error(f"Error getting popular tokens: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/tokens/info/{symbol}")
 async def get_token_info(
-    symbol: str,
-    db: AsyncSession = Depends(get_db)
+    symbol: str
 ):
     """Get detailed information about a specific token"""
     try:
-        oneinch_service.db = db
         token_info = oneinch_service.get_token_info(symbol)
 
         if "error" in token_info:
@@ -384,12 +408,9 @@ async def get_token_info(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.get("/tokens/cache/info")
-async def get_cache_info(
-    db: AsyncSession = Depends(get_db)
-):
+async def get_cache_info():
     """Get information about the token cache"""
     try:
-        oneinch_service.db = db
         cache_info = oneinch_service.get_cache_info()
         return {
             "success": True,
@@ -400,12 +421,9 @@ async def get_cache_info(
         raise HTTPException(status_code=500, detail=str(e))
 
 @router.post("/tokens/cache/refresh")
-async def refresh_token_cache(
-    db: AsyncSession = Depends(get_db)
-):
+async def refresh_token_cache():
     """Manually refresh the token cache from 1inch API"""
     try:
-        oneinch_service.db = db
         total_tokens = oneinch_service.refresh_token_addresses()
         return {
             "success": True,
@@ -419,39 +437,35 @@ async def refresh_token_cache(
 @router.get("/tokens/all")
 async def get_all_tokens(
     page: int = 1,
-    per_page: int = 50,
-    db: AsyncSession = Depends(get_db)
+    per_page: int = 50
 ):
     """Get all available tokens with pagination"""
     try:
-        oneinch_service.db = db
-        all_tokens = []
-        for symbol, address in oneinch_service.token_addresses.items():
-            all_tokens.append({
-                "symbol": symbol,
-                "address": address
-            })
-
-        # Sort by symbol
-        all_tokens.sort(key=lambda x: x["symbol"])
-
-        # Pagination
+        sorted_tokens = oneinch_service.sorted_token_items()
+        total_tokens = len(sorted_tokens)
+
+        # Pagination: only the requested page is turned into dicts
         start_idx = (page - 1) * per_page
         end_idx = start_idx + per_page
-        paginated_tokens = all_tokens[start_idx:end_idx]
-
-        return {
-            "success": True,
-            "tokens": paginated_tokens,
-            "pagination": {
-                "page": page,
-                "per_page": per_page,
-                "total_tokens": len(all_tokens),
-                "total_pages": (len(all_tokens) + per_page - 1) // per_page,
-                "has_next": end_idx < len(all_tokens),
-                "has_prev": page > 1
+        paginated_tokens = [
+            {"symbol": symbol, "address": address}
+            for symbol, address in sorted_tokens[start_idx:end_idx]
+        ]
+
+        return ORJSONResponse(
+            content={
+                "success": True,
+                "tokens": paginated_tokens,
+                "pagination": {
+                    "page": page,
+                    "per_page": per_page,
+                    "total_tokens": total_tokens,
+                    "total_pages": (total_tokens + per_page - 1) // per_page,
+                    "has_next": end_idx < total_tokens,
+                    "has_prev": page > 1
+                }
             }
-        }
+        )
     except Exception as e:
         logger.error(f"Error getting all tokens: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
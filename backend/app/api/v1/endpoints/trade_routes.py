@@ -1,23 +1,27 @@
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
-from typing import List, Dict
+from typing import List, Dict, Optional
 from app.core.database import get_db
+from app.controllers.trade_controller import trade_controller
+from app.schemas import trade as trade_schemas
 from app.services.portfolio_service import portfolio_service
 
 router = APIRouter()
 
-@router.get("/", response_model=List[Dict])
+@router.get("/", response_model=List[trade_schemas.Trade])
 async def get_trades(
     db: AsyncSession = Depends(get_db),
     skip: int = 0,
-    limit: int = 100
+    limit: int = 100,
+    symbol: Optional[str] = Query(None, description="Filter by trading symbol"),
+    status: Optional[str] = Query(None, description="Filter by trade status"),
+    before_id: Optional[int] = Query(None, description="Id of the last trade on the previous page (keyset paging)")
 ):
-    """Get all trades"""
-    try:
-        return await portfolio_service.get_trades(skip=skip, limit=limit)
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=str(e))
+    """Get trades, newest first"""
+    return await trade_controller.get_trades(
+        db, skip=skip, limit=limit, symbol=symbol, status=status, before_id=before_id
+    )
 
 @router.get("/{trade_id}", response_model=Dict)
 async def get_trade(
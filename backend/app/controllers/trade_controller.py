@@ -64,12 +64,13 @@ class TradeController:
         skip: int = 0,
         limit: int = 100,
         symbol: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        before_id: Optional[int] = None
     ) -> List[trade_schemas.Trade]:
         """Get trades with filters"""
         try:
             return await trade_service.get_trades(
-                db, skip=skip, limit=limit, symbol=symbol, status=status
+                db, skip=skip, limit=limit, symbol=symbol, status=status, before_id=before_id
             )
         except Exception as e:
             raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,118 @@
+import functools
+import inspect
+import random
+import time
+from typing import Any, Callable, Optional
+
+import orjson
+
+from .config import settings
+from .logger import logger
+
+try:
+    import redis.asyncio as redis
+except ImportError:  # Caching is skipped when the redis client isn't installed
+    redis = None
+
+RETRY_AFTER = 30  # seconds to bypass Redis after a connection error
+TTL_JITTER = 0.1  # fraction of the TTL added at random so keys written together don't expire together
+
+_client = None
+_unavailable_until = 0.0
+
+
+def get_redis() -> Optional[Any]:
+    """Get the shared Redis client, or None while Redis is unavailable"""
+    global _client
+    if redis is None or time.monotonic() < _unavailable_until:
+        return None
+    if _client is None:
+        _client = redis.Redis(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB_CACHE,
+            socket_connect_timeout=0.5,
+            socket_timeout=0.5
+        )
+    return _client
+
+
+def _mark_unavailable(error: Exception):
+    """Stop using Redis for RETRY_AFTER seconds so requests don't wait on timeouts"""
+    global _unavailable_until
+    _unavailable_until = time.monotonic() + RETRY_AFTER
+    logger.warning(f"Redis cache unavailable, bypassing for {RETRY_AFTER}s: {str(error)}")
+
+
+def _jittered(ttl: int, jitter: float) -> int:
+    """TTL plus up to jitter * ttl extra seconds"""
+    return ttl + random.randint(0, int(ttl * jitter))
+
+
+async def cache_get(key: str) -> Optional[bytes]:
+    """Get the raw bytes stored under key, or None on a miss or while Redis is unavailable"""
+    client = get_redis()
+    if client is None:
+        return None
+    try:
+        return await client.get(key)
+    except Exception as e:
+        _mark_unavailable(e)
+        return None
+
+
+async def cache_set(key: str, value: bytes, ttl: int, jitter: float = TTL_JITTER):
+    """Store raw bytes under key for ttl seconds (plus jitter)"""
+    client = get_redis()
+    if client is None:
+        return
+    try:
+        await client.set(key, value, ex=_jittered(ttl, jitter))
+    except Exception as e:
+        _mark_unavailable(e)
+
+
+async def cache_delete(*keys: str):
+    """Invalidate the given keys"""
+    client = get_redis()
+    if client is None or not keys:
+        return
+    try:
+        await client.delete(*keys)
+    except Exception as e:
+        _mark_unavailable(e)
+
+
+def cached(ttl: int, key: str, jitter: float = TTL_JITTER) -> Callable:
+    """
+    Cache the JSON-serialisable result of an async function in Redis.
+
+    Empty results (None, [], {}) are not stored, so a failed upstream call isn't served from cache.
+
+    Args:
+        ttl: Seconds a cached result stays valid
+        key: Cache key template, formatted with the call's arguments by name
+             (e.g. "px:{symbol}:{interval}")
+        jitter: Fraction of ttl added at random to each write
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            cache_key = key.format(**bound.arguments)
+
+            raw = await cache_get(cache_key)
+            if raw is not None:
+                return orjson.loads(raw)
+
+            result = await func(*args, **kwargs)
+
+            if result:
+                await cache_set(cache_key, orjson.dumps(result), ttl, jitter)
+            return result
+
+        return wrapper
+    return decorator
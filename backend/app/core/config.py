@@ -22,6 +22,10 @@ class Settings(BaseSettings):
     POSTGRES_HOST: str = "localhost"
     POSTGRES_PORT: str = "5432"
     POSTGRES_DB: str = "crypto_trading"
+    DB_POOL_SIZE: int = 20  # Persistent connections kept open
+    DB_MAX_OVERFLOW: int = 10  # Extra connections allowed during bursts
+    DB_POOL_TIMEOUT: int = 30  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 1800  # Seconds before a connection is replaced
 
     @property
     def SQLALCHEMY_DATABASE_URI(self) -> str:
@@ -71,6 +75,11 @@ class Settings(BaseSettings):
     # MongoDB settings (if needed)
     MONGODB_URL: str = "mongodb://localhost:27017"
 
+    # Redis cache settings (db 0/1 are the scheduler's broker and result backend)
+    REDIS_HOST: str = os.getenv('REDIS_HOST', 'localhost')
+    REDIS_PORT: int = int(os.getenv('REDIS_PORT', 6379))
+    REDIS_DB_CACHE: int = int(os.getenv('REDIS_DB_CACHE', 2))
+
     # Server Settings
     HOST: str = os.getenv('HOST', '0.0.0.0')
     PORT: int = int(os.getenv('PORT', 8000))
@@ -1,6 +1,5 @@
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 from .logger import logger
 from typing import AsyncGenerator
@@ -8,16 +7,21 @@ from typing import AsyncGenerator
 # Create async engine
 engine = create_async_engine(
     settings.SQLALCHEMY_DATABASE_URI,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
     pool_pre_ping=True,
     echo=True
 )
 
-# Create async session factory
-SessionLocal = sessionmaker(
-    autocommit=False,
-    autoflush=False,
+# Create async session factory; objects stay loaded after commit since
+# expired attributes can't be lazily reloaded on an AsyncSession
+SessionLocal = async_sessionmaker(
     bind=engine,
-    class_=AsyncSession
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False
 )
 
 # Create Base class for declarative models
@@ -1,15 +1,22 @@
+import aiohttp
 import ccxt.async_support as ccxt
+import certifi
 import logging
+import ssl
+import time
 from typing import Optional, Dict, List
 from sqlalchemy.orm import Session
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.services.crypto_service import crypto_service
 from app.core.config import settings
-from app.core.logger import logger
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
+VALID_PAIR_TTL = 60  # seconds a successful pair validation is reused
+MAX_CONNECTIONS = 100  # pooled HTTP connections shared by all exchange requests
+MAX_CONNECTIONS_PER_HOST = 50
+
 class ExchangeManager:
     def __init__(self, db: AsyncSession = None, exchange_id: str = "binance"):
         """
@@ -22,7 +29,9 @@ class ExchangeManager:
         self.exchange_id = exchange_id
         self.db = db
         self.exchange = None
+        self._session: Optional[aiohttp.ClientSession] = None
         self._initialized = False
+        self._valid_pairs: Dict[str, float] = {}  # symbol -> time validated
 
     async def initialize(self):
         """Initialize the exchange connection"""
@@ -30,8 +39,21 @@ class ExchangeManager:
             return
 
         try:
+            # One keep-alive connection pool for every request, so concurrent calls skip TCP/TLS setup
+            if self._session is None or self._session.closed:
+                self._session = aiohttp.ClientSession(
+                    connector=aiohttp.TCPConnector(
+                        ssl=ssl.create_default_context(cafile=certifi.where()),
+                        limit=MAX_CONNECTIONS,
+                        limit_per_host=MAX_CONNECTIONS_PER_HOST,
+                        ttl_dns_cache=300,
+                        enable_cleanup_closed=True
+                    )
+                )
+
             exchange_class = getattr(ccxt, self.exchange_id)
             self.exchange = exchange_class({
+                'session': self._session,
                 'enableRateLimit': True,
                 'options': {
                     'defaultType': 'spot',
@@ -55,10 +77,10 @@ class ExchangeManager:
             logger.error(f"Unexpected error initializing exchange: {str(e)}")
             raise
 
-    def get_all_active_pairs(self) -> List[str]:
-        """Get all active trading pairs from the database"""
+    async def get_all_active_pairs(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[str]:
+        """Get active trading pairs from the database (see CryptoService.get_all_active_pairs)"""
         try:
-            return crypto_service.get_all_active_pairs()
+            return await crypto_service.get_all_active_pairs(limit=limit, after=after)
         except Exception as e:
             logger.error(f"Error getting active pairs: {str(e)}")
             return []
@@ -76,13 +98,63 @@ class ExchangeManager:
         if not self._initialized:
             await self.initialize()
 
+        if self._is_known_pair(symbol):
+            return True
+
         try:
-            ticker = await self.exchange.fetch_ticker(symbol)
-            return ticker is not None
+            valid = await self.exchange.fetch_ticker(symbol) is not None
+
+            if valid:
+                self._valid_pairs[symbol] = time.monotonic()
+            return valid
         except Exception as e:
             logger.error(f"Error validating trading pair {symbol}: {str(e)}")
             return False
 
+    def _is_known_pair(self, symbol: str) -> bool:
+        """Check the validation cache and loaded markets without any network call"""
+        validated_at = self._valid_pairs.get(symbol)
+        if validated_at is not None and time.monotonic() - validated_at < VALID_PAIR_TTL:
+            return True
+
+        # Active markets are already loaded in memory, no need for a ticker round-trip
+        market = self.exchange.markets.get(symbol) if self.exchange.markets else None
+        if market is not None and market.get('active', True):
+            self._valid_pairs[symbol] = time.monotonic()
+            return True
+        return False
+
+    async def fetch_ohlcv_if_valid(
+        self,
+        symbol: str,
+        timeframe: str = '1m',
+        limit: int = 100
+    ) -> Optional[List]:
+        """
+        Fetch OHLCV data for a symbol validated against the in-memory markets,
+        falling back to a ticker check for pairs missing from the loaded markets.
+
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+            timeframe: Time interval (default: '1m')
+            limit: Number of candles to fetch (default: 100)
+
+        Returns:
+            Optional[List]: OHLCV data, or None if the exchange returned no candles
+
+        Raises:
+            ValueError: If the symbol is neither a loaded market nor has a ticker
+        """
+        if not self._initialized:
+            await self.initialize()
+
+        # Markets loaded at startup can miss newly listed pairs, so confirm those with a ticker
+        if not await self.validate_trading_pair(symbol):
+            raise ValueError(f"Invalid trading pair: {symbol}")
+
+        ohlcv = await self.exchange.fetch_ohlcv(symbol, timeframe, limit=limit)
+        return ohlcv or None
+
     async def fetch_ticker_fallback(self, symbol: str) -> Dict:
         """
         Custom implementation of fetch_ticker in case the exchange doesn't provide it directly.
@@ -270,16 +342,15 @@ class ExchangeManager:
 
             logger.info(f"Getting OHLCV for symbol: {symbol}, formatted as: {formatted_symbol}, timeframe: {timeframe}, limit: {limit}")
 
-            if not await self.validate_trading_pair(formatted_symbol):
-                logger.warning(f"Invalid or inactive trading pair: {formatted_symbol}")
-                return None
-
             # Try to fetch OHLCV data using different methods
             try:
-                # Method 1: Direct fetch_ohlcv call
-                ohlcv = await self.exchange.fetch_ohlcv(formatted_symbol, timeframe, limit=limit)
-                if ohlcv and len(ohlcv) > 0:
+                # Method 1: Validate from memory and fetch in a single exchange call
+                ohlcv = await self.fetch_ohlcv_if_valid(formatted_symbol, timeframe, limit=limit)
+                if ohlcv:
                     return ohlcv
+            except ValueError:
+                logger.warning(f"Invalid or inactive trading pair: {formatted_symbol}")
+                return None
             except Exception as e1:
                 logger.warning(f"Primary OHLCV fetch failed for {formatted_symbol}: {str(e1)}. Trying alternatives...")
 
@@ -308,6 +379,10 @@ class ExchangeManager:
         if self._initialized and self.exchange:
             try:
                 await self.exchange.close()
+                # The exchange doesn't own the shared session, close it here
+                if self._session is not None:
+                    await self._session.close()
+                    self._session = None
                 self._initialized = False
                 logger.info(f"Exchange {self.exchange_id} connection closed")
             except Exception as e:
@@ -0,0 +1,311 @@
+"""
+Numba kernels for the technical indicators used by MarketAnalyzer and StraddleStrategy.
+
+numba is optional: when it is not installed ``NUMBA_AVAILABLE`` is False and
+callers should use their NumPy/pandas implementations instead.
+"""
+import numpy as np
+
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+    types = None
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+def _readonly_array(dtype):
+    """1-D array type matching both writable and read-only arrays of dtype"""
+    return types.Array(dtype, 1, 'A', readonly=True)
+
+
+def _eager_signature(n_floats, n_arrays, n_ints, n_float_args=0):
+    """Signature for a kernel taking float64 vectors, int64 scalars then float64 scalars and returning a float tuple.
+
+    Arrays are typed read-only: writable arrays still match, and so do read-only pandas/pyarrow views.
+    """
+    if not NUMBA_AVAILABLE:
+        return None
+    args = [_readonly_array(types.float64)] * n_arrays + [types.int64] * n_ints + [types.float64] * n_float_args
+    return types.UniTuple(types.float64, n_floats)(*args)
+
+
+@njit(cache=True, fastmath=True)
+def rsi_nb(prices, period):
+    """Relative Strength Index using Wilder's smoothing (alpha = 1/period)"""
+    n = prices.shape[0]
+    rsi = np.empty_like(prices)
+    if n == 0:
+        return rsi
+
+    alpha = 1.0 / period
+    up = 0.0
+    down = 0.0
+    rsi[0] = 0.0
+    for i in range(1, n):
+        delta = prices[i] - prices[i - 1]
+        upval = delta if delta > 0 else 0.0
+        downval = -delta if delta < 0 else 0.0
+        up = up + alpha * (upval - up)
+        down = down + alpha * (downval - down)
+        rs = up / (down if down != 0 else 1e-12)
+        rsi[i] = 100.0 - 100.0 / (1.0 + rs)
+    return rsi
+
+
+@njit(_eager_signature(3, 3, 2), cache=True)
+def signals_kernel(close, high, low, rsi_period, sr_window):
+    """Latest RSI (simple average of the last rsi_period changes), support and resistance in one pass"""
+    n = close.shape[0]
+    rsi = np.nan
+    if n > rsi_period:
+        gain = 0.0
+        loss = 0.0
+        for i in range(n - rsi_period, n):
+            delta = close[i] - close[i - 1]
+            if delta > 0:
+                gain += delta
+            else:
+                loss -= delta
+        rsi = 100.0 if loss == 0 else 100.0 - 100.0 / (1.0 + gain / loss)
+
+    support = np.nan
+    resistance = np.nan
+    if n >= sr_window:
+        support = low[n - sr_window]
+        resistance = high[n - sr_window]
+        for i in range(n - sr_window + 1, n):
+            if low[i] < support:
+                support = low[i]
+            if high[i] > resistance:
+                resistance = high[i]
+    return rsi, support, resistance
+
+
+@njit(_eager_signature(4, 1, 1), cache=True)
+def volatility_kernel(prices, periods):
+    """Sample std of simple returns (Welford), mean, min and max over the last `periods` prices"""
+    n = prices.shape[0]
+    start = n - periods if n > periods else 0
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    total = 0.0
+    low = np.inf
+    high = -np.inf
+    for i in range(start, n):
+        price = prices[i]
+        total += price
+        if price < low:
+            low = price
+        if price > high:
+            high = price
+        if i > start:
+            ret = price / prices[i - 1] - 1.0
+            count += 1
+            delta = ret - mean
+            mean += delta / count
+            m2 += delta * (ret - mean)
+
+    std = np.sqrt(m2 / (count - 1)) if count > 1 else np.nan
+    avg_price = total / (n - start) if n > start else np.nan
+    return std, avg_price, low, high
+
+
+@njit(cache=True)
+def _ewm_adjusted_step(average, old_weight, value, decay):
+    """One adjusted-EMA update; skipping equal values keeps constant input exact, as pandas does"""
+    old_weight *= decay
+    if average != value:
+        average = (old_weight * average + value) / (old_weight + 1.0)
+    return average, old_weight + 1.0
+
+
+@njit(_eager_signature(13, 2, 6, 1), cache=True)
+def breakout_kernel(prices, volume, bb_period, rsi_period, macd_fast, macd_slow, macd_signal,
+                    volume_window, bb_std):
+    """Latest-bar breakout indicators, matching the pandas rolling/ewm definitions.
+
+    Bollinger bands use min_periods=1 windows, RSI simple rolling means and MACD adjusted EMAs.
+    Returns (upper, middle, lower, recent_width, avg_width, current_rsi, rsi_trend, price_trend,
+             macd_prev, macd_last, signal_prev, signal_last, volume_ratio)
+    """
+    n = prices.shape[0]
+
+    # Band width at each of the last bb_period bars, averaged over the non-NaN ones
+    upper = middle = lower = recent_width = np.nan
+    width_sum = 0.0
+    width_count = 0
+    for i in range(max(n - bb_period, 0), n):
+        start = i + 1 - bb_period if i + 1 > bb_period else 0
+        count = i + 1 - start
+        mean = 0.0
+        for j in range(start, i + 1):
+            mean += prices[j]
+        mean /= count
+        std = np.nan
+        if count > 1:
+            m2 = 0.0
+            for j in range(start, i + 1):
+                d = prices[j] - mean
+                m2 += d * d
+            std = np.sqrt(m2 / (count - 1))
+        band_upper = mean + std * bb_std
+        band_lower = mean - std * bb_std
+        width = (band_upper - band_lower) / mean
+        if not np.isnan(width):
+            width_sum += width
+            width_count += 1
+        if i == n - 1:
+            upper, middle, lower, recent_width = band_upper, mean, band_lower, width
+    avg_width = width_sum / width_count if width_count > 0 else np.nan
+
+    # RSI over the last 5 bars (the first price change counts as 0, like pandas' diff().where())
+    current_rsi = np.nan
+    previous_rsi = np.nan
+    trend_sum = 0.0
+    trend_count = 0
+    for i in range(max(n - 5, 0), n):
+        rsi = np.nan
+        if i >= rsi_period - 1:
+            gain = 0.0
+            loss = 0.0
+            for j in range(max(i - rsi_period + 1, 1), i + 1):
+                delta = prices[j] - prices[j - 1]
+                if delta > 0:
+                    gain += delta
+                else:
+                    loss -= delta
+            if loss > 0:
+                rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+            elif gain > 0:
+                rsi = 100.0
+        if i > max(n - 5, 0):
+            change = rsi - previous_rsi
+            if not np.isnan(change):
+                trend_sum += change
+                trend_count += 1
+        previous_rsi = rsi
+        current_rsi = rsi
+    rsi_trend = trend_sum / trend_count if trend_count > 0 else np.nan
+
+    # Mean simple return over the last 5 prices
+    price_trend = np.nan
+    first = max(n - 4, 1)
+    if n > first:
+        total = 0.0
+        for i in range(first, n):
+            total += prices[i] / prices[i - 1] - 1.0
+        price_trend = total / (n - first)
+
+    # MACD and its signal line as adjusted EMAs, updated the way pandas' ewm(adjust=True) does
+    fast_factor = 1.0 - 2.0 / (macd_fast + 1.0)
+    slow_factor = 1.0 - 2.0 / (macd_slow + 1.0)
+    signal_factor = 1.0 - 2.0 / (macd_signal + 1.0)
+    fast = slow = prices[0]
+    signal = 0.0
+    fast_weight = slow_weight = signal_weight = 1.0
+    macd_prev = macd_last = signal_prev = signal_last = np.nan
+    for i in range(n):
+        if i > 0:
+            fast, fast_weight = _ewm_adjusted_step(fast, fast_weight, prices[i], fast_factor)
+            slow, slow_weight = _ewm_adjusted_step(slow, slow_weight, prices[i], slow_factor)
+        macd = fast - slow
+        if i == 0:
+            signal = macd
+        else:
+            signal, signal_weight = _ewm_adjusted_step(signal, signal_weight, macd, signal_factor)
+        macd_prev, signal_prev = macd_last, signal_last
+        macd_last, signal_last = macd, signal
+
+    # Last volume against the mean of the last volume_window (no ratio until the window fills)
+    volume_ratio = 0.0
+    if n >= volume_window and volume_window > 0:
+        avg_volume = 0.0
+        for i in range(n - volume_window, n):
+            avg_volume += volume[i]
+        avg_volume /= volume_window
+        if avg_volume > 0:
+            volume_ratio = volume[n - 1] / avg_volume
+
+    return (upper, middle, lower, recent_width, avg_width, current_rsi, rsi_trend, price_trend,
+            macd_prev, macd_last, signal_prev, signal_last, volume_ratio)
+
+
+_LOG_RETURN_STD_SIGNATURE = (
+    types.float64[:](_readonly_array(types.float64), _readonly_array(types.int64)) if NUMBA_AVAILABLE else None
+)
+
+
+@njit(_LOG_RETURN_STD_SIGNATURE, cache=True)
+def log_return_std_nb(prices, windows):
+    """Population std of log returns over the last windows[k] prices (0 for all prices)"""
+    n = prices.shape[0]
+    m = n - 1 if n > 1 else 0
+    log_returns = np.empty(m)
+    for i in range(m):
+        log_returns[i] = np.log1p((prices[i + 1] - prices[i]) / prices[i])
+
+    out = np.zeros(windows.shape[0])
+    for k in range(windows.shape[0]):
+        window = windows[k]
+        start = 0 if window <= 0 else max(m - (window - 1), 0)
+        count = m - start
+        if count == 0:
+            continue
+        mean = 0.0
+        for i in range(start, m):
+            mean += log_returns[i]
+        mean /= count
+        var = 0.0
+        for i in range(start, m):
+            d = log_returns[i] - mean
+            var += d * d
+        out[k] = np.sqrt(var / count)
+    return out
+
+
+@njit(_eager_signature(11, 0, 0, 3), cache=True)
+def entry_levels_kernel(short_vol, medium_vol, long_vol):
+    """Straddle entry percentages from short/medium/long volatility.
+
+    Returns (avg_vol, base_vol, scale_factor, min_pct, max_pct,
+             short_buy, short_sell, medium_buy, medium_sell, long_buy, long_sell)
+    """
+    avg_vol = (short_vol + medium_vol + long_vol) / 3.0
+
+    # Most conservative (lowest) volatility as base to prevent over-leveraging
+    if short_vol > 0 and medium_vol > 0 and long_vol > 0:
+        base_vol = min(short_vol, medium_vol, long_vol)
+    else:
+        base_vol = avg_vol
+
+    # Adaptive scaling by overall market volatility
+    if avg_vol > 0.05:
+        scale_factor, min_pct, max_pct = 0.8, 0.002, 0.015
+    elif avg_vol > 0.02:
+        scale_factor, min_pct, max_pct = 1.0, 0.003, 0.02
+    else:
+        scale_factor, min_pct, max_pct = 1.2, 0.005, 0.03
+
+    base_pct = max(base_vol * scale_factor, min_pct)
+
+    # 1:2:3 ratio between timeframes, clamped with progressive limits
+    short_pct = max(min(base_pct, max_pct), min_pct)
+    medium_pct = max(min(base_pct * 2, max_pct * 1.5), min_pct * 1.5)
+    long_pct = max(min(base_pct * 3, max_pct * 2), min_pct * 2)
+
+    # Sell side is 3x the buy side, with its own clamps
+    short_sell = max(min(short_pct * 3, max_pct * 1.2), min_pct)
+    medium_sell = max(min(medium_pct * 3, max_pct * 1.8), min_pct * 1.5)
+    long_sell = max(min(long_pct * 3, max_pct * 2.4), min_pct * 2)
+
+    return (avg_vol, base_vol, scale_factor, min_pct, max_pct,
+            short_pct, short_sell, medium_pct, medium_sell, long_pct, long_sell)
@@ -0,0 +1,29 @@
+from decimal import Decimal
+from typing import Any
+
+import orjson
+from fastapi.responses import ORJSONResponse as _ORJSONResponse
+from pydantic import BaseModel
+
+
+def _default(obj: Any) -> Any:
+    """Encode the types orjson doesn't handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, BaseModel):
+        return obj.model_dump()
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class ORJSONResponse(_ORJSONResponse):
+    """ORJSONResponse that also encodes Decimal (NUMERIC columns) and pydantic models.
+
+    Returned responses skip jsonable_encoder, so content may hold these types directly.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            default=_default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
@@ -0,0 +1,30 @@
+from typing import Callable
+
+from fastapi import HTTPException, Request, Response
+from fastapi.exceptions import RequestValidationError
+from fastapi.routing import APIRoute
+
+from .logger import logger
+
+
+class ErrorLoggingRoute(APIRoute):
+    """Route that logs unexpected errors and re-raises them as HTTPException(500).
+
+    The HTTPException is answered by the router's exception middleware, which sits
+    inside CORSMiddleware, so browsers still get the CORS headers on a 500. An
+    app-level Exception handler runs outside CORS and would drop them.
+    """
+
+    def get_route_handler(self) -> Callable:
+        route_handler = super().get_route_handler()
+
+        async def handler(request: Request) -> Response:
+            try:
+                return await route_handler(request)
+            except (HTTPException, RequestValidationError):
+                raise
+            except Exception as e:
+                logger.error(f"Unhandled error on {request.method} {request.url.path}: {str(e)}")
+                raise HTTPException(status_code=500, detail=str(e))
+
+        return handler
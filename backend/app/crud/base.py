@@ -2,7 +2,7 @@ from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, inspect
 from sqlalchemy import update
 from app.core.database import Base
 
@@ -16,9 +16,17 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
         """
         self.model = model
+        # Column attributes update() is allowed to set, resolved once per model
+        self._column_keys = frozenset(inspect(model).columns.keys())
 
-    async def get(self, db: AsyncSession, id: Any) -> Optional[ModelType]:
-        result = await db.execute(select(self.model).filter(self.model.id == id))
+    async def get(
+        self, db: AsyncSession, id: Any, *, options: Optional[List[Any]] = None
+    ) -> Optional[ModelType]:
+        """Get a row by id; options (e.g. selectinload) are applied to the query"""
+        query = select(self.model).filter(self.model.id == id)
+        if options:
+            query = query.options(*options)
+        result = await db.execute(query)
         return result.scalar_one_or_none()
 
     async def get_multi(
@@ -43,12 +51,6 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         obj_in: Union[UpdateSchemaType, Dict[str, Any]]
     ) -> ModelType:
         try:
-            # Try to encode the object
-            try:
-                obj_data = jsonable_encoder(db_obj)
-            except Exception as encode_error:
-                raise ValueError(f"Failed to encode object: {str(encode_error)}")
-
             # Process update data
             try:
                 if isinstance(obj_in, dict):
@@ -60,9 +62,9 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
             # Update fields
             try:
-                for field in obj_data:
-                    if field in update_data:
-                        setattr(db_obj, field, update_data[field])
+                for field, value in update_data.items():
+                    if field in self._column_keys:
+                        setattr(db_obj, field, value)
             except Exception as field_error:
                 raise ValueError(f"Failed to update field: {str(field_error)}")
 
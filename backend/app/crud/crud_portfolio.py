@@ -127,7 +127,7 @@ class CRUDPortfolio(CRUDBase[Portfolio, PortfolioCreate, PortfolioUpdate]):
             portfolio_details = []
 
             for portfolio in portfolios:
-                realized_profit = getattr(portfolio, 'realized_profit', 0.0) or 0.0
+                realized_profit = portfolio.realized_profit
                 total_realized_profit += realized_profit
 
                 if portfolio.quantity > 0:
@@ -1,7 +1,7 @@
 from typing import List, Optional, Dict, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import func, or_, and_
+from sqlalchemy import func, or_, and_, case
 from datetime import datetime, timedelta
 from app.models.swap_transaction import SwapTransaction
 from app.crud.base import CRUDBase
@@ -138,7 +138,15 @@ class CRUDSwapTransaction(CRUDBase[SwapTransaction, SwapTransactionCreate, SwapT
     ) -> Dict[str, Any]:
         """Get profit/loss summary for swap transactions"""
         try:
-            stmt = select(SwapTransaction)
+            # Aggregate in the database so only one row comes back
+            profit = func.coalesce(SwapTransaction.realized_profit, 0.0)
+            stmt = select(
+                func.count(SwapTransaction.id).label('total_swaps'),
+                func.coalesce(func.sum(profit), 0.0).label('total_realized_profit'),
+                func.coalesce(func.sum(SwapTransaction.fee_amount), 0.0).label('total_fees_paid'),
+                func.coalesce(func.sum(case((profit > 0, 1), else_=0)), 0).label('profitable_swaps'),
+                func.coalesce(func.sum(case((profit < 0, 1), else_=0)), 0).label('loss_swaps')
+            )
 
             if user_id:
                 stmt = stmt.where(SwapTransaction.user_id == user_id)
@@ -156,9 +164,10 @@ class CRUDSwapTransaction(CRUDBase[SwapTransaction, SwapTransactionCreate, SwapT
                 stmt = stmt.where(SwapTransaction.timestamp >= since_date)
 
             result = await db.execute(stmt)
-            transactions = result.scalars().all()
+            row = result.one()
+            total_swaps = row.total_swaps
 
-            if not transactions:
+            if not total_swaps:
                 return {
                     "total_swaps": 0,
                     "total_realized_profit": 0.0,
@@ -169,19 +178,18 @@ class CRUDSwapTransaction(CRUDBase[SwapTransaction, SwapTransactionCreate, SwapT
                     "profit_percentage": 0.0
                 }
 
-            total_realized_profit = sum(getattr(t, 'realized_profit', 0.0) or 0.0 for t in transactions)
-            total_fees_paid = sum(t.fee_amount for t in transactions)
-            profitable_swaps = len([t for t in transactions if (getattr(t, 'realized_profit', 0.0) or 0.0) > 0])
-            loss_swaps = len([t for t in transactions if (getattr(t, 'realized_profit', 0.0) or 0.0) < 0])
+            total_realized_profit = float(row.total_realized_profit)
+            total_fees_paid = float(row.total_fees_paid)
+            profitable_swaps = int(row.profitable_swaps)
 
             return {
-                "total_swaps": len(transactions),
+                "total_swaps": total_swaps,
                 "total_realized_profit": total_realized_profit,
                 "total_fees_paid": total_fees_paid,
-                "average_profit_per_swap": total_realized_profit / len(transactions),
+                "average_profit_per_swap": total_realized_profit / total_swaps,
                 "profitable_swaps": profitable_swaps,
-                "loss_swaps": loss_swaps,
-                "profit_percentage": (profitable_swaps / len(transactions)) * 100,
+                "loss_swaps": int(row.loss_swaps),
+                "profit_percentage": (profitable_swaps / total_swaps) * 100,
                 "net_profit_after_fees": total_realized_profit - total_fees_paid
             }
 
@@ -3,6 +3,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, and_, or_
 from app.crud.base import CRUDBase
 from app.models.trade import Trade
+from app.models.position import Position
 from app.schemas.trade import TradeCreate, TradeUpdate
 from datetime import datetime
 
@@ -26,6 +27,29 @@ class CRUDTrade(CRUDBase[Trade, TradeCreate, TradeUpdate]):
         )
         return result.scalars().all()
 
+    async def get_by_position_with_parent_check(
+        self, db: AsyncSession, *, position_id: int, skip: int = 0, limit: int = 100
+    ) -> Optional[List[Trade]]:
+        """Trades of a position, or None when the position doesn't exist.
+
+        The position is outer-joined so one query answers both; a second
+        existence check only runs when the requested page comes back empty.
+        """
+        result = await db.execute(
+            select(Position.id, Trade)
+            .outerjoin(Trade, Trade.position_id == Position.id)
+            .filter(Position.id == position_id)
+            .order_by(Trade.id)
+            .offset(skip)
+            .limit(limit)
+        )
+        rows = result.all()
+        if rows:
+            return [trade for _, trade in rows if trade is not None]
+
+        exists = await db.execute(select(Position.id).filter(Position.id == position_id))
+        return [] if exists.first() else None
+
     async def get_open_trades(
         self, db: AsyncSession, *, symbol: Optional[str] = None
     ) -> List[Trade]:
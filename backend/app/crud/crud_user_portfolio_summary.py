@@ -1,15 +1,21 @@
-from typing import Dict, List, Optional, Union, Any
+from typing import AsyncIterator, Dict, List, Optional, Tuple, Union, Any
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
-from sqlalchemy import desc, func
+from sqlalchemy import Text, cast, desc, func
 from datetime import datetime, timedelta
 import json
 
 from app.core.logger import logger
+from app.core.cache import cache_delete
 from app.models.user_portfolio_summary import UserPortfolioSummary
 from app.crud.base import CRUDBase
 
 
+def latest_summary_key(user_id: Optional[int]) -> str:
+    """Cache key for the serialized /portfolio-summary/latest response"""
+    return f"portsum:latest:{user_id}"
+
+
 class CRUDUserPortfolioSummary(CRUDBase[UserPortfolioSummary, Dict[str, Any], Dict[str, Any]]):
     async def create_summary(
         self,
@@ -127,6 +133,9 @@ class CRUDUserPortfolioSummary(CRUDBase[UserPortfolioSummary, Dict[str, Any], Di
             db.add(db_obj)
             await db.commit()
             await db.refresh(db_obj)
+
+            # /latest caches per user and for the any-user (None) query
+            await cache_delete(latest_summary_key(user_id), latest_summary_key(None))
             return db_obj
 
         except Exception as e:
@@ -154,6 +163,33 @@ class CRUDUserPortfolioSummary(CRUDBase[UserPortfolioSummary, Dict[str, Any], Di
             logger.error(f"Error getting latest portfolio summary: {str(e)}")
             raise
 
+    async def get_latest_assets_json(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: Optional[int] = None
+    ) -> Optional[Tuple[int, datetime, Optional[str]]]:
+        """
+        Get (id, timestamp, assets) of the latest summary with assets as the stored JSON text,
+        so it can be passed through without being parsed
+        """
+        try:
+            query = select(
+                UserPortfolioSummary.id,
+                UserPortfolioSummary.timestamp,
+                cast(UserPortfolioSummary.assets, Text)
+            ).order_by(desc(UserPortfolioSummary.timestamp))
+
+            if user_id:
+                query = query.filter(UserPortfolioSummary.user_id == user_id)
+
+            result = await db.execute(query.limit(1))
+            row = result.first()
+            return tuple(row) if row else None
+        except Exception as e:
+            logger.error(f"Error getting latest portfolio assets: {str(e)}")
+            raise
+
     async def get_historical_summaries(
         self,
         db: AsyncSession,
@@ -174,58 +210,72 @@ class CRUDUserPortfolioSummary(CRUDBase[UserPortfolioSummary, Dict[str, Any], Di
         - minutes_1: all records from the last minute
         """
         try:
-            # For predefined short intervals, override the days parameter
-            if interval == "last_hour":
-                start_date = datetime.utcnow() - timedelta(hours=1)
-            elif interval == "minutes_15":
-                start_date = datetime.utcnow() - timedelta(minutes=15)
-            elif interval == "minutes_5":
-                start_date = datetime.utcnow() - timedelta(minutes=5)
-            elif interval == "minutes_1":
-                start_date = datetime.utcnow() - timedelta(minutes=1)
-            else:
-                start_date = datetime.utcnow() - timedelta(days=days)
-
-            # For all time-based intervals except daily, return all records in the time range
-            if interval in ["hourly", "last_hour", "minutes_15", "minutes_5", "minutes_1"]:
-                query = select(UserPortfolioSummary)\
-                    .filter(UserPortfolioSummary.timestamp >= start_date)\
-                    .order_by(UserPortfolioSummary.timestamp)
+            return [summary async for summary in self.stream_historical_summaries(
+                db, user_id=user_id, days=days, interval=interval
+            )]
+        except Exception as e:
+            logger.error(f"Error getting historical portfolio summaries: {str(e)}")
+            raise
 
-                if user_id:
-                    query = query.filter(UserPortfolioSummary.user_id == user_id)
+    async def stream_historical_summaries(
+        self,
+        db: AsyncSession,
+        *,
+        user_id: Optional[int] = None,
+        days: int = 7,
+        interval: str = "daily"
+    ) -> AsyncIterator[UserPortfolioSummary]:
+        """
+        Yield the rows get_historical_summaries returns, oldest first, without
+        loading them all; full-range intervals are read through a server-side cursor
+        """
+        # For predefined short intervals, override the days parameter
+        if interval == "last_hour":
+            start_date = datetime.utcnow() - timedelta(hours=1)
+        elif interval == "minutes_15":
+            start_date = datetime.utcnow() - timedelta(minutes=15)
+        elif interval == "minutes_5":
+            start_date = datetime.utcnow() - timedelta(minutes=5)
+        elif interval == "minutes_1":
+            start_date = datetime.utcnow() - timedelta(minutes=1)
+        else:
+            start_date = datetime.utcnow() - timedelta(days=days)
+
+        # For all time-based intervals except daily, return all records in the time range
+        if interval in ["hourly", "last_hour", "minutes_15", "minutes_5", "minutes_1"]:
+            query = select(UserPortfolioSummary)\
+                .filter(UserPortfolioSummary.timestamp >= start_date)\
+                .order_by(UserPortfolioSummary.timestamp)
 
-                result = await db.execute(query)
-                return result.scalars().all()
-            else:
-                # For daily data, get one record per day (closest to midnight)
-                daily_summaries = []
-                current_date = start_date
+            if user_id:
+                query = query.filter(UserPortfolioSummary.user_id == user_id)
 
-                while current_date < datetime.utcnow():
-                    day_start = datetime(current_date.year, current_date.month, current_date.day)
-                    day_end = day_start + timedelta(days=1)
+            result = await db.stream_scalars(query)
+            async for summary in result:
+                yield summary
+        else:
+            # For daily data, get one record per day (closest to midnight)
+            current_date = start_date
 
-                    query = select(UserPortfolioSummary)\
-                        .filter(UserPortfolioSummary.timestamp >= day_start)\
-                        .filter(UserPortfolioSummary.timestamp < day_end)
+            while current_date < datetime.utcnow():
+                day_start = datetime(current_date.year, current_date.month, current_date.day)
+                day_end = day_start + timedelta(days=1)
 
-                    if user_id:
-                        query = query.filter(UserPortfolioSummary.user_id == user_id)
+                query = select(UserPortfolioSummary)\
+                    .filter(UserPortfolioSummary.timestamp >= day_start)\
+                    .filter(UserPortfolioSummary.timestamp < day_end)
 
-                    query = query.order_by(desc(UserPortfolioSummary.timestamp)).limit(1)
-                    result = await db.execute(query)
-                    summary = result.scalars().first()
+                if user_id:
+                    query = query.filter(UserPortfolioSummary.user_id == user_id)
 
-                    if summary:
-                        daily_summaries.append(summary)
+                query = query.order_by(desc(UserPortfolioSummary.timestamp)).limit(1)
+                result = await db.execute(query)
+                summary = result.scalars().first()
 
-                    current_date += timedelta(days=1)
+                if summary:
+                    yield summary
 
-                return daily_summaries
-        except Exception as e:
-            logger.error(f"Error getting historical portfolio summaries: {str(e)}")
-            raise
+                current_date += timedelta(days=1)
 
     async def get_time_period_summary(
         self,
@@ -5,12 +5,43 @@ from app.services.helper.binance_helper import BinanceHelper
 from app.core.exchange.exchange_manager import exchange_manager
 from app.crud.crud_portfolio import portfolio_crud as portfolio_crud
 from datetime import datetime
+from functools import lru_cache
+import asyncio
 import re
-from typing import Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Tables created or seen by this process; inserts into them skip the CREATE ... IF NOT EXISTS statements
+_known_tables = set()
+
+def _create_table_statements(table_name: str) -> list:
+    """DDL creating a cryptocurrency table and its indexes; safe to run when they already exist"""
+    return [
+        text(f'''
+        CREATE TABLE IF NOT EXISTS "{table_name}" (
+                id SERIAL PRIMARY KEY,
+                symbol VARCHAR(50) NOT NULL,
+                name VARCHAR(100),
+                current_price NUMERIC(18, 8),  -- better precision than FLOAT
+                swap_transactions_id VARCHAR(255),  -- add REFERENCES if foreign key
+                timestamp TIMESTAMP,      -- renamed to avoid confusion
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        );
+        '''),
+        # Index on symbol
+        text(f'''
+            CREATE INDEX IF NOT EXISTS "idx_{table_name}_symbol"
+            ON "{table_name}" (symbol);
+        '''),
+        # Index on timestamp
+        text(f'''
+            CREATE INDEX IF NOT EXISTS "idx_{table_name}_timestamp"
+            ON "{table_name}" (timestamp);
+        '''),
+    ]
+
 async def table_exists(db: AsyncSession, table_name: str) -> bool:
     """Check if a table exists in the database
 
@@ -38,6 +69,7 @@ async def table_exists(db: AsyncSession, table_name: str) -> bool:
         logger.error(f"Error checking if table exists: {str(e)}")
         return False
 
+@lru_cache(maxsize=2048)
 def sanitize_table_name(name: str, month: int = None, year: int = None) -> str:
     """Sanitize table name for SQL safety and append month/year if provided
 
@@ -120,39 +152,22 @@ async def create_crypto_table(db: AsyncSession, symbol: str, month: int = None,
         table_name = sanitized_symbol
 
         # Check if table already exists
+        if table_name in _known_tables:
+            return True
         exists = await table_exists(db, table_name)
         if exists:
+            _known_tables.add(table_name)
             logger.info(f"Table {table_name} already exists, skipping creation")
             return True
 
         try:
-            # Create table
-            await db.execute(text(f'''
-            CREATE TABLE IF NOT EXISTS "{table_name}" (
-                    id SERIAL PRIMARY KEY,
-                    symbol VARCHAR(50) NOT NULL,
-                    name VARCHAR(100),
-                    current_price NUMERIC(18, 8),  -- better precision than FLOAT
-                    swap_transactions_id VARCHAR(255),  -- add REFERENCES if foreign key
-                    timestamp TIMESTAMP,      -- renamed to avoid confusion
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            );
-            '''))
-
-            # Create index on symbol
-            await db.execute(text(f'''
-                CREATE INDEX IF NOT EXISTS "idx_{table_name}_symbol"
-                ON "{table_name}" (symbol);
-            '''))
-
-            # Create index on timestamp
-            await db.execute(text(f'''
-                CREATE INDEX IF NOT EXISTS "idx_{table_name}_timestamp"
-                ON "{table_name}" (timestamp);
-            '''))
+            # Create table and indexes
+            for statement in _create_table_statements(table_name):
+                await db.execute(statement)
 
             # Finally commit
             await db.commit()
+            _known_tables.add(table_name)
 
             logger.info(f"Created table and indexes for: {table_name}")
 
@@ -172,113 +187,141 @@ async def create_crypto_table(db: AsyncSession, symbol: str, month: int = None,
         logger.error(f"Critical error in create_crypto_table: {str(e)}")
         return False
 
-async def insert_crypto_data(db: AsyncSession, symbol: str, data: dict, month: int = None, year: int = None, swap_transaction_id: str = None) -> bool:
-    """Insert data into a cryptocurrency table
+REQUIRED_FIELDS = ('current_price', 'timestamp')
+
+def _insert_params(symbol: str, data: dict, swap_transaction_id: str = None) -> dict:
+    """Bind parameters for one price row, with timestamps made timezone-naive for consistency"""
+    timestamp = data['timestamp']
+    if getattr(timestamp, 'tzinfo', None) is not None:
+        timestamp = timestamp.replace(tzinfo=None)
+
+    created_at = data.get('created_at') or datetime.now()
+    if getattr(created_at, 'tzinfo', None) is not None:
+        created_at = created_at.replace(tzinfo=None)
+
+    return {
+        'symbol': symbol,
+        'name': data.get('name', symbol),
+        'current_price': data['current_price'],
+        'swap_transactions_id': data.get('swap_transactions_id', swap_transaction_id),
+        'timestamp': timestamp,
+        'created_at': created_at
+    }
+
+async def insert_crypto_rows(db: AsyncSession, rows: List[Tuple[str, dict, Optional[str]]], month: int = None, year: int = None) -> bool:
+    """Insert price rows for any number of symbols in one transaction
+
+    Rows are grouped by table and each table gets a single executemany INSERT. Tables this
+    process hasn't written to yet are created (with their indexes) in the same transaction.
 
     Args:
         db: The database session
-        symbol: The cryptocurrency symbol (e.g., 'BTC/USDT')
-        data: Dictionary containing data to insert (must have current_price, timestamp fields)
+        rows: (symbol, data, swap_transaction_id) tuples; data must have current_price and timestamp
         month: Optional month (1-12)
         year: Optional year
-        swap_transaction_id: Optional swap transaction id
     Returns:
-        True if data was inserted successfully, False otherwise
+        True if every row was inserted, False otherwise (nothing is inserted then)
     """
     try:
         # Get current month/year if not provided
         if month is None or year is None:
-            from datetime import datetime
             now = datetime.now()
             month = month or now.month
             year = year or now.year
 
-        # Validate input
-        sanitized_symbol, is_valid = validate_inputs(symbol, month, year)
-        if not is_valid:
-            logger.error(f"Invalid input: symbol={symbol}, month={month}, year={year}")
-            return False
+        # Validate input and group rows by table
+        tables = {}
+        for symbol, data, swap_transaction_id in rows:
+            table_name, is_valid = validate_inputs(symbol, month, year)
+            if not is_valid:
+                logger.error(f"Invalid input: symbol={symbol}, month={month}, year={year}")
+                return False
 
-        # Create table name
-        table_name = sanitized_symbol
+            for field in REQUIRED_FIELDS:
+                if field not in data:
+                    logger.error(f"Missing required field for {symbol}: {field}")
+                    return False
 
-        # Check if table exists
-        exists = await table_exists(db, table_name)
-        if not exists:
-            logger.error(f"Table {table_name} does not exist, cannot insert data")
-            success = await create_crypto_table(db, symbol, month, year)
-            logger.info(f"Created table and indexes for: {table_name}")
-            return False
+            tables.setdefault(table_name, []).append(_insert_params(symbol, data, swap_transaction_id))
 
-        # Validate required data fields
-        required_fields = ['current_price', 'timestamp']
-        for field in required_fields:
-            if field not in data:
-                logger.error(f"Missing required field: {field}")
-                return False
+        if not tables:
+            return True
+
+        # Tables this process hasn't written to yet are created in the same transaction
+        new_tables = [table_name for table_name in tables if table_name not in _known_tables]
 
         try:
-            # Set timestamp if not provided, ensure it's timezone-naive
-            from datetime import datetime
-            if 'created_at' not in data:
-                data['created_at'] = datetime.now()
-
-            # Ensure timestamp is timezone-naive for consistency
-            if hasattr(data['timestamp'], 'tzinfo') and data['timestamp'].tzinfo is not None:
-                # Convert to naive datetime by replacing with the same values but no timezone
-                timestamp = data['timestamp'].replace(tzinfo=None)
-            else:
-                timestamp = data['timestamp']
-
-            # Similarly ensure created_at is timezone-naive
-            if hasattr(data['created_at'], 'tzinfo') and data['created_at'].tzinfo is not None:
-                created_at = data['created_at'].replace(tzinfo=None)
-            else:
-                created_at = data['created_at']
-
-            # Insert data
-            insert_query = text(f"""
-            INSERT INTO "{table_name}" (symbol, name, current_price, swap_transactions_id, timestamp, created_at)
-            VALUES (:symbol, :name, :current_price, :swap_transactions_id, :timestamp, :created_at)
-            RETURNING id
-            """)
-
-            # Execute insert
-            result = await db.execute(
-                insert_query,
-                {
-                    'symbol': symbol,
-                    'name': data.get('name', symbol),
-                    'current_price': data['current_price'],
-                    'swap_transactions_id': data.get('swap_transactions_id', swap_transaction_id),
-                    'timestamp': timestamp,
-                    'created_at': created_at
-                }
-            )
-
-            # Get inserted ID
-            inserted_id = result.scalar_one()
+            for table_name in new_tables:
+                for statement in _create_table_statements(table_name):
+                    await db.execute(statement)
+
+            for table_name, params in tables.items():
+                await db.execute(text(f"""
+                INSERT INTO "{table_name}" (symbol, name, current_price, swap_transactions_id, timestamp, created_at)
+                VALUES (:symbol, :name, :current_price, :swap_transactions_id, :timestamp, :created_at)
+                """), params)
 
             # Commit the transaction
             await db.commit()
+            _known_tables.update(new_tables)
 
-            logger.info(f"Inserted data into {table_name} with ID {inserted_id}")
+            logger.info(f"Inserted {len(rows)} rows into {', '.join(tables)}")
             return True
 
         except SQLAlchemyError as e:
             await db.rollback()
-            logger.error(f"SQLAlchemy error inserting data into {table_name}: {str(e)}")
+            # A table may have been dropped since it was cached; recreate it on the next insert
+            _known_tables.difference_update(tables)
+            logger.error(f"SQLAlchemy error inserting data into {', '.join(tables)}: {str(e)}")
             return False
         except Exception as e:
             await db.rollback()
-            logger.error(f"Unexpected error inserting data into {table_name}: {str(e)}")
+            logger.error(f"Unexpected error inserting data into {', '.join(tables)}: {str(e)}")
             return False
 
     except Exception as e:
         # Catch-all for any unhandled exceptions
-        logger.error(f"Critical error in insert_crypto_data: {str(e)}")
+        logger.error(f"Critical error in insert_crypto_rows: {str(e)}")
         return False
 
+async def insert_crypto_data(db: AsyncSession, symbol: str, data: dict, month: int = None, year: int = None, swap_transaction_id: str = None) -> bool:
+    """Insert data into a cryptocurrency table
+
+    The table (and its indexes) is created in the same transaction if it doesn't exist yet.
+
+    Args:
+        db: The database session
+        symbol: The cryptocurrency symbol (e.g., 'BTC/USDT')
+        data: Dictionary containing data to insert (must have current_price, timestamp fields)
+        month: Optional month (1-12)
+        year: Optional year
+        swap_transaction_id: Optional swap transaction id
+    Returns:
+        True if data was inserted successfully, False otherwise
+    """
+    return await insert_crypto_rows(db, [(symbol, data, swap_transaction_id)], month, year)
+
+async def _fetch_live_price(symbol: str) -> dict:
+    """Get the latest ticker for a symbol shaped as a price row"""
+    ticker = await exchange_manager.get_ticker(symbol.replace("/", ""))
+    if not ticker:
+        raise Exception(f"Could not get ticker data for {symbol}")
+
+    get_price = ticker
+    get_price['symbol'] = symbol
+    get_price['name'] = symbol.replace("/", "")
+    get_price['current_price'] = float(ticker['last'])
+
+    # Use timestamp from ticker if available, otherwise use current time
+    if 'timestamp' in ticker and ticker['timestamp']:
+        # Convert Unix timestamp in milliseconds to datetime object
+        get_price['timestamp'] = datetime.fromtimestamp(ticker['timestamp'] / 1000)
+    else:
+        # Fallback to current time if ticker doesn't provide timestamp
+        get_price['timestamp'] = datetime.now()
+
+    return get_price
+
 async def insert_crypto_data_live(db: AsyncSession, symbol: str, swap_transaction_id: str = None) -> bool:
     """Insert live cryptocurrency data into a table
 
@@ -290,28 +333,33 @@ async def insert_crypto_data_live(db: AsyncSession, symbol: str, swap_transactio
         True if data was inserted successfully, False otherwise
     """
     try:
-        # Get ticker data from exchange
-        ticker = await exchange_manager.get_ticker(symbol.replace("/", ""))
-        if not ticker:
-            raise Exception(f"Could not get ticker data for {symbol}")
-
-        get_price = ticker
-        get_price['symbol'] = symbol
-        get_price['name'] = symbol.replace("/", "")
-        get_price['current_price'] = float(ticker['last'])
-
-        # Use timestamp from ticker if available, otherwise use current time
-        if 'timestamp' in ticker and ticker['timestamp']:
-            # Convert Unix timestamp in milliseconds to datetime object
-            get_price['timestamp'] = datetime.fromtimestamp(ticker['timestamp'] / 1000)
-        else:
-            # Fallback to current time if ticker doesn't provide timestamp
-            get_price['timestamp'] = datetime.now()
-
-        print(get_price)
+        get_price = await _fetch_live_price(symbol)
         await insert_crypto_data(db, symbol, get_price, swap_transaction_id=swap_transaction_id)
         await portfolio_crud.update_current_price(db,symbol,1, get_price['current_price'])
         return get_price
     except Exception as e:
         logger.error(f"Critical error in insert_crypto_data_live: {str(e)}")
         return False
+
+async def insert_crypto_data_live_many(db: AsyncSession, symbols: List[str]) -> Dict[str, Any]:
+    """Insert live data for several symbols: tickers are fetched concurrently, rows inserted in one transaction
+
+    Args:
+        db: The database session
+        symbols: Cryptocurrency symbols (e.g., ['BTC/USDT', 'ETH/USDT'])
+
+    Returns:
+        Symbol -> inserted price row, or the exception that prevented its insert
+    """
+    fetched = await asyncio.gather(*[_fetch_live_price(symbol) for symbol in symbols], return_exceptions=True)
+    results = dict(zip(symbols, fetched))
+
+    rows = [(symbol, price, None) for symbol, price in results.items() if not isinstance(price, Exception)]
+    if rows and not await insert_crypto_rows(db, rows):
+        for symbol, _, _ in rows:
+            results[symbol] = Exception("Insert failed")
+        return results
+
+    for symbol, price, _ in rows:
+        await portfolio_crud.update_current_price(db, symbol, 1, price['current_price'])
+    return results
@@ -1,16 +1,25 @@
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from sqlalchemy.ext.asyncio import AsyncSession
 import logging
 
 from .core.database import SessionLocal, engine, Base, get_db
 from .core.config import settings
+from .core.responses import ORJSONResponse
 from .api.v1.api import api_router
 from .services.telegram_service import create_telegram_service, telegram_service
 from .services.crypto_service import crypto_service
 from .services.scheduler_service import scheduler_service
 from .services.portfolio_service import portfolio_service
 from .core.exchange.exchange_manager import exchange_manager
+from .services.oneinch_service import oneinch_service
+
+# Brotli is optional; without brotli-asgi responses are gzip-compressed only
+try:
+    from brotli_asgi import BrotliMiddleware
+except ImportError:
+    BrotliMiddleware = None
 
 # Import all models to ensure they are registered with Base
 from .models.portfolio import Portfolio
@@ -21,6 +30,9 @@ from .models.telegram import TelegramUser, TelegramNotification
 telegram_srv = True
 scheduler_srv = True
 
+COMPRESSION_MIN_SIZE = 1024  # bytes; smaller bodies aren't worth compressing
+COMPRESSION_LEVEL = 4  # gzip level / brotli quality, favouring speed over ratio
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -33,7 +45,8 @@ app = FastAPI(
     title=settings.APP_NAME,
     version=settings.APP_VERSION,
     description=settings.APP_DESCRIPTION,
-    openapi_url=f"{settings.API_V1_STR}/openapi.json"
+    openapi_url=f"{settings.API_V1_STR}/openapi.json",
+    default_response_class=ORJSONResponse
 )
 
 # Configure CORS
@@ -45,6 +58,17 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (history, position lists) for clients that accept it
+if BrotliMiddleware is not None:
+    app.add_middleware(
+        BrotliMiddleware,
+        quality=COMPRESSION_LEVEL,
+        minimum_size=COMPRESSION_MIN_SIZE,
+        gzip_fallback=True
+    )
+else:
+    app.add_middleware(GZipMiddleware, minimum_size=COMPRESSION_MIN_SIZE, compresslevel=COMPRESSION_LEVEL)
+
 # Initialize services with DB session
 @app.on_event("startup")
 async def startup_event():
@@ -123,6 +147,9 @@ async def shutdown_event():
         await exchange_manager.close()
         logger.info("Exchange connection closed")
 
+        # Close 1inch HTTP client
+        await oneinch_service.close()
+
         logger.info("Application shutdown completed successfully")
     except Exception as e:
         logger.error(f"Error during shutdown: {str(e)}")
@@ -11,7 +11,7 @@ class Portfolio(Base):
     symbol = Column(String, nullable=False)
     quantity = Column(Float, default=0, nullable=False)
     avg_buy_price = Column(Float, nullable=False, default=0.0)
-    realized_profit = Column(Float, default=0.0, nullable=False)  # Cumulative realized P/L
+    realized_profit = Column(Float, default=0.0, server_default="0.0", nullable=False)  # Cumulative realized P/L
     last_updated = Column(DateTime, default=datetime.utcnow)
     asset_type = Column(String, nullable=True)
     current_price = Column(Float, nullable=False, default=0.0)
@@ -0,0 +1,43 @@
+from pydantic import BaseModel, ConfigDict
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+
+class PortfolioHistoryRow(BaseModel):
+    """One point of the portfolio history returned by /portfolio-summary/history"""
+    id: int
+    timestamp: Optional[datetime] = None
+    total_value: float
+    total_profit_loss: float
+    total_profit_loss_percentage: float
+    crypto_value: float
+    stable_value: float
+    daily_change: Optional[float] = None
+    market_trend: Optional[str] = None
+    risk_level: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class PortfolioSummaryOut(BaseModel):
+    """Latest portfolio summary returned by /portfolio-summary/latest"""
+    id: int
+    timestamp: Optional[datetime] = None
+    total_value: float
+    total_cost_basis: float
+    total_profit_loss: float
+    total_profit_loss_percentage: float
+    crypto_value: float
+    stable_value: float
+    daily_change: Optional[float] = None
+    weekly_change: Optional[float] = None
+    monthly_change: Optional[float] = None
+    assets: Optional[Dict[str, Any]] = None
+    trades_today: Optional[int] = None
+    swaps_today: Optional[int] = None
+    market_trend: Optional[str] = None
+    market_volatility: Optional[float] = None
+    is_hedged: Optional[bool] = None
+    risk_level: Optional[int] = None
+
+    model_config = ConfigDict(from_attributes=True)
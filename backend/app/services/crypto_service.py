@@ -1,14 +1,16 @@
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy import select
 from typing import List, Optional
 from datetime import datetime
+import asyncio
 import ccxt
 import logging
 from app.models.crypto import Cryptocurrency, CryptoPair
 from app.core.logger import logger
 
 class CryptoService:
-    def __init__(self, db: Session = None):
+    def __init__(self, db: AsyncSession = None):
         """Initialize the crypto service"""
         self.db = db
         self.exchange = ccxt.binance()
@@ -16,8 +18,8 @@ class CryptoService:
     async def sync_cryptocurrencies(self) -> None:
         """Sync cryptocurrency data from exchange"""
         try:
-            # Fetch markets from exchange
-            markets = self.exchange.fetch_markets()
+            # Fetch markets from exchange (sync ccxt client, keep it off the event loop)
+            markets = await asyncio.to_thread(self.exchange.fetch_markets)
 
             # Process only USDT pairs
             usdt_markets = [m for m in markets if m['quote'] == 'USDT']
@@ -31,9 +33,10 @@ class CryptoService:
                     unique_markets[symbol] = market
 
             # Get existing symbols
+            result = await self.db.execute(select(Cryptocurrency))
             existing_cryptos = {
                 crypto.symbol: crypto
-                for crypto in self.db.query(Cryptocurrency).all()
+                for crypto in result.scalars().all()
             }
 
             # Track processed symbols
@@ -74,38 +77,51 @@ class CryptoService:
                     crypto.updated_at = datetime.utcnow()
 
             # Commit changes
-            self.db.commit()
+            await self.db.commit()
             logger.info(f"Cryptocurrency sync completed. Processed {len(processed_symbols)} pairs.")
 
         except Exception as e:
-            self.db.rollback()
+            await self.db.rollback()
             logger.error(f"Error syncing cryptocurrencies: {str(e)}")
             raise
 
-    def get_all_active_pairs(self) -> List[str]:
-        """Get all active trading pairs from the database"""
+    async def get_all_active_pairs(self, limit: Optional[int] = None, after: Optional[str] = None) -> List[str]:
+        """Get active trading pairs from the database, ordered by symbol
+
+        Args:
+            limit: Maximum number of symbols to return (default None returns every active pair)
+            after: Keyset cursor; only symbols sorting after this one are returned
+        """
         try:
             if not self.db:
                 logger.warning("Database session not initialized")
                 return []
 
-            pairs = self.db.query(CryptoPair).filter(CryptoPair.is_active == True).all()
-            return [pair.symbol for pair in pairs]
+            stmt = select(CryptoPair.symbol).where(CryptoPair.is_active == True)
+            if after is not None:
+                stmt = stmt.where(CryptoPair.symbol > after)
+            stmt = stmt.order_by(CryptoPair.symbol)
+            if limit is not None:
+                stmt = stmt.limit(limit)
+
+            result = await self.db.execute(stmt)
+            return list(result.scalars().all())
         except Exception as e:
             logger.error(f"Error getting active pairs: {str(e)}")
             return []
 
-    def get_crypto_by_symbol(self, symbol: str) -> Optional[Cryptocurrency]:
+    async def get_crypto_by_symbol(self, symbol: str) -> Optional[Cryptocurrency]:
         """Get cryptocurrency by symbol"""
         try:
-            return self.db.query(Cryptocurrency).filter(
-                Cryptocurrency.symbol == symbol
-            ).first()
+            result = await self.db.execute(
+                select(Cryptocurrency).where(Cryptocurrency.symbol == symbol)
+            )
+            return result.scalars().first()
         except Exception as e:
             logger.error(f"Error fetching crypto by symbol {symbol}: {str(e)}")
             return None
 
-    def validate_trading_pair(self, symbol: str) -> bool:
+    async def validate_trading_pair(self, symbol: str) -> bool:
         """
         Validate if a trading pair exists in the database.
 
@@ -120,30 +136,32 @@ class CryptoService:
                 logger.warning("Database session not initialized")
                 return False
 
-            pair = self.db.query(CryptoPair).filter(
-                CryptoPair.symbol == symbol,
-                CryptoPair.is_active == True
-            ).first()
-            return pair is not None
+            result = await self.db.execute(
+                select(CryptoPair.id).where(
+                    CryptoPair.symbol == symbol,
+                    CryptoPair.is_active == True
+                )
+            )
+            return result.first() is not None
         except Exception as e:
             logger.error(f"Error validating trading pair {symbol}: {str(e)}")
             return False
 
-    def get_precision_info(self, symbol: str) -> tuple:
+    async def get_precision_info(self, symbol: str) -> tuple:
         """Get price and quantity precision for a symbol"""
-        crypto = self.get_crypto_by_symbol(symbol)
+        crypto = await self.get_crypto_by_symbol(symbol)
         if crypto:
             return crypto.price_precision, crypto.quantity_precision
         return 8, 8  # Default precision if not found
 
-    def get_min_quantity(self, symbol: str) -> float:
+    async def get_min_quantity(self, symbol: str) -> float:
         """Get minimum trade quantity for a symbol"""
-        crypto = self.get_crypto_by_symbol(symbol)
+        crypto = await self.get_crypto_by_symbol(symbol)
         if crypto:
             return crypto.min_quantity
         return 0.0  # Default if not found
 
-    def add_trading_pair(self, symbol: str) -> bool:
+    async def add_trading_pair(self, symbol: str) -> bool:
         """
         Add a new trading pair to the database.
 
@@ -159,27 +177,28 @@ class CryptoService:
                 return False
 
             # Check if pair already exists
-            existing_pair = self.db.query(CryptoPair).filter(
-                CryptoPair.symbol == symbol
-            ).first()
+            result = await self.db.execute(
+                select(CryptoPair).where(CryptoPair.symbol == symbol)
+            )
+            existing_pair = result.scalars().first()
 
             if existing_pair:
                 if not existing_pair.is_active:
                     existing_pair.is_active = True
-                    self.db.commit()
+                    await self.db.commit()
                 return True
 
             # Create new pair
             new_pair = CryptoPair(symbol=symbol, is_active=True)
             self.db.add(new_pair)
-            self.db.commit()
+            await self.db.commit()
             return True
         except Exception as e:
             logger.error(f"Error adding trading pair {symbol}: {str(e)}")
-            self.db.rollback()
+            await self.db.rollback()
             return False
 
-    def deactivate_trading_pair(self, symbol: str) -> bool:
+    async def deactivate_trading_pair(self, symbol: str) -> bool:
         """
         Deactivate a trading pair.
 
@@ -194,18 +213,19 @@ class CryptoService:
                 logger.warning("Database session not initialized")
                 return False
 
-            pair = self.db.query(CryptoPair).filter(
-                CryptoPair.symbol == symbol
-            ).first()
+            result = await self.db.execute(
+                select(CryptoPair).where(CryptoPair.symbol == symbol)
+            )
+            pair = result.scalars().first()
 
             if pair:
                 pair.is_active = False
-                self.db.commit()
+                await self.db.commit()
                 return True
             return False
         except Exception as e:
             logger.error(f"Error deactivating trading pair {symbol}: {str(e)}")
-            self.db.rollback()
+            await self.db.rollback()
             return False
 
 # Create singleton instance
@@ -2,7 +2,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.sql import text
 from datetime import datetime, timedelta
 from app.crud.curd_crypto import sanitize_table_name
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 import logging
 import plotly.graph_objects as go
 import pandas as pd
@@ -101,6 +101,46 @@ async def get_price_and_swaps_for_chart(
         'swap_events': swap_events
     }
 
+async def get_chart_fingerprint(
+    db: AsyncSession,
+    symbol: str,
+    month: Optional[int] = None,
+    year: Optional[int] = None,
+    start_time: Optional[datetime] = None
+) -> Optional[Tuple[Optional[datetime], str]]:
+    """
+    (latest price timestamp, digest of the joined swaps' id/status/realized_profit) for a chart.
+    Swap rows have no updated_at, so their charted fields are hashed to catch status/profit updates.
+    Returns None if it can't be read, e.g. the table doesn't exist.
+    """
+    table_name = sanitize_table_name(symbol, month, year)
+    time_filter = ""
+    params = {}
+    if start_time:
+        time_filter = " AND p.timestamp >= :start_time"
+        params['start_time'] = start_time
+    query = text(f'''
+        SELECT
+            (SELECT MAX(timestamp) FROM "{table_name}") AS last_timestamp,
+            (
+                SELECT md5(COALESCE(string_agg(
+                    s.transaction_id || ':' || s.status || ':' || s.realized_profit::text,
+                    ',' ORDER BY s.transaction_id
+                ), ''))
+                FROM "{table_name}" p
+                JOIN swap_transactions s ON p.swap_transactions_id = s.transaction_id
+                WHERE 1=1 {time_filter}
+            ) AS swap_digest
+    ''')
+    try:
+        result = await db.execute(query, params)
+        last_timestamp, swap_digest = result.one()
+        return last_timestamp, swap_digest
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"Error reading chart fingerprint from {table_name}: {str(e)}")
+        return None
+
 def generate_price_swap_plot(result: dict) -> str:
     """
     Generate an interactive Plotly HTML chart for price and swap events.
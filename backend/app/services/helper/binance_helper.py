@@ -1,3 +1,4 @@
+import asyncio
 from binance.client import Client
 from binance.exceptions import BinanceAPIException
 from typing import Dict, Optional, List, Union
@@ -30,7 +31,8 @@ class BinanceHelper:
                 return {"symbol": symbol, "price": 1.0, "time": int(time.time() * 1000)}
             # Convert symbol format if needed (BTC/USDT -> BTCUSDT)
             formatted_symbol = symbol.replace("/", "")
-            ticker = self.client.get_symbol_ticker(symbol=formatted_symbol)
+            # The python-binance client is blocking, keep it off the event loop
+            ticker = await asyncio.to_thread(self.client.get_symbol_ticker, symbol=formatted_symbol)
             current_time = int(datetime.utcnow().timestamp() * 1000)  # Convert to milliseconds
 
 
@@ -179,7 +181,7 @@ class BinanceHelper:
         """
         try:
             # Get all tickers in one API call
-            tickers = self.client.get_ticker()
+            tickers = await asyncio.to_thread(self.client.get_ticker)
             ticker_map = {t['symbol']: t for t in tickers}
 
             # Prepare results
@@ -337,7 +339,8 @@ class BinanceHelper:
         try:
             formatted_symbol = symbol.replace("/", "")
             # Get the klines data for the last 5 intervals
-            klines = self.client.get_klines(
+            klines = await asyncio.to_thread(
+                self.client.get_klines,
                 symbol=formatted_symbol,
                 interval=Client.KLINE_INTERVAL_5MINUTE,
                 limit=intervals
@@ -425,7 +428,8 @@ class BinanceHelper:
         try:
             formatted_symbol = symbol.replace("/", "")
             # Get the klines data for the last 5 intervals
-            klines = self.client.get_klines(
+            klines = await asyncio.to_thread(
+                self.client.get_klines,
                 symbol=formatted_symbol,
                 interval=Client.KLINE_INTERVAL_15MINUTE,
                 limit=intervals
@@ -498,6 +502,32 @@ class BinanceHelper:
             logger.error(f"Error processing 15m price history for {symbol}: {str(e)}")
             raise BinanceAPIException(f"Error processing price history: {str(e)}")
 
+    async def get_close_prices(self, symbol: str, intervals: int = 50) -> List[float]:
+        """
+        Get only the close prices of the klines get_dynamic_price_history uses,
+        skipping the per-kline dicts and statistics
+        Args:
+            symbol: Trading pair symbol (e.g., 'BTC/USDT')
+            intervals: Number of intervals to fetch (default: 50)
+        Returns:
+            Close prices, oldest first
+        """
+        try:
+            klines = await asyncio.to_thread(
+                self.client.get_klines,
+                symbol=symbol.replace("/", ""),
+                interval=Client.KLINE_INTERVAL_15MINUTE,
+                limit=intervals
+            )
+
+            if not klines or len(klines) < 10:
+                raise ValueError(f"Insufficient kline data. Required: {intervals}, Got: {len(klines) if klines else 0}")
+
+            return [float(kline[4]) for kline in klines]
+        except BinanceAPIException as e:
+            logger.error(f"Error fetching close prices for {symbol}: {str(e)}")
+            raise
+
     #get the best stable coin to buy from the binance array from live market
     async def get_best_stable_coin(self) -> Dict[str, Union[str, Dict, List]]:
         """
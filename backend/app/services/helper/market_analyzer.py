@@ -1,13 +1,23 @@
 import numpy as np
 import pandas as pd
-from typing import Dict, Tuple, Optional
+from typing import Dict, Literal, Protocol, Tuple, Optional
 from dataclasses import dataclass
 from app.core.logger import logger
+from app.core.kernels import NUMBA_AVAILABLE, breakout_kernel
+
+BB_PERIOD = 20  # bars in the Bollinger moving average and standard deviation
+BB_STD = 2  # standard deviations between the middle and outer bands
+RSI_PERIOD = 14  # bars averaged for RSI gains/losses
+MACD_FAST = 12  # span of the fast MACD EMA
+MACD_SLOW = 26  # span of the slow MACD EMA
+MACD_SIGNAL = 9  # span of the MACD signal EMA
+VOLUME_WINDOW = 20  # bars averaged for the volume spike baseline
+VOLUME_THRESHOLD = 2.0  # last volume / average volume counted as a spike
 
 @dataclass
 class BreakoutSignal:
     symbol: str
-    direction: str  # "UP" or "DOWN"
+    direction: Literal["UP", "DOWN"]
     price: float
     confidence: float
     volume_spike: bool
@@ -15,6 +25,10 @@ class BreakoutSignal:
     rsi_divergence: bool
     macd_crossover: bool
 
+class BreakoutDirection(Protocol):
+    """Anything carrying a breakout direction, e.g. a BreakoutSignal or the API's breakout request"""
+    direction: Literal["UP", "DOWN"]
+
 class MarketAnalyzer:
     def __init__(self):
         self.bb_period = 20
@@ -88,8 +102,8 @@ class MarketAnalyzer:
         Returns: (upper_band, middle_band, lower_band)
         """
         try:
-            bb_period = 20  # bb period means how many days to calculate the moving average and standard deviation
-            bb_std = 2  # bb std means how many standard deviations to add to the moving average
+            bb_period = BB_PERIOD  # bb period means how many days to calculate the moving average and standard deviation
+            bb_std = BB_STD  # bb std means how many standard deviations to add to the moving average
 
             # Calculate middle band (Simple Moving Average)
             middle_band = prices.rolling(window=bb_period, min_periods=1).mean()
@@ -131,11 +145,9 @@ class MarketAnalyzer:
             # Calculate bandwidth
             band_width = (upper - lower) / middle
             recent_width = float(band_width.iloc[-1])
-            avg_width = float(band_width.rolling(window=20, min_periods=1).mean().iloc[-1])
+            avg_width = float(band_width.rolling(window=BB_PERIOD, min_periods=1).mean().iloc[-1])
 
-            # Calculate squeeze intensity
-            squeeze_intensity = float(avg_width / recent_width if recent_width > 0 else 0)
-            is_squeeze = bool(recent_width < avg_width * 0.5)
+            is_squeeze, squeeze_intensity = MarketAnalyzer._squeeze_from_widths(recent_width, avg_width)
 
             logger.debug(f"""
             BB Squeeze Analysis:
@@ -151,10 +163,17 @@ class MarketAnalyzer:
             logger.error(f"Error in BB squeeze calculation: {str(e)}")
             raise
 
+    @staticmethod
+    def _squeeze_from_widths(recent_width: float, avg_width: float) -> Tuple[bool, float]:
+        """Squeeze flag and intensity from the latest and average band width"""
+        squeeze_intensity = float(avg_width / recent_width if recent_width > 0 else 0)
+        is_squeeze = bool(recent_width < avg_width * 0.5)
+        return is_squeeze, squeeze_intensity
+
     @staticmethod
     def calculate_rsi(prices: pd.Series) -> pd.Series:
         """Calculate RSI indicator"""
-        rsi_period = 14
+        rsi_period = RSI_PERIOD
         delta = prices.diff()
         gain = (delta.where(delta > 0, 0)).rolling(window=rsi_period).mean()
         loss = (-delta.where(delta < 0, 0)).rolling(window=rsi_period).mean()
@@ -166,6 +185,11 @@ class MarketAnalyzer:
         """Detect RSI divergence"""
         price_trend = float(prices.iloc[-5:].pct_change().mean())
         rsi_trend = float(rsi.iloc[-5:].diff().mean())
+        return MarketAnalyzer._divergence_from_trends(price_trend, rsi_trend)
+
+    @staticmethod
+    def _divergence_from_trends(price_trend: float, rsi_trend: float) -> Tuple[bool, float]:
+        """Divergence flag and strength from the recent price and RSI trends"""
         divergence_strength = abs(price_trend - rsi_trend)
         is_divergence = bool((price_trend > 0 and rsi_trend < 0) or (price_trend < 0 and rsi_trend > 0))
         logger.debug(f"RSI Divergence: {is_divergence}, Strength: {divergence_strength:.4f}")
@@ -174,9 +198,9 @@ class MarketAnalyzer:
     @staticmethod
     def calculate_macd(prices: pd.Series) -> Tuple[pd.Series, pd.Series]:
         """Calculate MACD indicator"""
-        macd_fast = 12
-        macd_slow = 26
-        macd_signal = 9
+        macd_fast = MACD_FAST
+        macd_slow = MACD_SLOW
+        macd_signal = MACD_SIGNAL
         exp1 = prices.ewm(span=macd_fast).mean()
         exp2 = prices.ewm(span=macd_slow).mean()
         macd = exp1 - exp2
@@ -186,10 +210,9 @@ class MarketAnalyzer:
     @staticmethod
     def detect_volume_spike(volume: pd.Series) -> Tuple[bool, float]:
         """Detect volume spike"""
-        volume_threshold = 2.0
-        avg_volume = volume.rolling(window=20).mean()
+        avg_volume = volume.rolling(window=VOLUME_WINDOW).mean()
         volume_ratio = float(volume.iloc[-1] / avg_volume.iloc[-1] if avg_volume.iloc[-1] > 0 else 0)
-        is_spike = bool(volume_ratio > volume_threshold)
+        is_spike = bool(volume_ratio > VOLUME_THRESHOLD)
         logger.debug(f"Volume Spike: {is_spike}, Ratio: {volume_ratio:.2f}")
         return is_spike, volume_ratio
 
@@ -215,28 +238,44 @@ class MarketAnalyzer:
                     "validation_error": True
                 }
 
-            # Calculate indicators
-            upper_bb, middle_bb, lower_bb = MarketAnalyzer.calculate_bollinger_bands(prices)
-            rsi = MarketAnalyzer.calculate_rsi(prices)
-            macd, signal = MarketAnalyzer.calculate_macd(prices)
-
-            # Check for squeeze with intensity
-            bb_squeeze, squeeze_intensity = MarketAnalyzer.is_bb_squeeze(prices)
-
-            # Check for volume spike with ratio
-            volume_spike, volume_ratio = MarketAnalyzer.detect_volume_spike(volume)
-
-            # Check for RSI divergence with strength
-            rsi_divergence, divergence_strength = MarketAnalyzer.detect_rsi_divergence(prices, rsi)
+            if NUMBA_AVAILABLE:
+                # Only the latest bar is used, so one compiled pass replaces the full-length pandas series
+                (upper, middle, lower, recent_width, avg_width, current_rsi, rsi_trend, price_trend,
+                 macd_prev, macd_last, signal_prev, signal_last, volume_ratio) = breakout_kernel(
+                    prices.to_numpy(dtype=np.float64), volume.to_numpy(dtype=np.float64),
+                    BB_PERIOD, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL, VOLUME_WINDOW, float(BB_STD)
+                )
+                if np.isnan(upper) or np.isnan(middle) or np.isnan(lower):
+                    raise ValueError("Invalid Bollinger Bands calculation - NaN values detected")
+                bb_squeeze, squeeze_intensity = MarketAnalyzer._squeeze_from_widths(recent_width, avg_width)
+                volume_spike = bool(volume_ratio > VOLUME_THRESHOLD)
+                rsi_divergence, divergence_strength = MarketAnalyzer._divergence_from_trends(price_trend, rsi_trend)
+            else:
+                # Calculate indicators
+                upper_bb, middle_bb, lower_bb = MarketAnalyzer.calculate_bollinger_bands(prices)
+                rsi = MarketAnalyzer.calculate_rsi(prices)
+                macd, signal = MarketAnalyzer.calculate_macd(prices)
+                upper, middle, lower = float(upper_bb.iloc[-1]), float(middle_bb.iloc[-1]), float(lower_bb.iloc[-1])
+                macd_prev, macd_last = float(macd.iloc[-2]), float(macd.iloc[-1])
+                signal_prev, signal_last = float(signal.iloc[-2]), float(signal.iloc[-1])
+                current_rsi = float(rsi.iloc[-1])
+
+                # Check for squeeze with intensity
+                bb_squeeze, squeeze_intensity = MarketAnalyzer.is_bb_squeeze(prices)
+
+                # Check for volume spike with ratio
+                volume_spike, volume_ratio = MarketAnalyzer.detect_volume_spike(volume)
+
+                # Check for RSI divergence with strength
+                rsi_divergence, divergence_strength = MarketAnalyzer.detect_rsi_divergence(prices, rsi)
 
             # Check for MACD crossover
             macd_crossover = bool(
-                (macd.iloc[-2] < signal.iloc[-2] and macd.iloc[-1] > signal.iloc[-1]) or
-                (macd.iloc[-2] > signal.iloc[-2] and macd.iloc[-1] < signal.iloc[-1])
+                (macd_prev < signal_prev and macd_last > signal_last) or
+                (macd_prev > signal_prev and macd_last < signal_last)
             )
 
             current_price = float(prices.iloc[-1])
-            current_rsi = float(rsi.iloc[-1])
 
             # Calculate market conditions
             market_conditions = {
@@ -260,10 +299,10 @@ class MarketAnalyzer:
             logger.info(f"Market conditions for {symbol}: {market_conditions}")
 
             # Determine breakout direction and confidence
-            if current_price > upper_bb.iloc[-1]:
+            if current_price > upper:
                 direction = "UP"
-                confidence = float(min(1.0, (current_price - upper_bb.iloc[-1]) /
-                               (upper_bb.iloc[-1] - middle_bb.iloc[-1])))
+                confidence = float(min(1.0, (current_price - upper) /
+                               (upper - middle)))
 
                 signal = BreakoutSignal(
                     symbol=symbol,
@@ -284,10 +323,10 @@ class MarketAnalyzer:
                     "message": "Upward breakout detected"
                 }
 
-            elif current_price < lower_bb.iloc[-1]:
+            elif current_price < lower:
                 direction = "DOWN"
-                confidence = float(min(1.0, (lower_bb.iloc[-1] - current_price) /
-                               (middle_bb.iloc[-1] - lower_bb.iloc[-1])))
+                confidence = float(min(1.0, (lower - current_price) /
+                               (middle - lower)))
 
                 signal = BreakoutSignal(
                     symbol=symbol,
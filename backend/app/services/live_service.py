@@ -4,8 +4,11 @@ import asyncio
 from app.services.helper.binance_helper import binance_helper
 from app.core.logger import logger
 from app.core.config import settings
+from app.core.cache import cached
 import random
 
+LIVE_TOKENS_TTL = 10  # seconds; 24h stats move slowly enough to share between requests
+
 class LiveService:
     def __init__(self):
         self.binance = binance_helper
@@ -41,9 +44,16 @@ class LiveService:
         Returns:
             List of token data dictionaries
         """
+        # Use provided symbols or default ones; the result is sorted by market cap,
+        # so order and duplicates don't matter and the cache key can be canonical
+        normalized_symbols = sorted(set(symbols if symbols else self.default_symbols))
+        return await self._get_live_tokens(",".join(normalized_symbols))
+
+    @cached(ttl=LIVE_TOKENS_TTL, key="live:tokens:{symbols_key}")
+    async def _get_live_tokens(self, symbols_key: str) -> List[Dict[str, Any]]:
+        """Fetch and format live token data for a sorted, comma-joined symbol list"""
         try:
-            # Use provided symbols or default ones
-            target_symbols = symbols if symbols else self.default_symbols
+            target_symbols = symbols_key.split(",")
 
             # Fetch enhanced price data for all symbols
             price_data = await self.binance.get_multiple_enhanced_prices(target_symbols)
@@ -103,41 +113,58 @@ class LiveService:
             # Use provided symbols or default ones
             target_symbols = symbols if symbols else self.default_symbols[:3]  # Limit to 3 for signals
 
-            signals = []
+            # Analyse every symbol concurrently, keeping the requested order
+            results = await asyncio.gather(*[self._get_signal(symbol) for symbol in target_symbols])
+            return [signal for signal in results if signal]
 
-            for symbol in target_symbols:
-                try:
-                    # Get 5-minute price history for signal analysis
-                    history_data = await self.binance.get_5m_price_history(symbol, intervals=10)
+        except Exception as e:
+            logger.error(f"Error generating live signals: {str(e)}")
+            return []
 
-                    if not history_data or not history_data.get("data"):
-                        continue
+    async def _get_signal(self, symbol: str) -> Optional[Dict[str, Any]]:
+        """Generate the trading signal for one symbol, or None if there isn't one"""
+        try:
+            # Get 5-minute price history for signal analysis
+            history_data = await self.binance.get_5m_price_history(symbol, intervals=10)
 
-                    data = history_data["data"]
-                    history = data.get("history", [])
-                    stats = data.get("statistics", {})
+            if not history_data or not history_data.get("data"):
+                return None
 
-                    if len(history) < 5:
-                        continue
+            data = history_data["data"]
+            history = data.get("history", [])
+            stats = data.get("statistics", {})
 
-                    # Extract base symbol
-                    base_symbol = symbol.replace("USDT", "").replace("USDC", "").replace("BUSD", "")
+            if len(history) < 5:
+                return None
 
-                    # Simple signal generation logic
-                    signal = self._generate_signal(history, stats, base_symbol)
+            # Extract base symbol
+            base_symbol = symbol.replace("USDT", "").replace("USDC", "").replace("BUSD", "")
 
-                    if signal:
-                        signals.append(signal)
+            # Simple signal generation logic
+            return self._generate_signal(history, stats, base_symbol)
 
-                except Exception as e:
-                    logger.error(f"Error generating signal for {symbol}: {str(e)}")
-                    continue
+        except Exception as e:
+            logger.error(f"Error generating signal for {symbol}: {str(e)}")
+            return None
 
-            return signals
+    async def get_market_snapshot(self, symbols: Optional[List[str]] = None) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get live tokens and trading signals together
 
-        except Exception as e:
-            logger.error(f"Error generating live signals: {str(e)}")
-            return []
+        Tokens come from one all-ticker request (shared through the live token cache) and
+        signals from per-symbol kline requests, all issued concurrently.
+
+        Args:
+            symbols: List of token symbols (optional)
+
+        Returns:
+            Dictionary with "tokens" and "signals" lists
+        """
+        tokens, signals = await asyncio.gather(
+            self.get_live_tokens(symbols),
+            self.get_live_signals(symbols)
+        )
+        return {"tokens": tokens, "signals": signals}
 
     async def get_token_details(self, symbol: str) -> Dict[str, Any]:
         """
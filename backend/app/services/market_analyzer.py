@@ -3,10 +3,15 @@ import pandas as pd
 from datetime import datetime, timedelta
 import platform
 import asyncio
+from math import sqrt
 from app.core.logger import logger
 from app.core.config import settings
 from app.core.exchange.exchange_manager import exchange_manager
 import numpy as np
+from app.core.kernels import NUMBA_AVAILABLE, signals_kernel, volatility_kernel
+
+ANNUALIZATION_FACTOR = sqrt(252)  # Trading days per year, for annualised volatility
+MAX_CONCURRENT_ANALYSES = 10  # Concurrent per-symbol analyses in get_market_analysis_many
 
 # Set event loop policy for Windows
 if platform.system() == "Windows":
@@ -53,15 +58,20 @@ class MarketAnalyzer:
                     'symbol': symbol
                 }
 
-            # Get price data for technical analysis
-            price_data = await self.get_price_data(symbol)
+            # Get price data for technical analysis once and share it with every indicator
+            price_data = await self.get_price_data(symbol, interval="1h", limit=24)
             if isinstance(price_data, dict) and price_data.get('error'):
                 return price_data
 
-            # Calculate market indicators
-            volatility = await self.calculate_volatility(symbol)
-            trading_signal = await self.get_trading_signal(symbol)
-            market_conditions = await self.check_market_conditions(symbol)
+            # Calculate market indicators, stamped with a single timestamp
+            timestamp = datetime.utcnow().isoformat()
+            volatility = await self.calculate_volatility(symbol, price_data=price_data)
+            trading_signal = await self.get_trading_signal(
+                symbol, price_data=price_data, ticker=ticker_data, volatility=volatility, timestamp=timestamp
+            )
+            market_conditions = await self.check_market_conditions(
+                symbol, price_data=price_data, timestamp=timestamp
+            )
 
             return {
                 'error': False,
@@ -84,6 +94,30 @@ class MarketAnalyzer:
                 'symbol': symbol
             }
 
+    async def get_market_analysis_many(
+        self,
+        symbols: List[str],
+        max_concurrency: int = MAX_CONCURRENT_ANALYSES
+    ) -> Dict[str, Dict]:
+        """
+        Get market analysis for several trading pairs with bounded concurrency.
+
+        Args:
+            symbols: Trading pair symbols (e.g., ['BTC/USDT', 'ETH/USDT'])
+            max_concurrency: Maximum number of symbols analysed at once
+
+        Returns:
+            Dict[str, Dict]: Market analysis keyed by formatted symbol
+        """
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def analyze(symbol: str) -> Dict:
+            async with semaphore:
+                return await self.get_market_analysis(symbol)
+
+        results = await asyncio.gather(*[analyze(symbol) for symbol in symbols])
+        return {result['symbol']: result for result in results}
+
     async def check_trade_viability(self, symbol: str, side: str, quantity: float, price: float) -> Dict:
         """Check if a trade is viable based on current market conditions"""
         symbol = self._format_symbol(symbol)
@@ -168,9 +202,6 @@ class MarketAnalyzer:
                 history_data = price_history['data']['history']
                 df = pd.DataFrame(history_data)
 
-                # Rename columns to match OHLCV format
-                df = df.rename(columns={'timestamp': 'timestamp'})
-
                 # Convert timestamp to datetime
                 df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
 
@@ -189,9 +220,6 @@ class MarketAnalyzer:
                 history_data = price_history['data']['history']
                 df = pd.DataFrame(history_data)
 
-                # Rename columns to match OHLCV format
-                df = df.rename(columns={'timestamp': 'timestamp'})
-
                 # Convert timestamp to datetime
                 df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
 
@@ -210,9 +238,6 @@ class MarketAnalyzer:
                 history_data = price_history['data']['history']
                 df = pd.DataFrame(history_data)
 
-                # Rename columns to match OHLCV format
-                df = df.rename(columns={'timestamp': 'timestamp'})
-
                 # Convert timestamp to datetime
                 df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
 
@@ -239,14 +264,23 @@ class MarketAnalyzer:
     async def calculate_volatility(
         self,
         symbol: str,
-        period: int = 14
+        period: int = 14,
+        price_data: Optional[pd.DataFrame] = None
     ) -> float:
-        """Calculate price volatility"""
+        """Calculate price volatility, over the last `period` rows of price_data when given"""
         try:
-            df = await self.get_price_data(symbol, limit=period)
-            returns = df['close'].pct_change().dropna()
-            volatility = returns.std() * (252 ** 0.5)  # Annualized volatility
-            return float(volatility)
+            if price_data is not None:
+                df = price_data.tail(period)
+            else:
+                df = await self.get_price_data(symbol, limit=period)
+            close = df['close'].to_numpy(dtype=np.float64)
+            if NUMBA_AVAILABLE:
+                returns_std = volatility_kernel(close, close.shape[0])[0]
+            else:
+                returns = np.diff(close) / close[:-1]
+                returns_std = returns.std(ddof=1)
+            # Annualized volatility, scaled as a Python float rather than a NumPy scalar
+            return float(returns_std) * ANNUALIZATION_FACTOR
         except Exception as e:
             logger.error(f"Error calculating volatility: {str(e)}")
             raise
@@ -254,32 +288,33 @@ class MarketAnalyzer:
     async def get_trading_signal(
         self,
         symbol: str,
-        strategy: str = "TIME_BASED_STRADDLE"
+        strategy: str = "TIME_BASED_STRADDLE",
+        price_data: Optional[pd.DataFrame] = None,
+        ticker: Optional[Dict] = None,
+        volatility: Optional[float] = None,
+        timestamp: Optional[str] = None
     ) -> Dict:
-        """Generate trading signals based on strategy"""
+        """Generate trading signals based on strategy, reusing already fetched market data when given"""
         try:
             # Get current market data
-            ticker = await exchange_manager.get_ticker(symbol)
+            if ticker is None:
+                ticker = await exchange_manager.get_ticker(symbol)
             if not ticker:
                 raise Exception(f"Could not get ticker data for {symbol}")
             current_price = ticker['last']
 
             # Get price data for technical analysis
-            df = await self.get_price_data(symbol, interval="1h", limit=24)
+            df = price_data if price_data is not None else await self.get_price_data(symbol, interval="1h", limit=24)
+            close = df['close'].to_numpy(dtype=np.float64)
+            high = df['high'].to_numpy(dtype=np.float64)
+            low = df['low'].to_numpy(dtype=np.float64)
 
             # Calculate volatility
-            volatility = await self.calculate_volatility(symbol)
-
-            # Calculate RSI
-            delta = df['close'].diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=14).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
-            rs = gain / loss
-            rsi = 100 - (100 / (1 + rs)).iloc[-1]
+            if volatility is None:
+                volatility = await self.calculate_volatility(symbol, price_data=df)
 
-            # Calculate support and resistance levels using recent lows and highs
-            support = df['low'].rolling(window=12).min().iloc[-1]
-            resistance = df['high'].rolling(window=12).max().iloc[-1]
+            # Calculate RSI (last 14 changes) and support/resistance (recent 12 lows/highs)
+            rsi, support, resistance = self._calculate_signal_levels(close, high, low)
 
             # Generate primary signal based on RSI and volatility
             if rsi < 30 and volatility < 0.3:  # Low RSI and moderate volatility
@@ -314,32 +349,52 @@ class MarketAnalyzer:
                 "stop_loss": stop_loss,
                 "take_profit": take_profit,
                 "volatility": volatility * 100,  # Convert to percentage
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp or datetime.utcnow().isoformat()
             }
         except Exception as e:
             logger.error(f"Error generating trading signal: {str(e)}")
             raise
 
-    async def check_market_conditions(self, symbol: str) -> Dict:
+    def _calculate_signal_levels(self, close: np.ndarray, high: np.ndarray, low: np.ndarray, rsi_period: int = 14, sr_window: int = 12) -> tuple:
+        """Calculate the latest RSI, support and resistance"""
+        if NUMBA_AVAILABLE:
+            return signals_kernel(close, high, low, rsi_period, sr_window)
+
+        rsi = np.nan
+        if close.size > rsi_period:
+            delta = np.diff(close[-(rsi_period + 1):])
+            gain = delta[delta > 0].sum() / rsi_period
+            loss = -delta[delta < 0].sum() / rsi_period
+            rsi = 100.0 if loss == 0 else 100 - 100 / (1 + gain / loss)
+
+        support = float(low[-sr_window:].min()) if low.size >= sr_window else np.nan
+        resistance = float(high[-sr_window:].max()) if high.size >= sr_window else np.nan
+        return rsi, support, resistance
+
+    async def check_market_conditions(
+        self,
+        symbol: str,
+        price_data: Optional[pd.DataFrame] = None,
+        timestamp: Optional[str] = None
+    ) -> Dict:
         """Check overall market conditions"""
         try:
-            df = await self.get_price_data(symbol, interval="1h", limit=24)
+            df = price_data if price_data is not None else await self.get_price_data(symbol, interval="1h", limit=24)
+            close = df['close'].to_numpy(dtype=np.float64)
+            volume = df['volume'].to_numpy(dtype=np.float64)
 
             # Calculate basic metrics
-            price_change_24h = (
-                (df['close'].iloc[-1] - df['close'].iloc[0])
-                / df['close'].iloc[0]
-            ) * 100
+            price_change_24h = float((close[-1] - close[0]) / close[0] * 100)
 
-            volume_24h = df['volume'].sum()
-            avg_volume = df['volume'].mean()
+            volume_24h = float(volume.sum())
+            avg_volume = volume_24h / volume.size  # Reuse the sum instead of a second pass
 
             return {
                 "symbol": symbol,
                 "price_change_24h": price_change_24h,
                 "volume_24h": volume_24h,
                 "avg_hourly_volume": avg_volume,
-                "timestamp": datetime.utcnow().isoformat()
+                "timestamp": timestamp or datetime.utcnow().isoformat()
             }
         except Exception as e:
             logger.error(f"Error checking market conditions: {str(e)}")
@@ -348,7 +403,7 @@ class MarketAnalyzer:
     async def get_trading_pairs(self) -> List[str]:
         """Get list of available trading pairs"""
         try:
-            return exchange_manager.get_all_active_pairs()
+            return await exchange_manager.get_all_active_pairs()
         except Exception as e:
             logger.error(f"Error getting trading pairs: {str(e)}")
             raise
@@ -1,14 +1,26 @@
 import requests
+import httpx
 import asyncio
 import json
 import os
-from typing import Dict, Optional, Any, List
+import orjson
+from typing import Callable, Dict, Optional, Any, List, Tuple
 from web3 import Web3
 from app.core.logger import logger
 from app.core.config import settings
 from datetime import datetime, timedelta
 from pathlib import Path
 
+HTTP_TIMEOUT = 10.0  # seconds per 1inch API request
+MAX_CONNECTIONS = 200  # connections the shared client may open
+MAX_KEEPALIVE_CONNECTIONS = 100  # idle connections kept for reuse
+
+# Popular tokens on BSC, most popular first
+POPULAR_SYMBOLS = (
+    'BNB', 'USDT', 'USDC', 'BUSD', 'ETH', 'BTC', 'CAKE', 'ADA', 'DOT', 'LINK',
+    'XRP', 'LTC', 'BCH', 'EOS', 'TRX', 'XLM', 'ATOM', 'VET', 'FIL', 'THETA'
+)
+
 class OneInchService:
     def __init__(self):
         self.chain_id = getattr(settings, 'ONEINCH_CHAIN_ID', 56)  # BSC by default
@@ -39,8 +51,14 @@ class OneInchService:
             "Content-Type": "application/json"
         }
 
+        # Shared keep-alive client for the async API calls, created on first use
+        self._http: Optional[httpx.AsyncClient] = None
+
         # Token addresses - will be populated dynamically
         self.token_addresses = {}
+        self.token_details = {}  # address -> token info from the same 1inch token list
+        self._token_views_source = None  # token_addresses the derived views were built from
+        self._token_views: Dict[str, Any] = {}  # view name -> value derived from token_addresses
         self._token_cache_file = Path("token_addresses_cache.json")
         self._cache_expiry_hours = 24  # Cache expires after 24 hours
 
@@ -69,6 +87,7 @@ class OneInchService:
                 cache_time = datetime.fromisoformat(cache_data.get('timestamp', '2000-01-01'))
                 if datetime.now() - cache_time < timedelta(hours=self._cache_expiry_hours):
                     self.token_addresses = cache_data.get('tokens', {})
+                    self.token_details = cache_data.get('details', {})
                     logger.info(f"Loaded {len(self.token_addresses)} token addresses from cache")
                     return
                 else:
@@ -81,6 +100,7 @@ class OneInchService:
             logger.error(f"Error loading token addresses: {str(e)}")
             # Use fallback tokens
             self.token_addresses = self._fallback_tokens.copy()
+            self.token_details = {}
             logger.info(f"Using fallback token addresses: {len(self.token_addresses)} tokens")
 
     def _fetch_token_addresses(self):
@@ -89,6 +109,7 @@ class OneInchService:
             if not self.api_key:
                 logger.warning("No 1inch API key available, using fallback tokens")
                 self.token_addresses = self._fallback_tokens.copy()
+                self.token_details = {}
                 return
 
             url = f"{self.api_base_url}/tokens"
@@ -97,19 +118,23 @@ class OneInchService:
             if response.status_code == 200:
                 data = response.json()
                 token_map = {}
+                details = {}
 
                 # Convert the response to symbol -> address mapping
                 for token_address, token_info in data.get('tokens', {}).items():
                     symbol = token_info.get('symbol', '').upper()
                     if symbol:  # Only add tokens with valid symbols
                         token_map[symbol] = token_address
+                        details[token_address] = self._token_info(token_address, token_info)
 
                 self.token_addresses = token_map
+                self.token_details = details
 
                 # Save to cache
                 cache_data = {
                     'timestamp': datetime.now().isoformat(),
                     'tokens': token_map,
+                    'details': details,
                     'chain_id': self.chain_id,
                     'total_tokens': len(token_map)
                 }
@@ -123,11 +148,13 @@ class OneInchService:
                 logger.error(f"Failed to fetch tokens from 1inch API: {response.status_code}")
                 # Use fallback tokens
                 self.token_addresses = self._fallback_tokens.copy()
+                self.token_details = {}
 
         except Exception as e:
             logger.error(f"Error fetching token addresses from API: {str(e)}")
             # Use fallback tokens
             self.token_addresses = self._fallback_tokens.copy()
+            self.token_details = {}
 
     def refresh_token_addresses(self):
         """Manually refresh token addresses from API"""
@@ -135,6 +162,49 @@ class OneInchService:
         self._fetch_token_addresses()
         return len(self.token_addresses)
 
+    def _token_view(self, name: str, build: Callable[[], Any]) -> Any:
+        """View derived from token_addresses, rebuilt only when the mapping is replaced"""
+        if self._token_views_source is not self.token_addresses:
+            self._token_views_source = self.token_addresses
+            self._token_views = {}
+        if name not in self._token_views:
+            self._token_views[name] = build()
+        return self._token_views[name]
+
+    def token_addresses_json(self) -> orjson.Fragment:
+        """Pre-serialised token_addresses"""
+        return self._token_view("json", lambda: orjson.Fragment(orjson.dumps(self.token_addresses)))
+
+    def sorted_token_items(self) -> List[Tuple[str, str]]:
+        """(symbol, address) pairs sorted by symbol"""
+        return self._token_view("sorted", lambda: sorted(self.token_addresses.items()))
+
+    def token_search_index(self) -> Tuple[Tuple[str, str, str], ...]:
+        """(lowercased symbol, symbol, address) in registry order"""
+        return self._token_view("search", lambda: tuple(
+            (symbol.lower(), symbol, address) for symbol, address in self.token_addresses.items()
+        ))
+
+    def popular_token_entries(self) -> List[Tuple[int, Dict[str, str]]]:
+        """Listed POPULAR_SYMBOLS with their rank"""
+        return self._token_view("popular", lambda: [
+            (rank, {"symbol": symbol, "address": self.token_addresses[symbol]})
+            for rank, symbol in enumerate(POPULAR_SYMBOLS)
+            if symbol in self.token_addresses
+        ])
+
+    @staticmethod
+    def _token_info(token_address: str, token_info: Dict[str, Any]) -> Dict[str, Any]:
+        """Token details in the shape get_token_info returns"""
+        return {
+            "address": token_address,
+            "symbol": token_info.get('symbol'),
+            "name": token_info.get('name'),
+            "decimals": token_info.get('decimals'),
+            "logoURI": token_info.get('logoURI', ''),
+            "tags": token_info.get('tags', [])
+        }
+
     def get_token_info(self, symbol: str) -> Dict[str, Any]:
         """Get detailed token information"""
         try:
@@ -150,14 +220,7 @@ class OneInchService:
                 # Find token by symbol
                 for token_address, token_info in data.get('tokens', {}).items():
                     if token_info.get('symbol', '').upper() == symbol.upper():
-                        return {
-                            "address": token_address,
-                            "symbol": token_info.get('symbol'),
-                            "name": token_info.get('name'),
-                            "decimals": token_info.get('decimals'),
-                            "logoURI": token_info.get('logoURI', ''),
-                            "tags": token_info.get('tags', [])
-                        }
+                        return self._token_info(token_address, token_info)
 
                 return {"error": f"Token {symbol} not found"}
             else:
@@ -173,11 +236,11 @@ class OneInchService:
             results = []
             query_lower = query.lower()
 
-            for symbol, address in self.token_addresses.items():
-                if query_lower in symbol.lower():
-                    # Get additional info if available
-                    token_info = self.get_token_info(symbol)
-                    if "error" not in token_info:
+            for symbol_lower, symbol, address in self.token_search_index():
+                if query_lower in symbol_lower:
+                    # Details come from the token list already loaded, not a fetch per match
+                    token_info = self.token_details.get(address)
+                    if token_info:
                         results.append(token_info)
                     else:
                         results.append({
@@ -198,21 +261,9 @@ class OneInchService:
 
     def get_popular_tokens(self, limit: int = 20) -> List[Dict[str, str]]:
         """Get list of popular tokens"""
-        # Define popular tokens on BSC
-        popular_symbols = [
-            'BNB', 'USDT', 'USDC', 'BUSD', 'ETH', 'BTC', 'CAKE', 'ADA', 'DOT', 'LINK',
-            'XRP', 'LTC', 'BCH', 'EOS', 'TRX', 'XLM', 'ATOM', 'VET', 'FIL', 'THETA'
-        ]
-
-        popular_tokens = []
-        for symbol in popular_symbols[:limit]:
-            if symbol in self.token_addresses:
-                popular_tokens.append({
-                    "symbol": symbol,
-                    "address": self.token_addresses[symbol]
-                })
-
-        return popular_tokens
+        # Same as checking POPULAR_SYMBOLS[:limit] against the registry, from the cached entries
+        cutoff = len(POPULAR_SYMBOLS[:limit])
+        return [token for rank, token in self.popular_token_entries() if rank < cutoff]
 
     def get_cache_info(self) -> Dict[str, Any]:
         """Get information about the token cache"""
@@ -258,6 +309,26 @@ class OneInchService:
 
         return True
 
+    def http_client(self) -> httpx.AsyncClient:
+        """Get the shared HTTP/2 client, so API calls reuse pooled connections instead of reconnecting"""
+        if self._http is None or self._http.is_closed:
+            self._http = httpx.AsyncClient(
+                http2=True,
+                headers=self.headers,
+                limits=httpx.Limits(
+                    max_connections=MAX_CONNECTIONS,
+                    max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+                ),
+                timeout=HTTP_TIMEOUT
+            )
+        return self._http
+
+    async def close(self):
+        """Close the shared HTTP client"""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
     def api_request_url(self, method_name: str, query_params: Dict[str, Any]) -> str:
         """Construct full API request URL"""
         params_str = '&'.join([f'{key}={value}' for key, value in query_params.items()])
@@ -276,7 +347,7 @@ class OneInchService:
                 "walletAddress": wallet_address
             })
 
-            response = requests.get(url, headers=self.headers)
+            response = await self.http_client().get(url)
             response.raise_for_status()
 
             data = response.json()
@@ -298,7 +369,7 @@ class OneInchService:
 
             url = self.api_request_url("/approve/transaction", params)
 
-            response = requests.get(url, headers=self.headers)
+            response = await self.http_client().get(url)
             response.raise_for_status()
 
             transaction = response.json()
@@ -324,7 +395,7 @@ class OneInchService:
         try:
             url = self.api_request_url("/swap", swap_params)
 
-            response = requests.get(url, headers=self.headers)
+            response = await self.http_client().get(url)
             response.raise_for_status()
 
             data = response.json()
@@ -345,10 +416,9 @@ class OneInchService:
         try:
             payload = {"rawTransaction": raw_transaction}
 
-            response = requests.post(
+            response = await self.http_client().post(
                 self.broadcast_api_url,
-                json=payload,
-                headers=self.headers
+                json=payload
             )
             response.raise_for_status()
 
@@ -484,7 +554,7 @@ class OneInchService:
                 "amount": amount
             })
 
-            response = requests.get(url, headers=self.headers)
+            response = await self.http_client().get(url)
             response.raise_for_status()
 
             quote_data = response.json()
@@ -103,22 +103,26 @@ class PortfolioService:
 
             # Get trades within date range
             trades = await trade_crud.get_multi(db)
-            recent_trades = [
-                t for t in trades
-                if t.entry_time >= start_date
-            ]
 
-            # Calculate performance metrics
-            total_trades = len(recent_trades)
-            winning_trades = len([t for t in recent_trades if t.pnl and t.pnl > 0])
-            losing_trades = len([t for t in recent_trades if t.pnl and t.pnl < 0])
+            # Calculate performance and profit metrics in a single pass
+            total_trades = winning_trades = losing_trades = 0
+            total_profit = total_loss = 0
+            for t in trades:
+                if t.entry_time < start_date:
+                    continue
+                total_trades += 1
+                pnl = t.pnl
+                if not pnl:
+                    continue
+                if pnl > 0:
+                    winning_trades += 1
+                    total_profit += pnl
+                else:
+                    losing_trades += 1
+                    total_loss += pnl
 
             win_rate = (winning_trades / total_trades * 100) if total_trades > 0 else 0
 
-            # Calculate profit metrics
-            total_profit = sum(t.pnl for t in recent_trades if t.pnl and t.pnl > 0)
-            total_loss = sum(t.pnl for t in recent_trades if t.pnl and t.pnl < 0)
-
             profit_factor = abs(total_profit / total_loss) if total_loss != 0 else float('inf')
 
             return {
@@ -8,7 +8,7 @@ from app.crud.crud_swap_transaction import swap_transaction_crud
 from app.crud.curd_position import position_crud
 
 class ProfitService:
-    def __init__(self, db: AsyncSession = None):
+    def __init__(self, db: AsyncSession):
         self.db = db
 
     async def get_position_profit(
@@ -270,6 +270,3 @@ class ProfitService:
         except Exception as e:
             logger.error(f"Error calculating profit summary: {str(e)}")
             return {"error": f"Failed to calculate profit summary: {str(e)}"}
-
-# Create singleton instance
-profit_service = ProfitService()
@@ -1,10 +1,11 @@
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple, Union
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 import pandas as pd
 import numpy as np
 import math
 from app.core.logger import logger
+from app.core.kernels import NUMBA_AVAILABLE, entry_levels_kernel, log_return_std_nb
 from app.core.config import settings
 from app.models.trade import Trade
 from app.schemas.trade import TradeCreate
@@ -13,11 +14,11 @@ from app.crud.curd_position import position_crud
 from app.schemas.position import PositionCreate, PositionUpdate, Position
 from app.crud.crud_portfolio import portfolio_crud as portfolio_crud
 from app.crud.crud_user_portfolio_summary import user_portfolio_summary_crud
-from app.crud.curd_crypto import insert_crypto_data_live
+from app.crud.curd_crypto import insert_crypto_data_live_many
 #services
 from app.services.helper.heplers import helpers
 from app.services.helper.binance_helper import binance_helper
-from app.services.helper.market_analyzer import MarketAnalyzer, BreakoutSignal
+from app.services.helper.market_analyzer import MarketAnalyzer, BreakoutDirection
 from app.services.notifications import notification_service
 from app.services.market_analyzer import market_analyzer
 from app.services.swap_service import swap_service
@@ -35,9 +36,24 @@ class StraddleStrategy:
         """Calculate volatility as the standard deviation of log returns."""
         if len(prices) < 2:
             return 0.0
-        log_returns = np.diff(np.log(prices))
+        prices = np.asarray(prices, dtype=np.float64)
+        log_returns = np.log1p(np.diff(prices) / prices[:-1])
         return float(np.std(log_returns))
 
+    def calculate_volatilities(self, prices: np.ndarray, windows: Tuple[Optional[int], ...]) -> List[float]:
+        """Volatility over the last `window` prices for each window (None for all), from one log-return pass."""
+        prices = np.asarray(prices, dtype=np.float64)
+        if NUMBA_AVAILABLE:
+            window_sizes = np.array([0 if window is None else window for window in windows], dtype=np.int64)
+            return log_return_std_nb(prices, window_sizes).tolist()
+
+        log_returns = np.log1p(np.diff(prices) / prices[:-1])
+        volatilities = []
+        for window in windows:
+            returns = log_returns if window is None else log_returns[max(log_returns.size - (window - 1), 0):]
+            volatilities.append(float(returns.std()) if returns.size else 0.0)
+        return volatilities
+
     def calculate_entry_levels_dynamic(
         self,
         current_price: float,
@@ -69,54 +85,11 @@ class StraddleStrategy:
             if current_price <= 0:
                 raise ValueError("Current price must be positive")
 
-            # Normalize volatilities to prevent extreme values
-            volatilities = [short_vol, medium_vol, long_vol]
-            avg_vol = sum(volatilities) / len(volatilities) if volatilities else 0.01
-
-            # Use the most conservative (lowest) volatility as base to prevent over-leveraging
-            base_vol = min(volatilities) if all(v > 0 for v in volatilities) else avg_vol
-
-            # Adaptive scaling factor based on overall market volatility
-            if avg_vol > 0.05:  # High volatility market (>5%)
-                scale_factor = 0.8  # Be more conservative
-                min_pct = 0.002  # 0.2%
-                max_pct = 0.015  # 1.5%
-            elif avg_vol > 0.02:  # Medium volatility market (2-5%)
-                scale_factor = 1.0  # Normal scaling
-                min_pct = 0.003  # 0.3%
-                max_pct = 0.02   # 2%
-            else:  # Low volatility market (<2%)
-                scale_factor = 1.2  # Be more aggressive
-                min_pct = 0.005  # 0.5%
-                max_pct = 0.03   # 3%
-
-            # Calculate base percentage with adaptive scaling
-            base_pct = base_vol * scale_factor
-
-            # Ensure minimum viable percentage
-            if base_pct < min_pct:
-                base_pct = min_pct
-
-            # Calculate multipliers to enforce 1:2:3 ratio between timeframes
-            short_pct = base_pct
-            medium_pct = base_pct * 2
-            long_pct = base_pct * 3
-
-            # Intelligent clamping with progressive limits
-            short_pct = max(min(short_pct, max_pct), min_pct)
-            medium_pct = max(min(medium_pct, max_pct * 1.5), min_pct * 1.5)
-            long_pct = max(min(long_pct, max_pct * 2), min_pct * 2)
-
-            # Calculate buy/sell percentages with 1:3 ratio for each timeframe
-            # Buy side (more conservative)
-            short_buy_pct = short_pct
-            medium_buy_pct = medium_pct
-            long_buy_pct = long_pct
-
-            # Sell side (more aggressive, 3x the buy percentage)
-            short_sell_pct = max(min(short_pct * 3, max_pct * 1.2), min_pct)
-            medium_sell_pct = max(min(medium_pct * 3, max_pct * 1.8), min_pct * 1.5)
-            long_sell_pct = max(min(long_pct * 3, max_pct * 2.4), min_pct * 2)
+            # Adaptive scaling, 1:2:3 timeframe ratio, 1:3 buy/sell ratio and clamping (compiled kernel)
+            (avg_vol, base_vol, scale_factor, min_pct, max_pct,
+             short_buy_pct, short_sell_pct,
+             medium_buy_pct, medium_sell_pct,
+             long_buy_pct, long_sell_pct) = entry_levels_kernel(float(short_vol), float(medium_vol), float(long_vol))
 
             # Calculate actual entry prices
             entries = {
@@ -250,25 +223,43 @@ class StraddleStrategy:
             near_support and
             not_near_resistance
         )
+
+
+# Shared by every StraddleService that isn't given its own strategy
+default_strategy = StraddleStrategy()
+
+
+def _as_float_series(values: Union[pd.Series, np.ndarray, Sequence[float]]) -> pd.Series:
+    """float64 Series over values, reusing a float64 Series or array without copying"""
+    if isinstance(values, pd.Series) and values.dtype == np.float64:
+        return values
+    return pd.Series(np.asarray(values, dtype=np.float64), copy=False)
+
+
 class StraddleService:
     # Make straddle_status a class variable so it's shared across all instances
     straddle_status = True
     # Add processing lock flags
     _processing_locks = {}
+    # Built per request, so keep instances to the two bound references
+    __slots__ = ("db", "strategy")
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, strategy: Optional[StraddleStrategy] = None):
         self.db = db
-        self.strategy = StraddleStrategy()
+        # The strategy only holds config-derived thresholds, so instances share one
+        self.strategy = strategy or default_strategy
 
     async def analyze_market_conditions(self,
                                       symbol: str,
-                                      prices: pd.Series,
-                                      volume: pd.Series) -> Dict:
+                                      prices: Union[pd.Series, np.ndarray, Sequence[float]],
+                                      volume: Union[pd.Series, np.ndarray, Sequence[float]]) -> Dict:
         """
         Analyze market conditions for potential straddle setup
         Returns detailed analysis including market conditions and any breakout signals
+
+        prices and volume may be Series, arrays or plain lists; each is converted once.
         """
-        analysis = await MarketAnalyzer.analyze_breakout(symbol, prices, volume)
+        analysis = await MarketAnalyzer.analyze_breakout(symbol, _as_float_series(prices), _as_float_series(volume))
 
         if analysis.get("validation_error"):
             logger.warning(f"Validation error in market analysis: {analysis['message']}")
@@ -404,7 +395,7 @@ class StraddleService:
 
     async def handle_breakout(self,
                             symbol: str,
-                            breakout_signal: BreakoutSignal) -> Optional[Trade]:
+                            breakout_signal: BreakoutDirection) -> Optional[Trade]:
         """Handle breakout event and manage straddle positions"""
         try:
             # Get pending straddle trades
@@ -712,6 +703,9 @@ class StraddleService:
                     # For intraday analytics, track additional metrics
                     intraday_metrics = {}
 
+                    # Symbols whose live prices are inserted together after the loop
+                    live_symbols = []
+
                     # Process each asset in portfolio
                     for item in portfolio_items:
                         try:
@@ -819,14 +813,20 @@ class StraddleService:
                             }
 
                             if not item.asset_type == "STABLE" and update_crypto:
-                                #Insert Data in Dynamic Table
-                                result = await insert_crypto_data_live(self.db, item.symbol)
-                                logger.info(f"Insert Crypto data for symbol {item.symbol}")
+                                live_symbols.append(item.symbol)
 
                         except Exception as asset_error:
                             logger.error(f"Error processing asset {item.symbol}: {str(asset_error)}")
                             continue
 
+                    if live_symbols:
+                        #Insert Data in Dynamic Tables, one transaction for all assets
+                        live_results = await insert_crypto_data_live_many(self.db, live_symbols)
+                        for live_symbol, live_result in live_results.items():
+                            if isinstance(live_result, Exception):
+                                logger.error(f"Error inserting crypto data for symbol {live_symbol}: {str(live_result)}")
+                        logger.info(f"Insert Crypto data for symbols {', '.join(live_symbols)}")
+
                     # Calculate total profit/loss
                     total_profit_loss = total_value - total_cost_basis
 
@@ -1254,8 +1254,10 @@ class StraddleService:
 
             # Calculate intraday price changes using log returns instead of simple returns
             # Log returns are more accurate for compounding and large price movements
-            price_changes = np.diff(np.log(recent_prices)) if len(recent_prices) > 1 else []
-            short_term_changes = np.diff(np.log(short_term_prices)) if len(short_term_prices) > 1 else []
+            long_close = long_term_data['close'].to_numpy(dtype=np.float64)
+            short_close = short_term_data['close'].to_numpy(dtype=np.float64)
+            price_changes = np.log1p(np.diff(long_close) / long_close[:-1]) if len(long_close) > 1 else []
+            short_term_changes = np.log1p(np.diff(short_close) / short_close[:-1]) if len(short_close) > 1 else []
 
             # Enhanced market analysis for intraday trading
             # Identify key support and resistance levels
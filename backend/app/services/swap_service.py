@@ -1,4 +1,5 @@
 from typing import Dict, List, Optional, Tuple, Any
+from contextvars import ContextVar
 from sqlalchemy.ext.asyncio import AsyncSession
 from datetime import datetime, timedelta
 from app.core.logger import logger
@@ -16,12 +17,37 @@ from app.crud.curd_crypto import insert_crypto_data_live
 
 
 from app.services.oneinch_service import oneinch_service
-import requests
+from app.core.cache import cached
+
+TOKEN_LIST_TTL = 3600  # seconds; the 1inch token list rarely changes
+
+@cached(ttl=TOKEN_LIST_TTL, key="1inch:tokens:{chain_id}")
+async def _get_chain_tokens(chain_id: int) -> Dict[str, Any]:
+    """Get the 1inch token list for a chain (address -> token info)"""
+    url = f"https://api.1inch.dev/swap/v6.0/{chain_id}/tokens"
+
+    response = await oneinch_service.http_client().get(url)
+    response.raise_for_status()
+
+    return response.json().get('tokens', {})
+
+# Session of the request/task using the shared swap_service; a ContextVar so that
+# concurrent requests assigning swap_service.db don't swap sessions under each other
+_db_session: ContextVar[Optional[AsyncSession]] = ContextVar("swap_service_db", default=None)
 
 class SwapService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
+    @property
+    def db(self) -> Optional[AsyncSession]:
+        """Session bound by the current request/task"""
+        return _db_session.get()
+
+    @db.setter
+    def db(self, session: Optional[AsyncSession]) -> None:
+        _db_session.set(session)
+
     async def swap_symbol_stable_coin(self, symbol: str, quantity: float, current_price: float, target_stablecoin: str = "USDT", position_id: int = None) -> Dict[str, Any]:
         """
         Swap a cryptocurrency for the best available stablecoin
@@ -80,8 +106,8 @@ class SwapService:
                     avg_buy_price = existing_crypto.avg_buy_price or 0.0
                     realized_profit = (current_price - avg_buy_price) * quantity - fee_amount
 
-                    # Get current cumulative realized profit (handle case where field might not exist)
-                    current_realized_profit = getattr(existing_crypto, 'realized_profit', 0.0) or 0.0
+                    # Get current cumulative realized profit
+                    current_realized_profit = existing_crypto.realized_profit
 
                     # Log the P/L calculation details
                     logger.info(f"P/L Calculation for {symbol}: "
@@ -122,7 +148,7 @@ class SwapService:
 
             if existing_stable:
                 # Update existing stablecoin entry
-                current_stable_profit = getattr(existing_stable, 'realized_profit', 0.0) or 0.0
+                current_stable_profit = existing_stable.realized_profit
                 update_data = {
                     "quantity": existing_stable.quantity + stable_amount,
                     "realized_profit": current_stable_profit,  # Keep existing realized profit for stablecoin
@@ -277,7 +303,7 @@ class SwapService:
                 # Update existing entry - reduce stablecoin quantity
                 if existing_stable.quantity >= amount:
                     # Get current cumulative realized profit for stablecoin (handle case where field might not exist)
-                    current_stable_profit = getattr(existing_stable, 'realized_profit', 0.0) or 0.0
+                    current_stable_profit = existing_stable.realized_profit
 
                     update_data = {
                         "quantity": existing_stable.quantity - amount,
@@ -315,8 +341,8 @@ class SwapService:
                 total_quantity = existing_crypto.quantity + crypto_amount
                 new_avg_price = (total_value_before + new_value) / total_quantity
 
-                # Get current cumulative realized profit (handle case where field might not exist)
-                current_realized_profit = getattr(existing_crypto, 'realized_profit', 0.0) or 0.0
+                # Get current cumulative realized profit
+                current_realized_profit = existing_crypto.realized_profit
 
                 # Update existing cryptocurrency entry
                 update_data = {
@@ -440,13 +466,7 @@ class SwapService:
                 return {"status": "disabled", "message": "Swaps are disabled"}
 
             # Use the 1inch tokens endpoint
-            url = f"https://api.1inch.dev/swap/v6.0/{oneinch_service.chain_id}/tokens"
-
-            response = requests.get(url, headers=oneinch_service.headers)
-            response.raise_for_status()
-
-            tokens_data = response.json()
-            tokens = tokens_data.get('tokens', {})
+            tokens = await _get_chain_tokens(oneinch_service.chain_id)
 
             logger.info(f"Found {len(tokens)} tokens on chain {oneinch_service.chain_id}")
 
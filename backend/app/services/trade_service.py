@@ -1,9 +1,11 @@
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, tuple_
 from app.crud.crud_trade import trade as trade_crud
 from app.crud.curd_position import position_crud as position_crud
+from app.models.trade import Trade
+from app.models.position import Position
 from app.schemas import trade as trade_schemas
 from app.schemas import position as position_schemas
 from app.core.logger import logger
@@ -43,24 +45,24 @@ class TradeService:
     ) -> trade_schemas.Trade:
         """Close a trade and update position"""
         try:
-            trade = await trade_crud.get(db=db, id=trade_id)
+            # Load the position and its trades up front: close_trade() recalculates the
+            # position metrics from them, and lazy loads aren't possible on an AsyncSession
+            trade = await trade_crud.get(
+                db=db,
+                id=trade_id,
+                options=[selectinload(Trade.position).selectinload(Position.trades)]
+            )
             if not trade:
                 raise ValueError("Trade not found")
             if trade.status == "CLOSED":
                 raise ValueError("Trade already closed")
 
+            # Closes the trade and updates the position metrics
             trade.close_trade(exit_price)
             db.add(trade)
             await db.commit()
             await db.refresh(trade)
 
-            # Update position metrics
-            if trade.position:
-                trade.position.update_position_metrics()
-                db.add(trade.position)
-                await db.commit()
-                await db.refresh(trade.position)
-
             return trade
         except Exception as e:
             logger.error(f"Error closing trade: {str(e)}")
@@ -72,18 +74,27 @@ class TradeService:
         skip: int = 0,
         limit: int = 100,
         symbol: Optional[str] = None,
-        status: Optional[str] = None
+        status: Optional[str] = None,
+        before_id: Optional[int] = None
     ) -> List[trade_schemas.Trade]:
-        """Get trades with filters"""
+        """Get trades with filters, newest first (pass the last seen id as before_id to page)"""
         try:
-            stmt = select(trade_crud.model)
+            model = trade_crud.model
+            stmt = select(model)
 
             if symbol:
-                stmt = stmt.filter(trade_crud.model.symbol == symbol)
+                stmt = stmt.filter(model.symbol == symbol)
             if status:
-                stmt = stmt.filter(trade_crud.model.status == status)
+                stmt = stmt.filter(model.status == status)
+
+            if before_id is not None:
+                # Keyset pagination: continue after the last trade of the previous page
+                cursor = select(model.created_at).where(model.id == before_id).scalar_subquery()
+                stmt = stmt.filter(tuple_(model.created_at, model.id) < tuple_(cursor, before_id))
+            elif skip:
+                stmt = stmt.offset(skip)
 
-            stmt = stmt.offset(skip).limit(limit)
+            stmt = stmt.order_by(model.created_at.desc(), model.id.desc()).limit(limit)
             result = await db.execute(stmt)
             return result.scalars().all()
         except Exception as e:
@@ -0,0 +1,118 @@
+import asyncio
+import numpy as np
+import pandas as pd
+import pytest
+from analysis import market_analyzer
+from analysis.market_analyzer import Indicators, MarketAnalyzer, OHLCV_COLUMNS
+
+@pytest.fixture
+def analyzer(tmp_path):
+    analyzer = MarketAnalyzer(crypto_service=None)
+    analyzer._cache_dir = tmp_path
+    return analyzer
+
+def _candles(n: int = 50) -> dict:
+    rng = np.random.default_rng(0)
+    return {name: rng.random(n) for name in OHLCV_COLUMNS}
+
+class TestOhlcvDiskCache:
+    def test_round_trip_leaves_no_temp_file(self, analyzer, tmp_path):
+        data = _candles()
+        analyzer._save_ohlcv_cache("BTC/USDT", "5m", data)
+
+        loaded = analyzer._load_ohlcv_cache("BTC/USDT", "5m")
+
+        for name in OHLCV_COLUMNS:
+            np.testing.assert_array_equal(loaded[name], data[name])
+        assert [p.name for p in tmp_path.iterdir()] == ["BTCUSDT_5m.parquet"]
+
+    def test_corrupt_file_is_ignored_and_replaced(self, analyzer):
+        path = analyzer._ohlcv_cache_path("BTC/USDT", "5m")
+        path.write_bytes(b"PAR1 truncated")
+
+        assert analyzer._load_ohlcv_cache("BTC/USDT", "5m") is None
+
+        analyzer._save_ohlcv_cache("BTC/USDT", "5m", _candles())
+        assert analyzer._load_ohlcv_cache("BTC/USDT", "5m") is not None
+
+    @pytest.mark.asyncio
+    async def test_historical_data_reads_disk_cache_off_loop(self, analyzer, monkeypatch):
+        data = _candles()
+        analyzer._save_ohlcv_cache("BTC/USDT", "5m", data)
+        seen = {}
+
+        async def fake_fetch(symbol, timeframe, stored=None):
+            seen["stored"] = stored
+            return data
+
+        monkeypatch.setattr(analyzer, "_fetch_ohlcv", fake_fetch)
+        result = await analyzer._get_historical_data("BTC/USDT", "5m")
+
+        np.testing.assert_array_equal(seen["stored"]["close"], data["close"])
+        assert result is data
+
+class TestCacheLocks:
+    @pytest.mark.asyncio
+    async def test_concurrent_misses_fetch_once_and_lock_is_released(self, analyzer, monkeypatch):
+        data = _candles()
+        fetches = []
+
+        async def fake_fetch(symbol, timeframe, stored=None):
+            fetches.append(symbol)
+            await asyncio.sleep(0)
+            return data
+
+        monkeypatch.setattr(analyzer, "_fetch_ohlcv", fake_fetch)
+        results = await asyncio.gather(*(analyzer._get_historical_data("BTC/USDT", "5m") for _ in range(5)))
+
+        assert fetches == ["BTC/USDT"]
+        assert all(result is data for result in results)
+        assert len(analyzer._cache_locks) == 0
+
+class TestIndicators:
+    @pytest.mark.parametrize("seed", range(5))
+    def test_latest_values_match_pandas_rolling(self, seed):
+        rng = np.random.default_rng(seed)
+        close = 100 + np.cumsum(rng.normal(size=200))
+        series = pd.Series(close)
+
+        indicators = MarketAnalyzer._calculate_indicators({"close": close})
+
+        std20 = series.rolling(20).std().iloc[-1]
+        np.testing.assert_allclose(indicators.sma20, series.rolling(20).mean().iloc[-1], rtol=1e-12)
+        np.testing.assert_allclose(indicators.sma50, series.rolling(50).mean().iloc[-1], rtol=1e-12)
+        np.testing.assert_allclose(indicators.bb_middle, series.rolling(20).mean().iloc[-1], rtol=1e-12)
+        np.testing.assert_allclose(indicators.bb_upper, series.rolling(20).mean().iloc[-1] + 2 * std20, rtol=1e-12)
+        np.testing.assert_allclose(indicators.bb_lower, series.rolling(20).mean().iloc[-1] - 2 * std20, rtol=1e-12)
+
+    def test_short_series_is_nan(self):
+        indicators = MarketAnalyzer._calculate_indicators({"close": np.arange(10, dtype=np.float64)})
+
+        assert np.isnan(indicators.sma20) and np.isnan(indicators.sma50)
+        assert np.isnan(indicators.bb_upper)
+
+    @pytest.mark.parametrize("seed", range(5))
+    def test_rsi_kernel_matches_pandas_fallback(self, seed, monkeypatch):
+        rng = np.random.default_rng(seed)
+        close = 100 + np.cumsum(rng.normal(size=300))
+
+        kernel = MarketAnalyzer._calculate_rsi(close)
+        monkeypatch.setattr(market_analyzer, "NUMBA_AVAILABLE", False)
+        fallback = MarketAnalyzer._calculate_rsi(close)
+
+        np.testing.assert_allclose(kernel, fallback, rtol=1e-9)
+
+class TestGenerateSignals:
+    @staticmethod
+    def _indicators(rsi: float) -> Indicators:
+        return Indicators(sma20=101.0, sma50=100.0, rsi=rsi, bb_middle=100.0, bb_upper=102.0, bb_lower=98.0)
+
+    @pytest.mark.parametrize("rsi, expected", [
+        (10.0, "oversold"),
+        (30.0, "neutral"),
+        (70.0, "neutral"),
+        (85.0, "overbought"),
+        (float("nan"), "neutral"),
+    ])
+    def test_rsi_signal(self, rsi, expected):
+        assert MarketAnalyzer._generate_signals(self._indicators(rsi)).rsi_signal == expected
@@ -0,0 +1,19 @@
+import pytest
+from fastapi import APIRouter, FastAPI
+from fastapi.testclient import TestClient
+from app.core.database import get_db
+
+@pytest.fixture
+def make_client():
+    """Build a TestClient for a single router, with get_db yielding no session"""
+    def make(router: APIRouter, prefix: str) -> TestClient:
+        app = FastAPI()
+        app.include_router(router, prefix=prefix)
+
+        async def no_db():
+            yield None
+
+        app.dependency_overrides[get_db] = no_db
+        return TestClient(app)
+
+    return make
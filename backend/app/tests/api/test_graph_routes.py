@@ -0,0 +1,91 @@
+import pytest
+from datetime import datetime, timedelta
+
+pytest.importorskip("plotly")
+
+from app.api.v1.endpoints import graph_routes
+from app.core import cache
+
+LAST_TIMESTAMP = datetime(2024, 5, 1, 12, 0, 0)
+
+@pytest.fixture
+def chart_state(monkeypatch):
+    """Mutable fingerprint/window the patched graph service reads from"""
+    state = {
+        "fingerprint": (LAST_TIMESTAMP, "swaps-v1"),
+        "now": datetime(2024, 5, 1, 12, 0, 10),
+        "renders": 0,
+        "start_times": [],
+    }
+
+    async def fake_fingerprint(db, symbol, month=None, year=None, start_time=None):
+        state["start_times"].append(start_time)
+        return state["fingerprint"]
+
+    async def fake_chart_data(db, symbol, month=None, year=None, start_time=None, **kwargs):
+        state["renders"] += 1
+        return {"price_points": [], "swap_events": []}
+
+    def fake_time_range(duration):
+        return state["now"] - timedelta(days=30), state["now"]
+
+    monkeypatch.setattr(graph_routes, "get_chart_fingerprint", fake_fingerprint)
+    monkeypatch.setattr(graph_routes, "get_price_and_swaps_for_chart", fake_chart_data)
+    monkeypatch.setattr(graph_routes, "generate_price_swap_plot", lambda result: "<div>chart</div>")
+    monkeypatch.setattr(graph_routes, "get_time_range_for_duration", fake_time_range)
+    monkeypatch.setattr(cache, "get_redis", lambda: None)
+    return state
+
+@pytest.fixture
+def client(chart_state, make_client):
+    return make_client(graph_routes.router, "/graph")
+
+class TestChartETag:
+    def test_repeat_request_gets_304(self, client, chart_state):
+        first = client.get("/graph/chart", params={"symbol": "BTC/USDT"})
+        assert first.status_code == 200
+        assert first.text == "<div>chart</div>"
+        etag = first.headers["etag"]
+
+        second = client.get("/graph/chart", params={"symbol": "BTC/USDT"}, headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.content == b""
+        assert second.headers["etag"] == etag
+        assert chart_state["renders"] == 1
+
+    def test_swap_update_changes_etag(self, client, chart_state):
+        etag = client.get("/graph/chart", params={"symbol": "BTC/USDT"}).headers["etag"]
+
+        chart_state["fingerprint"] = (LAST_TIMESTAMP, "swaps-v2")
+        response = client.get("/graph/chart", params={"symbol": "BTC/USDT"}, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_relative_window_moves_etag(self, client, chart_state):
+        etag = client.get("/graph/chart", params={"symbol": "BTC/USDT", "duration": "1m"}).headers["etag"]
+
+        # Same bucket: same window start, still a 304
+        chart_state["now"] += timedelta(seconds=20)
+        same = client.get("/graph/chart", params={"symbol": "BTC/USDT", "duration": "1m"}, headers={"If-None-Match": etag})
+        assert same.status_code == 304
+
+        # Next bucket: rows may have left the window, so the chart is re-rendered
+        chart_state["now"] += timedelta(seconds=graph_routes.CHART_WINDOW_BUCKET)
+        moved = client.get("/graph/chart", params={"symbol": "BTC/USDT", "duration": "1m"}, headers={"If-None-Match": etag})
+        assert moved.status_code == 200
+        assert moved.headers["etag"] != etag
+
+    def test_window_start_is_bucketed(self, client, chart_state):
+        client.get("/graph/chart", params={"symbol": "BTC/USDT", "duration": "1m"})
+
+        start_time = chart_state["start_times"][-1]
+        assert start_time.timestamp() % graph_routes.CHART_WINDOW_BUCKET == 0
+        assert start_time <= chart_state["now"] - timedelta(days=30)
+
+    def test_unreadable_fingerprint_renders_without_etag(self, client, chart_state):
+        chart_state["fingerprint"] = None
+        response = client.get("/graph/chart", params={"symbol": "BTC/USDT"})
+
+        assert response.status_code == 200
+        assert "etag" not in response.headers
@@ -0,0 +1,192 @@
+import pytest
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from app.api.v1.endpoints import portfolio_summary_routes
+from app.crud import crud_user_portfolio_summary
+from app.crud.crud_user_portfolio_summary import latest_summary_key, user_portfolio_summary_crud
+from app.models import telegram  # noqa: F401  registers TelegramUser for the summary mapper
+from app.schemas.portfolio_summary import PortfolioHistoryRow
+
+def _summary(i: int) -> SimpleNamespace:
+    return SimpleNamespace(
+        id=i,
+        timestamp=datetime(2024, 5, 1) + timedelta(days=i),
+        total_value=1000.0 + i,
+        total_cost_basis=900.0,
+        total_profit_loss=100.0 + i,
+        total_profit_loss_percentage=11.1,
+        crypto_value=600.0,
+        stable_value=400.0 + i,
+        daily_change=0.5 if i % 2 else None,
+        weekly_change=None,
+        monthly_change=None,
+        assets={"BTC": {"quantity": 0.01}},
+        trades_today=i,
+        swaps_today=0,
+        market_trend="bullish",
+        market_volatility=0.02,
+        is_hedged=False,
+        risk_level=3,
+    )
+
+class FakeSession:
+    def __init__(self):
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+
+@pytest.fixture
+def state(monkeypatch):
+    """Rows the patched CRUD returns, sessions it was handed and an in-memory stand-in for Redis"""
+    state = {
+        "rows": [_summary(i) for i in range(3)],
+        "sessions": [],
+        "latest": _summary(7),
+        "cache": {},
+        "queries": 0,
+        "assets": (7, datetime(2024, 5, 8), '{"BTC": 1}'),
+    }
+
+    def fake_session():
+        session = FakeSession()
+        state["sessions"].append(session)
+        return session
+
+    async def fake_stream(db, *, user_id=None, days=7, interval="daily"):
+        for row in state["rows"]:
+            yield row
+
+    async def fake_latest(db, user_id=None):
+        state["queries"] += 1
+        return state["latest"]
+
+    async def fake_latest_assets(db, user_id=None):
+        return state["assets"]
+
+    async def fake_cache_get(key):
+        return state["cache"].get(key)
+
+    async def fake_cache_set(key, value, ttl, jitter=0.0):
+        state["cache"][key] = value
+
+    async def fake_cache_delete(*keys):
+        for key in keys:
+            state["cache"].pop(key, None)
+
+    monkeypatch.setattr(portfolio_summary_routes, "SessionLocal", fake_session)
+    monkeypatch.setattr(user_portfolio_summary_crud, "stream_historical_summaries", fake_stream)
+    monkeypatch.setattr(user_portfolio_summary_crud, "get_latest_summary", fake_latest)
+    monkeypatch.setattr(user_portfolio_summary_crud, "get_latest_assets_json", fake_latest_assets)
+    monkeypatch.setattr(portfolio_summary_routes, "cache_get", fake_cache_get)
+    monkeypatch.setattr(portfolio_summary_routes, "cache_set", fake_cache_set)
+    monkeypatch.setattr(crud_user_portfolio_summary, "cache_delete", fake_cache_delete)
+    return state
+
+@pytest.fixture
+def client(state, make_client):
+    return make_client(portfolio_summary_routes.router, "/portfolio-summary")
+
+class FakeWriteSession:
+    """Session for create_summary with no earlier summaries to compare against"""
+
+    async def execute(self, stmt):
+        return SimpleNamespace(scalars=lambda: SimpleNamespace(first=lambda: None))
+
+    def add(self, obj):
+        pass
+
+    async def commit(self):
+        pass
+
+    async def refresh(self, obj):
+        pass
+
+class TestLatestCache:
+    def test_repeat_request_is_served_from_cache(self, client, state):
+        first = client.get("/portfolio-summary/latest", params={"user_id": 1})
+        second = client.get("/portfolio-summary/latest", params={"user_id": 1})
+
+        assert first.json()["id"] == second.json()["id"] == 7
+        assert state["queries"] == 1
+        assert list(state["cache"]) == [latest_summary_key(1)]
+
+    @pytest.mark.asyncio
+    async def test_create_summary_invalidates_the_cached_response(self, client, state):
+        client.get("/portfolio-summary/latest", params={"user_id": 1})
+        client.get("/portfolio-summary/latest")
+
+        await user_portfolio_summary_crud.create_summary(
+            FakeWriteSession(), user_id=1, total_value=1.0, total_cost_basis=1.0, total_profit_loss=0.0, assets={}
+        )
+
+        assert state["cache"] == {}
+
+class TestLatestETag:
+    def test_etag_and_304(self, client, state):
+        first = client.get("/portfolio-summary/latest")
+        etag = first.headers["etag"]
+
+        assert first.status_code == 200
+        assert first.headers["cache-control"] == f"private, max-age={portfolio_summary_routes.SUMMARY_MAX_AGE}"
+
+        second = client.get("/portfolio-summary/latest", headers={"If-None-Match": etag})
+        assert second.status_code == 304
+        assert second.headers["etag"] == etag
+        assert state["queries"] == 1
+
+    def test_changed_summary_gets_new_etag(self, client, state):
+        etag = client.get("/portfolio-summary/latest").headers["etag"]
+
+        state["cache"].clear()
+        state["latest"] = _summary(8)
+        response = client.get("/portfolio-summary/latest", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+class TestAssetsETag:
+    def test_stored_json_is_passed_through(self, client):
+        response = client.get("/portfolio-summary/assets")
+
+        assert response.status_code == 200
+        assert response.json() == {"assets": {"BTC": 1}}
+
+    def test_etag_and_304(self, client, state):
+        etag = client.get("/portfolio-summary/assets").headers["etag"]
+
+        assert client.get("/portfolio-summary/assets", headers={"If-None-Match": etag}).status_code == 304
+
+        state["assets"] = (8, datetime(2024, 5, 9), '{"ETH": 2}')
+        response = client.get("/portfolio-summary/assets", headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_missing_summary_is_404(self, client, state):
+        state["assets"] = None
+
+        assert client.get("/portfolio-summary/assets").status_code == 404
+
+class TestHistory:
+    def test_streams_rows_in_history_schema(self, client, state):
+        response = client.get("/portfolio-summary/history", params={"days": 3})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        assert response.json() == [
+            PortfolioHistoryRow.model_validate(row).model_dump(mode="json") for row in state["rows"]
+        ]
+        assert state["sessions"][0].closed
+
+    def test_single_row(self, client, state):
+        state["rows"] = state["rows"][:1]
+
+        assert [row["id"] for row in client.get("/portfolio-summary/history").json()] == [0]
+
+    def test_empty_history_is_404_and_closes_session(self, client, state):
+        state["rows"] = []
+
+        response = client.get("/portfolio-summary/history")
+
+        assert response.status_code == 404
+        assert state["sessions"][0].closed
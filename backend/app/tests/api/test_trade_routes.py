@@ -0,0 +1,43 @@
+import pytest
+from datetime import datetime
+from app.api.v1.endpoints import trade_routes
+from app.services.trade_service import trade_service
+
+TRADE = {
+    "id": 7,
+    "symbol": "BTC/USDT",
+    "side": "BUY",
+    "quantity": 1.0,
+    "entry_price": 100.0,
+    "current_price": 101.0,
+    "status": "OPEN",
+    "created_at": datetime(2024, 1, 1),
+}
+
+@pytest.fixture
+def calls(monkeypatch):
+    calls = []
+
+    async def fake_get_trades(db, **kwargs):
+        calls.append(kwargs)
+        return [TRADE]
+
+    monkeypatch.setattr(trade_service, "get_trades", fake_get_trades)
+    return calls
+
+@pytest.fixture
+def client(calls, make_client):
+    return make_client(trade_routes.router, "/trades")
+
+class TestListTrades:
+    def test_filters_and_cursor_reach_the_service(self, client, calls):
+        response = client.get("/trades/", params={"symbol": "BTC/USDT", "status": "OPEN", "before_id": 42, "limit": 20})
+
+        assert response.status_code == 200
+        assert calls == [{"skip": 0, "limit": 20, "symbol": "BTC/USDT", "status": "OPEN", "before_id": 42}]
+
+    def test_response_is_trade_list(self, client):
+        body = client.get("/trades/").json()
+
+        assert [trade["id"] for trade in body] == [7]
+        assert body[0]["symbol"] == "BTC/USDT"
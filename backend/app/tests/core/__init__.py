@@ -0,0 +1,3 @@
+"""
+Test package for core application components.
+"""
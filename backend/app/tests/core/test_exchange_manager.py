@@ -0,0 +1,53 @@
+import pytest
+from app.core.exchange.exchange_manager import ExchangeManager
+
+CANDLES = [[1700000000000, 1.0, 2.0, 0.5, 1.5, 10.0]]
+
+class FakeExchange:
+    def __init__(self, markets, tickers):
+        self.markets = markets
+        self.tickers = tickers
+        self.ticker_calls = []
+
+    async def fetch_ticker(self, symbol):
+        self.ticker_calls.append(symbol)
+        if symbol not in self.tickers:
+            raise Exception(f"binance does not have market symbol {symbol}")
+        return self.tickers[symbol]
+
+    async def fetch_ohlcv(self, symbol, timeframe, limit=100):
+        return CANDLES
+
+def _manager(exchange) -> ExchangeManager:
+    manager = ExchangeManager()
+    manager.exchange = exchange
+    manager._initialized = True
+    return manager
+
+class TestFetchOhlcvIfValid:
+    @pytest.mark.asyncio
+    async def test_loaded_market_skips_ticker(self):
+        exchange = FakeExchange({"BTC/USDT": {"active": True}}, {})
+
+        assert await _manager(exchange).fetch_ohlcv_if_valid("BTC/USDT") == CANDLES
+        assert exchange.ticker_calls == []
+
+    @pytest.mark.asyncio
+    async def test_pair_missing_from_markets_falls_back_to_ticker(self):
+        exchange = FakeExchange({}, {"NEW/USDT": {"last": 1.0}})
+        manager = _manager(exchange)
+
+        assert await manager.fetch_ohlcv_if_valid("NEW/USDT") == CANDLES
+        assert await manager.fetch_ohlcv_if_valid("NEW/USDT") == CANDLES
+        assert exchange.ticker_calls == ["NEW/USDT"]
+
+    @pytest.mark.asyncio
+    async def test_unknown_pair_raises(self):
+        with pytest.raises(ValueError):
+            await _manager(FakeExchange({}, {})).fetch_ohlcv_if_valid("NOPE/USDT")
+
+    @pytest.mark.asyncio
+    async def test_get_ohlcv_uses_ticker_fallback(self):
+        exchange = FakeExchange({}, {"NEW/USDT": {"last": 1.0}})
+
+        assert await _manager(exchange).get_ohlcv("NEW/USDT", "1m", limit=1) == CANDLES
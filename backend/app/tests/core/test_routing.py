@@ -0,0 +1,54 @@
+import pytest
+from fastapi import APIRouter, FastAPI, HTTPException
+from fastapi.middleware.cors import CORSMiddleware
+from fastapi.testclient import TestClient
+from app.core.routing import ErrorLoggingRoute
+
+ORIGIN = "http://localhost:3000"
+
+@pytest.fixture
+def client():
+    router = APIRouter(route_class=ErrorLoggingRoute)
+
+    @router.get("/boom")
+    async def boom():
+        raise RuntimeError("database went away")
+
+    @router.get("/missing")
+    async def missing():
+        raise HTTPException(status_code=404, detail="Not found")
+
+    @router.get("/items/{item_id}")
+    async def item(item_id: int):
+        return {"id": item_id}
+
+    app = FastAPI()
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=[ORIGIN],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
+    app.include_router(router)
+    return TestClient(app, raise_server_exceptions=False)
+
+class TestErrorLoggingRoute:
+    def test_unexpected_error_is_500_with_cors_headers(self, client):
+        response = client.get("/boom", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 500
+        assert response.json() == {"detail": "database went away"}
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+
+    def test_http_exception_passes_through(self, client):
+        response = client.get("/missing", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 404
+        assert response.json() == {"detail": "Not found"}
+        assert response.headers["access-control-allow-origin"] == ORIGIN
+
+    def test_validation_error_stays_422(self, client):
+        response = client.get("/items/abc", headers={"Origin": ORIGIN})
+
+        assert response.status_code == 422
@@ -0,0 +1,66 @@
+import numpy as np
+import pandas as pd
+import pytest
+from app.core.kernels import breakout_kernel
+from app.services.helper import market_analyzer
+from app.services.helper.market_analyzer import (
+    BB_PERIOD, BB_STD, MACD_FAST, MACD_SIGNAL, MACD_SLOW, RSI_PERIOD, VOLUME_WINDOW, MarketAnalyzer
+)
+
+def _series(seed: int, n: int = 200) -> tuple:
+    rng = np.random.default_rng(seed)
+    prices = pd.Series(100 * np.exp(np.cumsum(rng.normal(scale=0.01, size=n))))
+    volume = pd.Series(rng.lognormal(mean=10, sigma=0.5, size=n))
+    return prices, volume
+
+def _numeric_conditions(conditions: dict) -> list:
+    return [
+        conditions["bb_squeeze"]["intensity"],
+        conditions["volume_spike"]["ratio"],
+        conditions["rsi_divergence"]["strength"],
+        conditions["current_rsi"],
+        conditions["current_price"],
+    ]
+
+def _flags(conditions: dict) -> list:
+    return [
+        conditions["bb_squeeze"]["active"],
+        conditions["volume_spike"]["active"],
+        conditions["rsi_divergence"]["active"],
+        conditions["macd_crossover"],
+    ]
+
+class TestBreakoutKernel:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_bands_match_pandas(self, seed):
+        prices, volume = _series(seed)
+
+        upper, middle, lower = breakout_kernel(
+            prices.to_numpy(), volume.to_numpy(),
+            BB_PERIOD, RSI_PERIOD, MACD_FAST, MACD_SLOW, MACD_SIGNAL, VOLUME_WINDOW, float(BB_STD)
+        )[:3]
+
+        upper_bb, middle_bb, lower_bb = MarketAnalyzer.calculate_bollinger_bands(prices)
+        np.testing.assert_allclose(
+            [upper, middle, lower], [upper_bb.iloc[-1], middle_bb.iloc[-1], lower_bb.iloc[-1]], rtol=1e-9
+        )
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("seed", range(20))
+    async def test_analysis_matches_pandas_path(self, seed, monkeypatch):
+        prices, volume = _series(seed, n=60 + 12 * seed)
+
+        kernel = await MarketAnalyzer.analyze_breakout("BTC/USDT", prices, volume)
+        monkeypatch.setattr(market_analyzer, "NUMBA_AVAILABLE", False)
+        fallback = await MarketAnalyzer.analyze_breakout("BTC/USDT", prices, volume)
+
+        assert kernel["has_signal"] == fallback["has_signal"]
+        np.testing.assert_allclose(
+            _numeric_conditions(kernel["market_conditions"]),
+            _numeric_conditions(fallback["market_conditions"]),
+            rtol=1e-7, atol=1e-9
+        )
+        assert _flags(kernel["market_conditions"]) == _flags(fallback["market_conditions"])
+        if kernel["has_signal"]:
+            assert kernel["signal"].direction == fallback["signal"].direction
+            np.testing.assert_allclose(kernel["signal"].confidence, fallback["signal"].confidence, rtol=1e-7)
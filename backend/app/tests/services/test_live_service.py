@@ -0,0 +1,38 @@
+import pytest
+from app.core import cache
+from app.services.live_service import live_service
+
+PRICES = {
+    "BTCUSDT": {"price": 60000.0, "volume_24h": 1000.0},
+    "ETHUSDT": {"price": 3000.0, "volume_24h": 500.0},
+}
+
+@pytest.fixture
+def store(monkeypatch):
+    """In-memory stand-in for Redis plus a count of upstream fetches"""
+    store = {"data": {}, "fetches": 0}
+
+    async def fake_get(key):
+        return store["data"].get(key)
+
+    async def fake_set(key, value, ttl, jitter=0.0):
+        store["data"][key] = value
+
+    async def fake_prices(symbols):
+        store["fetches"] += 1
+        return {symbol: PRICES[symbol] for symbol in symbols}
+
+    monkeypatch.setattr(cache, "cache_get", fake_get)
+    monkeypatch.setattr(cache, "cache_set", fake_set)
+    monkeypatch.setattr(live_service.binance, "get_multiple_enhanced_prices", fake_prices)
+    return store
+
+class TestLiveTokensCache:
+    @pytest.mark.asyncio
+    async def test_symbol_order_and_duplicates_share_one_entry(self, store):
+        first = await live_service.get_live_tokens(["ETHUSDT", "BTCUSDT"])
+        second = await live_service.get_live_tokens(["BTCUSDT", "ETHUSDT", "BTCUSDT"])
+
+        assert list(store["data"]) == ["live:tokens:BTCUSDT,ETHUSDT"]
+        assert store["fetches"] == 1
+        assert [t["symbol"] for t in first] == [t["symbol"] for t in second] == ["BTC", "ETH"]
@@ -0,0 +1,87 @@
+import numpy as np
+import pytest
+from app.core.kernels import entry_levels_kernel
+from app.services import straddle_service
+from app.services.straddle_service import StraddleStrategy
+
+WINDOWS = (None, 10, 25, 50)
+
+def _prices(seed: int, n: int = 120) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return 100 * np.exp(np.cumsum(rng.normal(scale=0.01, size=n)))
+
+def _reference_entry_levels(short_vol: float, medium_vol: float, long_vol: float) -> tuple:
+    """Entry level math as it was written before the kernel"""
+    volatilities = [short_vol, medium_vol, long_vol]
+    avg_vol = sum(volatilities) / len(volatilities)
+    base_vol = min(volatilities) if all(v > 0 for v in volatilities) else avg_vol
+
+    if avg_vol > 0.05:
+        scale_factor, min_pct, max_pct = 0.8, 0.002, 0.015
+    elif avg_vol > 0.02:
+        scale_factor, min_pct, max_pct = 1.0, 0.003, 0.02
+    else:
+        scale_factor, min_pct, max_pct = 1.2, 0.005, 0.03
+
+    base_pct = max(base_vol * scale_factor, min_pct)
+    short_pct = max(min(base_pct, max_pct), min_pct)
+    medium_pct = max(min(base_pct * 2, max_pct * 1.5), min_pct * 1.5)
+    long_pct = max(min(base_pct * 3, max_pct * 2), min_pct * 2)
+
+    short_sell = max(min(short_pct * 3, max_pct * 1.2), min_pct)
+    medium_sell = max(min(medium_pct * 3, max_pct * 1.8), min_pct * 1.5)
+    long_sell = max(min(long_pct * 3, max_pct * 2.4), min_pct * 2)
+
+    return (avg_vol, base_vol, scale_factor, min_pct, max_pct,
+            short_pct, short_sell, medium_pct, medium_sell, long_pct, long_sell)
+
+@pytest.fixture
+def strategy():
+    return StraddleStrategy()
+
+class TestVolatilities:
+    @pytest.mark.parametrize("seed", range(10))
+    def test_kernel_matches_std_of_log_returns(self, strategy, seed):
+        prices = _prices(seed)
+
+        volatilities = strategy.calculate_volatilities(prices, WINDOWS)
+
+        expected = [
+            np.std(np.diff(np.log(prices if window is None else prices[-window:])))
+            for window in WINDOWS
+        ]
+        np.testing.assert_allclose(volatilities, expected, rtol=1e-9)
+
+    @pytest.mark.parametrize("seed", range(10))
+    def test_kernel_matches_numpy_fallback(self, strategy, seed, monkeypatch):
+        prices = _prices(seed)
+
+        kernel = strategy.calculate_volatilities(prices, WINDOWS)
+        monkeypatch.setattr(straddle_service, "NUMBA_AVAILABLE", False)
+        fallback = strategy.calculate_volatilities(prices, WINDOWS)
+
+        np.testing.assert_allclose(kernel, fallback, rtol=1e-9)
+
+    def test_window_longer_than_series(self, strategy):
+        prices = _prices(0, n=8)
+
+        np.testing.assert_allclose(
+            strategy.calculate_volatilities(prices, (50,)),
+            [strategy.calculate_volatility(prices)],
+            rtol=1e-9
+        )
+
+class TestEntryLevels:
+    @pytest.mark.parametrize("seed", range(20))
+    def test_kernel_matches_reference(self, seed):
+        rng = np.random.default_rng(seed)
+        # Spread volatilities across the low/medium/high regimes, with occasional zeros
+        vols = rng.uniform(0.0, 0.1, size=3) * (rng.random(3) > 0.1)
+
+        np.testing.assert_allclose(entry_levels_kernel(*vols), _reference_entry_levels(*vols), rtol=1e-12)
+
+    def test_buy_above_and_sell_below_price(self, strategy):
+        entries = strategy.calculate_entry_levels_dynamic(100.0, 0.01, 0.03, 0.08)
+
+        for timeframe in ("short", "medium", "long"):
+            assert entries[timeframe]["buy"] > 100.0 > entries[timeframe]["sell"]
@@ -0,0 +1,65 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import create_engine
+from sqlalchemy.orm import Session
+from app.models.position import Position
+from app.models.trade import Trade
+from app.services.trade_service import trade_service
+
+class SyncSessionAdapter:
+    """Runs the service's awaited queries on a synchronous SQLite session"""
+
+    def __init__(self, session: Session):
+        self.session = session
+
+    async def execute(self, stmt):
+        return self.session.execute(stmt)
+
+@pytest.fixture
+def db():
+    engine = create_engine("sqlite://")
+    Position.__table__.create(engine)
+    Trade.__table__.create(engine)
+    with Session(engine) as session:
+        start = datetime(2024, 1, 1)
+        for i in range(10):
+            session.add(Trade(
+                symbol="BTC/USDT" if i % 2 else "ETH/USDT",
+                side="BUY",
+                quantity=1.0,
+                entry_price=100.0,
+                current_price=100.0,
+                status="OPEN" if i < 5 else "CLOSED",
+                # Pairs of trades share a timestamp so the id tie-break is exercised
+                created_at=start + timedelta(minutes=i // 2),
+            ))
+        session.commit()
+        yield SyncSessionAdapter(session)
+
+class TestGetTrades:
+    @pytest.mark.asyncio
+    async def test_newest_first_with_id_tie_break(self, db):
+        trades = await trade_service.get_trades(db, limit=100)
+
+        assert [t.id for t in trades] == list(range(10, 0, -1))
+
+    @pytest.mark.asyncio
+    async def test_keyset_pages_cover_every_trade_once(self, db):
+        seen, before_id = [], None
+        while True:
+            page = await trade_service.get_trades(db, limit=3, before_id=before_id)
+            if not page:
+                break
+            seen.extend(t.id for t in page)
+            before_id = page[-1].id
+
+        assert seen == list(range(10, 0, -1))
+
+    @pytest.mark.asyncio
+    async def test_keyset_matches_offset_with_filters(self, db):
+        first = await trade_service.get_trades(db, limit=2, symbol="BTC/USDT")
+        by_cursor = await trade_service.get_trades(db, limit=2, symbol="BTC/USDT", before_id=first[-1].id)
+        by_offset = await trade_service.get_trades(db, skip=2, limit=2, symbol="BTC/USDT")
+
+        assert [t.id for t in by_cursor] == [t.id for t in by_offset]
+        assert all(t.symbol == "BTC/USDT" for t in by_cursor)
@@ -1,9 +1,18 @@
 import uvicorn
 
+# uvloop is optional (not available on Windows); fall back to the stock asyncio loop
+try:
+    import uvloop
+    uvloop.install()
+    EVENT_LOOP = "uvloop"
+except ImportError:
+    EVENT_LOOP = "asyncio"
+
 if __name__ == "__main__":
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8000,
-        reload=True
+        reload=True,
+        loop=EVENT_LOOP  # Also applies to the reload worker process
     )